@@ -7,40 +7,73 @@ from uploaded configuration files.
 
 import os
 import sys
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Dict, Any
+from typing import BinaryIO, Callable, Dict, Any, List, Tuple
 import tempfile
 import shutil
-
-# Load environment variables from .env file
+import hashlib
+import csv
+import re
+import io
+import itertools
+from collections import OrderedDict
+from functools import lru_cache
+
+# Load environment variables from .env file once; reload/worker processes
+# inherit the parsed values through the environment
 from dotenv import load_dotenv
-project_root = Path(__file__).parent.parent.parent
-load_dotenv(project_root / ".env")
+project_root = Path(__file__).resolve().parents[2]
+if not os.environ.get("INSIGHT_ENGINE_DOTENV_LOADED"):
+    load_dotenv(project_root / ".env")
+    os.environ["INSIGHT_ENGINE_DOTENV_LOADED"] = "1"
 
-from fastapi import FastAPI, File, UploadFile, HTTPException
+from fastapi import FastAPI, File, UploadFile, HTTPException, Request, Depends
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import JSONResponse, RedirectResponse, FileResponse
+from fastapi.responses import JSONResponse, RedirectResponse, FileResponse, ORJSONResponse
+import orjson
 from pydantic import BaseModel
 from typing import Optional
 
 # Add backend directory to path for imports
-backend_dir = Path(__file__).parent.parent
+backend_dir = project_root / "backend"
 sys.path.insert(0, str(backend_dir))
 
 from core.config import load_config_from_string, get_app_settings, InsightConfig
-from core.logger import setup_logger, get_api_logger
+from core.logger import setup_logger, get_api_logger, ROOT_LOGGER_NAME
 from engine.ingest import ingest_data
 from engine.metrics import process_metrics
 from engine.insights import generate_insights
-from engine.narrative import generate_narrative
+from engine.narrative import close_narrative_clients, generate_narrative_async, set_narrative_cache_dir
 from engine.report_pptx import generate_report
-from engine.session_manager import get_session_manager, DashboardSession
+from engine.session_manager import get_session_manager, SessionManager, DashboardSession
 from engine.voice_briefing import generate_voice_briefing
-from engine.qrcode_gen import generate_qr_for_dashboard
+from engine.qrcode_gen import generate_qr_for_dashboard, generate_qr_for_dashboard_async
 
-# Initialize logger
+# Initialize logger (root handler is configured at startup)
 logger = get_api_logger()
-setup_logger("insight_engine", level="INFO")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan hook.
+    
+    Sizes the default executor used by asyncio.to_thread so blocking
+    pipeline stages don't starve each other under concurrent uploads,
+    and creates the shared session manager used by all handlers. Cached
+    LLM clients are closed on shutdown.
+    """
+    setup_logger(ROOT_LOGGER_NAME, level=settings.log_level)
+    executor = ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2)
+    asyncio.get_running_loop().set_default_executor(executor)
+    app.state.session_manager = get_session_manager(str(sessions_dir))
+    yield
+    await close_narrative_clients()
+    executor.shutdown(wait=False)
+
 
 # Create FastAPI app
 app = FastAPI(
@@ -48,27 +81,37 @@ app = FastAPI(
     description="Generate insightful reports from your data with AI-powered analysis",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Get application settings
 settings = get_app_settings()
 
-# Get project root directory (parent of backend)
-project_root = Path(__file__).parent.parent.parent
-
 # Set absolute paths for reports and tmp directories
 reports_dir = project_root / "static" / "reports"
 audio_dir = project_root / "static" / "audio"
 tmp_dir = project_root / "tmp"
 sessions_dir = tmp_dir / "sessions"
 
-# Ensure directories exist
+# Ensure directories exist (once, at startup - handlers rely on them)
 reports_dir.mkdir(parents=True, exist_ok=True)
 audio_dir.mkdir(parents=True, exist_ok=True)
 tmp_dir.mkdir(parents=True, exist_ok=True)
 sessions_dir.mkdir(parents=True, exist_ok=True)
 
+# Persist LLM narratives so regenerated reports skip the LLM call
+set_narrative_cache_dir(tmp_dir / "narrative_cache")
+
+# String forms passed to engine functions on every request
+reports_dir_str = str(reports_dir)
+audio_dir_str = str(audio_dir)
+
+# Media types for file downloads
+PPTX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+AUDIO_MEDIA_TYPE = "audio/mpeg"
+
 # Mount static files for report downloads
 static_dir = project_root / "static"
 static_dir.mkdir(parents=True, exist_ok=True)
@@ -81,6 +124,33 @@ app.mount("/tmp", StaticFiles(directory=str(tmp_dir)), name="tmp")
 frontend_dir = project_root / "frontend"
 app.mount("/frontend", StaticFiles(directory=str(frontend_dir), html=True), name="frontend")
 
+# Upload handling: stream in 1 MB chunks, sniff CSV headers from the first
+# lines, reading at most CSV_SAMPLE_SIZE bytes however long those lines are
+UPLOAD_CHUNK_SIZE = 1 << 20
+CSV_SAMPLE_LINES = 20
+CSV_SAMPLE_SIZE = 64 * 1024
+
+# LRU cache of Gemini column analyses keyed by CSV header+sample signature.
+# Only the model output is cached; the suggested date range is per-call.
+COLUMN_ANALYSIS_CACHE_SIZE = 512
+_column_analysis_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+# Delimiters considered when sniffing uploaded CSVs. csv.Sniffer is regex
+# based and can backtrack badly on pathological input, so it only sees a
+# bounded sample and gets a time limit.
+CSV_DELIMITERS = ",;\t|"
+CSV_SNIFF_SIZE = 8192
+CSV_SNIFF_TIMEOUT = 2.0
+
+# Strips a leading ```json / ``` fence and a trailing ``` from LLM output
+MARKDOWN_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$")
+
+# Shared Gemini model for column analysis, created on first use
+_gemini_model = None
+
+# Resolved data base paths keyed by (relative primary path, tmp dir)
+_base_path_cache: Dict[tuple, str] = {}
+
 
 class ReportResponse(BaseModel):
     """Response model for report generation."""
@@ -147,11 +217,181 @@ def save_uploaded_file(upload_file: UploadFile, dest_dir: str) -> str:
     file_path = dest_path / upload_file.filename
     
     with open(file_path, "wb") as buffer:
-        shutil.copyfileobj(upload_file.file, buffer)
+        shutil.copyfileobj(upload_file.file, buffer, length=UPLOAD_CHUNK_SIZE)
     
     return str(file_path)
 
 
+def _copy_upload(src: BinaryIO, file_path: Path) -> None:
+    """Copy an upload's spooled file to disk in UPLOAD_CHUNK_SIZE pieces."""
+    with open(file_path, "wb") as buffer:
+        shutil.copyfileobj(src, buffer, length=UPLOAD_CHUNK_SIZE)
+
+
+async def stream_upload_to_file(upload_file: UploadFile, file_path: Path) -> Path:
+    """
+    Stream an uploaded file to disk chunk by chunk.
+    
+    Avoids holding the whole upload in memory for large CSVs. The copy runs
+    in a worker thread so the disk writes don't block the event loop.
+    
+    Args:
+        upload_file: The uploaded file
+        file_path: Destination file path
+        
+    Returns:
+        Path to the saved file
+    """
+    await asyncio.to_thread(_copy_upload, upload_file.file, file_path)
+    return file_path
+
+
+def read_csv_sample_lines(file: BinaryIO) -> List[bytes]:
+    """
+    Read up to CSV_SAMPLE_LINES lines from the start of an upload.
+    
+    At most CSV_SAMPLE_SIZE bytes are read in total, so a huge first line
+    or a file without newlines can't pull the whole upload into memory. A
+    trailing line cut off by the byte budget is dropped unless it is the
+    only line.
+    
+    Args:
+        file: Binary file object positioned at the start of the upload
+        
+    Returns:
+        Raw lines including their line endings
+    """
+    lines = []
+    consumed = 0
+    while len(lines) < CSV_SAMPLE_LINES and consumed < CSV_SAMPLE_SIZE:
+        raw = file.readline(CSV_SAMPLE_SIZE - consumed)
+        if not raw:
+            break
+        consumed += len(raw)
+        lines.append(raw)
+    
+    if consumed >= CSV_SAMPLE_SIZE and len(lines) > 1 and not lines[-1].endswith(b"\n"):
+        lines.pop()
+    return lines
+
+
+def get_shared_session_manager(request: Request) -> SessionManager:
+    """
+    Dependency providing the session manager created at startup.
+    
+    Args:
+        request: The incoming request
+        
+    Returns:
+        The shared SessionManager
+    """
+    return request.app.state.session_manager
+
+
+def audio_ready_updater(session_manager: SessionManager, session: DashboardSession) -> Callable[[str], None]:
+    """
+    Build the callback that stores a session's Murf audio URL once it lands.
+    
+    The callback runs on a Murf worker thread; SessionManager guards its
+    cache and writes session files atomically, so it is safe to call
+    alongside request handlers using the same manager.
+    
+    Args:
+        session_manager: The shared SessionManager
+        session: Session the briefing audio belongs to
+        
+    Returns:
+        Callback taking the audio URL
+    """
+    def on_audio_ready(audio_url: str) -> None:
+        session.audio_url = audio_url
+        session_manager.update_session(session)
+    
+    return on_audio_ready
+
+
+@lru_cache(maxsize=1024)
+def get_dashboard_qr(base_url: str, session_id: str, token: str) -> Tuple[bytes, str]:
+    """
+    Get the dashboard QR code for a session, encoding it only once.
+    
+    A session's ID and token never change, so neither does its QR PNG.
+    
+    Args:
+        base_url: The base URL of the application
+        session_id: Unique session identifier
+        token: Access token for authentication
+        
+    Returns:
+        Tuple of (QR code bytes, full dashboard URL)
+    """
+    return generate_qr_for_dashboard(base_url=base_url, session_id=session_id, token=token)
+
+
+def get_gemini_model():
+    """
+    Get the shared Gemini model used for CSV column analysis.
+    
+    The client is configured once and reused across requests.
+    
+    Returns:
+        google.generativeai.GenerativeModel instance
+        
+    Raises:
+        ImportError: If the Gemini SDK is not installed
+    """
+    global _gemini_model
+    if _gemini_model is None:
+        # Imported on first use - the SDK pulls in grpc/protobuf
+        import google.generativeai as genai
+        genai.configure(api_key=settings.gemini_api_key)
+        _gemini_model = genai.GenerativeModel('gemini-2.0-flash')
+    return _gemini_model
+
+
+async def detect_csv_delimiter(sample: str, lines: List[str]) -> str:
+    """
+    Detect the delimiter of a CSV sample.
+    
+    Candidates are ranked by whether they occur the same non-zero number
+    of times on every sampled line, then by total occurrences. A
+    consistent winner is returned straight away; otherwise csv.Sniffer
+    gets a chance (off the event loop, with a timeout) before falling
+    back to the most frequent candidate.
+    
+    Args:
+        sample: Leading text of the CSV file
+        lines: First lines of the CSV file
+        
+    Returns:
+        Detected delimiter character
+    """
+    check_lines = lines[:50]
+    scores = {}
+    for candidate in CSV_DELIMITERS:
+        counts = [line.count(candidate) for line in check_lines]
+        consistent = bool(counts) and counts[0] > 0 and all(c == counts[0] for c in counts)
+        scores[candidate] = (consistent, sum(counts))
+    
+    # Ties keep CSV_DELIMITERS order, so ',' wins by default
+    best_delimiter = max(CSV_DELIMITERS, key=scores.__getitem__)
+    if scores[best_delimiter][0]:
+        return best_delimiter
+    
+    try:
+        dialect = await asyncio.wait_for(
+            asyncio.to_thread(csv.Sniffer().sniff, sample[:CSV_SNIFF_SIZE], CSV_DELIMITERS),
+            timeout=CSV_SNIFF_TIMEOUT
+        )
+        return dialect.delimiter
+    except asyncio.TimeoutError:
+        logger.warning("CSV sniffing timed out, using occurrence counts")
+    except csv.Error:
+        pass
+    
+    return best_delimiter if scores[best_delimiter][1] else ','
+
+
 def get_base_path_from_config(config: InsightConfig, tmp_dir: str) -> str:
     """
     Determine the base path for data files.
@@ -168,20 +408,29 @@ def get_base_path_from_config(config: InsightConfig, tmp_dir: str) -> str:
     """
     # Check if data files use relative paths
     primary_source = config.dataset.sources[config.dataset.primary_source]
+    primary_path = primary_source.path
     
-    if Path(primary_source.path).is_absolute():
+    if not primary_path or Path(primary_path).is_absolute():
         return ""
     
+    # Reuse a previous lookup for the same relative path
+    cache_key = (primary_path, tmp_dir)
+    cached = _base_path_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
     # For relative paths, check common locations
     possible_bases = [
         Path.cwd(),  # Current working directory
-        Path(__file__).parent.parent.parent,  # Project root
+        project_root,  # Project root
         Path(tmp_dir).parent,  # Parent of tmp
     ]
     
     for base in possible_bases:
-        test_path = base / primary_source.path
+        test_path = base / primary_path
         if test_path.exists():
+            # Only successful lookups are cached, so files added later are still found
+            _base_path_cache[cache_key] = str(base)
             return str(base)
     
     # Default to current working directory
@@ -197,42 +446,50 @@ async def analyze_csv_endpoint(
     
     Returns recommended date column, dimensions, and metrics.
     """
-    import json
-    import google.generativeai as genai
-    
     logger.info(f"Analyzing CSV: {csv_file.filename}")
     
     try:
-        # Read CSV content
-        content = await csv_file.read()
-        text = content.decode('utf-8')
-        
-        # Parse to get columns and sample data
-        lines = text.strip().split('\n')
+        # Read only the leading lines - enough for headers, sample rows
+        # and delimiter sniffing - without decoding the whole upload
+        raw_lines = await asyncio.to_thread(read_csv_sample_lines, csv_file.file)
+        lines = [
+            line for line in (raw.decode('utf-8', errors='ignore').rstrip('\r\n') for raw in raw_lines)
+            if line.strip()
+        ]
+        if not lines:
+            raise ValueError("CSV file is empty")
+        text = "\n".join(lines)
         
         # Detect delimiter
-        first_line = lines[0]
-        delimiter = ','
-        if first_line.count(';') > first_line.count(','):
-            delimiter = ';'
-        elif first_line.count('\t') > first_line.count(','):
-            delimiter = '\t'
-        
-        # Get headers and sample rows
-        headers = [h.strip().strip('"\'') for h in first_line.split(delimiter)]
-        sample_rows = []
-        for line in lines[1:6]:  # Get up to 5 sample rows
-            row = [v.strip().strip('"\'') for v in line.split(delimiter)]
-            if len(row) == len(headers):
-                sample_rows.append(dict(zip(headers, row)))
-        
-        # Build prompt for Gemini
-        prompt = f"""Analyze this CSV data and identify the column types for a business analytics report.
+        delimiter = await detect_csv_delimiter(text, lines)
+        
+        # Get headers and sample rows. Reading records (not lines) from the
+        # whole sample keeps quoted fields with delimiters or newlines intact.
+        reader = csv.reader(io.StringIO(text), delimiter=delimiter, quotechar='"')
+        headers = [h.strip() for h in next(reader, [])]
+        sample_rows = [
+            dict(zip(headers, (v.strip() for v in row)))
+            for row in itertools.islice(reader, 5)  # Up to 5 sample rows
+            if len(row) == len(headers)
+        ]
+        
+        # Reuse a previous analysis for an identical header+sample signature
+        signature = hashlib.blake2b(
+            orjson.dumps([headers, sample_rows]),
+            digest_size=16
+        ).hexdigest()
+        result = _column_analysis_cache.get(signature)
+        if result is not None:
+            _column_analysis_cache.move_to_end(signature)
+            logger.info(f"Using cached column analysis: {signature}")
+        else:
+            # Build prompt for Gemini
+            prompt = f"""Analyze this CSV data and identify the column types for a business analytics report.
 
 COLUMNS: {headers}
 
 SAMPLE DATA (first 5 rows):
-{json.dumps(sample_rows, indent=2)}
+{orjson.dumps(sample_rows, option=orjson.OPT_INDENT_2).decode()}
 
 Based on the column names and sample data, classify each column:
 
@@ -251,22 +508,18 @@ IMPORTANT:
 Respond ONLY with this exact JSON format (no markdown, no explanation):
 {{"date_column": "column_name", "dimensions": ["col1", "col2"], "metrics": ["col3", "col4"], "analysis_notes": "Brief explanation of your choices"}}
 """
-        
-        # Call Gemini
-        genai.configure(api_key=settings.gemini_api_key)
-        model = genai.GenerativeModel('gemini-2.0-flash')
-        response = model.generate_content(prompt)
-        
-        # Parse response
-        response_text = response.text.strip()
-        # Clean up markdown if present
-        if response_text.startswith('```'):
-            response_text = response_text.split('```')[1]
-            if response_text.startswith('json'):
-                response_text = response_text[4:]
-        response_text = response_text.strip()
-        
-        result = json.loads(response_text)
+            
+            # Call Gemini
+            model = get_gemini_model()
+            response = await asyncio.to_thread(model.generate_content, prompt)
+            
+            # Parse response, cleaning up markdown fences if present
+            response_text = MARKDOWN_FENCE_RE.sub("", response.text)
+            
+            result = orjson.loads(response_text)
+            _column_analysis_cache[signature] = result
+            if len(_column_analysis_cache) > COLUMN_ANALYSIS_CACHE_SIZE:
+                _column_analysis_cache.popitem(last=False)
         
         # Calculate suggested date range (last 14 days split into two 7-day periods)
         from datetime import datetime, timedelta
@@ -286,7 +539,7 @@ Respond ONLY with this exact JSON format (no markdown, no explanation):
             analysis_notes=result.get("analysis_notes", "")
         )
         
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         logger.error(f"Failed to parse Gemini response: {e}")
         raise HTTPException(status_code=500, detail=f"AI analysis failed to return valid JSON: {str(e)}")
     except Exception as e:
@@ -297,7 +550,8 @@ Respond ONLY with this exact JSON format (no markdown, no explanation):
 @app.post("/generate-report", response_model=ReportResponse, tags=["Reports"])
 async def generate_report_endpoint(
     config_file: UploadFile = File(..., description="YAML configuration file"),
-    csv_file: UploadFile = File(None, description="Optional CSV data file for direct upload")
+    csv_file: UploadFile = File(None, description="Optional CSV data file for direct upload"),
+    session_manager: SessionManager = Depends(get_shared_session_manager)
 ) -> ReportResponse:
     """
     Generate an insight report from uploaded configuration.
@@ -325,8 +579,7 @@ async def generate_report_endpoint(
     if csv_file:
         logger.info(f"CSV file uploaded: {csv_file.filename}")
     
-    temp_config_path = None
-    temp_csv_path = None
+    upload_dir = None
     
     try:
         # Read config content
@@ -344,16 +597,12 @@ async def generate_report_endpoint(
                 detail=f"Invalid configuration: {str(e)}"
             )
         
-        # Save config temporarily for reference
-        temp_config_path = tmp_dir / config_file.filename
-        temp_config_path.write_text(config_str)
-        
         # Handle uploaded CSV file
         if csv_file:
-            csv_content = await csv_file.read()
-            temp_csv_path = tmp_dir / "uploaded.csv"
-            temp_csv_path.write_bytes(csv_content)
-            base_path = str(tmp_dir)
+            # Per-request directory so concurrent uploads don't overwrite each other
+            upload_dir = Path(tempfile.mkdtemp(dir=tmp_dir, prefix="upload_"))
+            temp_csv_path = await stream_upload_to_file(csv_file, upload_dir / "uploaded.csv")
+            base_path = str(upload_dir)
             logger.info(f"Saved uploaded CSV to: {temp_csv_path}")
         else:
             # Determine base path for data files
@@ -364,7 +613,7 @@ async def generate_report_endpoint(
         # Step 1: Ingest data
         try:
             logger.info("Step 1: Ingesting data sources")
-            df = ingest_data(config, base_path)
+            df = await asyncio.to_thread(ingest_data, config, base_path)
         except FileNotFoundError as e:
             logger.error(f"Data file not found: {e}")
             raise HTTPException(
@@ -381,7 +630,7 @@ async def generate_report_endpoint(
         # Step 2: Process metrics
         try:
             logger.info("Step 2: Processing metrics and splitting periods")
-            current_df, previous_df = process_metrics(df, config)
+            period_df = await asyncio.to_thread(process_metrics, df, config)
         except Exception as e:
             logger.error(f"Metrics processing failed: {e}")
             raise HTTPException(
@@ -392,7 +641,7 @@ async def generate_report_endpoint(
         # Step 3: Generate insights
         try:
             logger.info("Step 3: Generating insights")
-            insights_data = generate_insights(current_df, previous_df, config)
+            insights_data = await asyncio.to_thread(generate_insights, period_df, config)
         except Exception as e:
             logger.error(f"Insight generation failed: {e}")
             raise HTTPException(
@@ -403,7 +652,7 @@ async def generate_report_endpoint(
         # Step 4: Generate narrative
         try:
             logger.info("Step 4: Generating narrative from LLM")
-            narrative = generate_narrative(
+            narrative = await generate_narrative_async(
                 insights_data,
                 api_key=settings.gemini_api_key or settings.openai_api_key,
                 model=settings.llm_model,
@@ -423,9 +672,6 @@ async def generate_report_endpoint(
         voice_result = None
         try:
             logger.info("Step 5: Creating dashboard session")
-            sessions_path = str(project_root / "tmp" / "sessions")
-            logger.info(f"Sessions path: {sessions_path}")
-            session_manager = get_session_manager(sessions_path)
             
             # Prepare narrative dict for session - map NarrativeSection fields correctly
             narrative_dict = {
@@ -444,32 +690,31 @@ async def generate_report_endpoint(
             )
             logger.info(f"Session created: {session.session_id}")
             
-            # Generate voice briefing
-            audio_dir = project_root / "static" / "audio"
-            audio_dir.mkdir(parents=True, exist_ok=True)
-            
-            voice_result = generate_voice_briefing(
+            # Generate voice briefing and QR code concurrently - neither
+            # depends on the other's output
+            base_url = "http://localhost:8000"
+            voice_task = asyncio.to_thread(
+                generate_voice_briefing,
                 narrative=narrative_dict,
                 insights=insights_data.get("insights", []),
-                output_dir=str(audio_dir),
+                output_dir=audio_dir_str,
                 session_id=session.session_id,
-                murf_api_key=os.getenv("MURF_API_KEY")
+                murf_api_key=os.getenv("MURF_API_KEY"),
+                on_audio_ready=audio_ready_updater(session_manager, session)
             )
-            logger.info(f"Voice result: {voice_result}")
-            
-            if voice_result.get("audio_url"):
-                session.audio_url = voice_result["audio_url"]
-                session_manager.update_session(session)
-            
-            # Generate QR code
-            base_url = "http://localhost:8000"
-            qr_bytes, dashboard_url = generate_qr_for_dashboard(
+            qr_task = generate_qr_for_dashboard_async(
                 base_url=base_url,
                 session_id=session.session_id,
                 token=session.token,
                 output_path=str(project_root / "tmp" / f"qr_{session.session_id}.png")
             )
+            voice_result, (qr_bytes, dashboard_url) = await asyncio.gather(voice_task, qr_task)
             qr_path = str(project_root / "tmp" / f"qr_{session.session_id}.png")
+            logger.info(f"Voice result: {voice_result}")
+            
+            if voice_result.get("audio_url"):
+                session.audio_url = voice_result["audio_url"]
+                session_manager.update_session(session)
             
             logger.info(f"Dashboard URL created: {dashboard_url}")
             
@@ -481,10 +726,11 @@ async def generate_report_endpoint(
         # Step 6: Generate PPTX report with QR code
         try:
             logger.info("Step 6: Building PowerPoint report")
-            report_path = generate_report(
+            report_path = await asyncio.to_thread(
+                generate_report,
                 narrative,
                 insights_data,
-                output_dir=str(reports_dir),
+                output_dir=reports_dir_str,
                 dashboard_url=dashboard_url,
                 qr_code_path=qr_path
             )
@@ -497,7 +743,7 @@ async def generate_report_endpoint(
         
         # Build download URL
         report_filename = Path(report_path).name
-        download_url = f"/static/reports/{report_filename}"
+        download_url = f"/download/{report_filename}"
         
         logger.info(f"Report generated successfully: {download_url}")
         
@@ -536,16 +782,47 @@ async def generate_report_endpoint(
     
     finally:
         # Cleanup temporary files
-        if temp_config_path and temp_config_path.exists():
-            try:
-                temp_config_path.unlink()
-            except:
-                pass
-        if temp_csv_path and temp_csv_path.exists():
-            try:
-                temp_csv_path.unlink()
-            except:
-                pass
+        if upload_dir is not None:
+            shutil.rmtree(upload_dir, ignore_errors=True)
+
+
+@app.get("/download/{filename}", tags=["Reports"])
+async def download_report(filename: str):
+    """
+    Download a generated PPTX report.
+    
+    The file is streamed from disk by FileResponse rather than
+    buffered in memory.
+    
+    Args:
+        filename: Report file name
+        
+    Returns:
+        FileResponse with the report as an attachment
+    """
+    report_path = reports_dir / Path(filename).name
+    if not report_path.is_file():
+        raise HTTPException(status_code=404, detail="Report not found")
+    
+    return FileResponse(str(report_path), media_type=PPTX_MEDIA_TYPE, filename=report_path.name)
+
+
+@app.get("/audio/{filename}", tags=["Dashboard"])
+async def download_audio(filename: str):
+    """
+    Stream a generated voice briefing.
+    
+    Args:
+        filename: Audio file name
+        
+    Returns:
+        FileResponse with the MP3 audio
+    """
+    audio_path = audio_dir / Path(filename).name
+    if not audio_path.is_file():
+        raise HTTPException(status_code=404, detail="Audio not found")
+    
+    return FileResponse(str(audio_path), media_type=AUDIO_MEDIA_TYPE)
 
 
 # ============================================
@@ -569,12 +846,10 @@ async def create_dashboard_session(
     title: str,
     insights: list,
     metrics_summary: dict,
-    narrative: dict
+    narrative: dict,
+    session_manager: SessionManager = Depends(get_shared_session_manager)
 ) -> Dict[str, Any]:
     """Create a new dashboard session programmatically."""
-    sessions_path = str(project_root / "tmp" / "sessions")
-    session_manager = get_session_manager(sessions_path)
-    
     session = session_manager.create_session(
         title=title,
         insights=insights,
@@ -583,28 +858,30 @@ async def create_dashboard_session(
     )
     
     # Generate voice briefing
-    audio_dir = project_root / "static" / "audio"
-    audio_dir.mkdir(parents=True, exist_ok=True)
-    
-    voice_result = generate_voice_briefing(
+    voice_task = asyncio.to_thread(
+        generate_voice_briefing,
         narrative=narrative,
         insights=insights,
-        output_dir=str(audio_dir),
+        output_dir=audio_dir_str,
         session_id=session.session_id,
-        murf_api_key=os.getenv("MURF_API_KEY")
+        murf_api_key=os.getenv("MURF_API_KEY"),
+        on_audio_ready=audio_ready_updater(session_manager, session)
     )
     
-    # Generate QR code
+    # Generate QR code alongside the voice briefing
     base_url = "http://localhost:8000"  # Could be configured
-    qr_bytes, dashboard_url = generate_qr_for_dashboard(
+    qr_task = generate_qr_for_dashboard_async(
         base_url=base_url,
         session_id=session.session_id,
         token=session.token,
         output_path=str(tmp_dir / f"qr_{session.session_id}.png")
     )
+    voice_result, (qr_bytes, dashboard_url) = await asyncio.gather(voice_task, qr_task)
     
-    # Update session with audio and QR info
-    session.audio_url = voice_result.get("audio_url")
+    # Update session with audio and QR info; queued Murf audio is
+    # stored by its callback once it lands
+    if voice_result.get("audio_url"):
+        session.audio_url = voice_result["audio_url"]
     session.qr_code_path = str(tmp_dir / f"qr_{session.session_id}.png")
     session_manager.update_session(session)
     
@@ -618,7 +895,11 @@ async def create_dashboard_session(
 
 
 @app.get("/api/dashboard/{session_id}", response_model=DashboardResponse, tags=["Dashboard"])
-async def get_dashboard_data(session_id: str, token: str = None) -> DashboardResponse:
+async def get_dashboard_data(
+    session_id: str,
+    token: str = None,
+    session_manager: SessionManager = Depends(get_shared_session_manager)
+) -> DashboardResponse:
     """
     Get dashboard data for a session.
     
@@ -629,8 +910,6 @@ async def get_dashboard_data(session_id: str, token: str = None) -> DashboardRes
     Returns:
         Dashboard data including insights, metrics, and voice briefing
     """
-    sessions_path = str(project_root / "tmp" / "sessions")
-    session_manager = get_session_manager(sessions_path)
     session = session_manager.get_session(session_id, token)
     
     if not session:
@@ -641,7 +920,6 @@ async def get_dashboard_data(session_id: str, token: str = None) -> DashboardRes
     
     # Generate voice briefing on-demand if not available
     voice_briefing = {}
-    audio_dir = project_root / "static" / "audio"
     
     if session.audio_url:
         voice_briefing = {
@@ -681,26 +959,28 @@ async def serve_dashboard(session_id: str):
 
 
 @app.get("/api/session/{session_id}/qr", tags=["Dashboard"])
-async def get_session_qr(session_id: str, token: str = None):
+async def get_session_qr(
+    session_id: str,
+    token: str = None,
+    session_manager: SessionManager = Depends(get_shared_session_manager)
+):
     """Get QR code for a session."""
     from fastapi.responses import Response
     
-    sessions_path = str(project_root / "tmp" / "sessions")
-    session_manager = get_session_manager(sessions_path)
     session = session_manager.get_session(session_id, token)
     
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    # Generate fresh QR code
+    # QR code is cached per (session_id, token)
     base_url = "http://localhost:8000"
-    qr_bytes, _ = generate_qr_for_dashboard(
-        base_url=base_url,
-        session_id=session_id,
-        token=session.token
-    )
+    qr_bytes, _ = await asyncio.to_thread(get_dashboard_qr, base_url, session_id, session.token)
     
-    return Response(content=qr_bytes, media_type="image/png")
+    return Response(
+        content=qr_bytes,
+        media_type="image/png",
+        headers={"Cache-Control": "private, max-age=86400"}
+    )
 
 
 @app.exception_handler(Exception)
@@ -727,7 +1007,7 @@ if __name__ == "__main__":
     import uvicorn
     
     # Change to project root for correct static file serving
-    os.chdir(Path(__file__).parent.parent.parent)
+    os.chdir(project_root)
     
     uvicorn.run(
         "backend.app.main:app",
@@ -5,146 +5,210 @@ This module handles loading and validating YAML configuration files
 that define data sources, metrics, and report parameters.
 """
 
-from typing import Any, Dict, List, Optional, Literal
-from pydantic import BaseModel, Field, validator
+from typing import Any, Dict, List, Optional, Literal, Tuple
+from pydantic import BaseModel, Field, model_validator
+import pydantic
 import yaml
+import orjson
 import os
 import re
+from stat import S_ISDIR
+import hashlib
+import tempfile
+from datetime import date, datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
 
+# Prefer the libyaml-backed loader when PyYAML was built against it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Matches ${ENV_VAR} references in connection settings
+ENV_VAR_PATTERN = re.compile(r'\$\{([^}]+)\}')
+
+# Default ports per database driver, used when a connection omits one
+DEFAULT_DB_PORTS = {
+    "postgresql": 5432,
+    "mysql": 3306,
+    "mssql": 1433,
+    "sqlite": None
+}
+
+# SQLAlchemy URL scheme per database driver
+DB_DRIVER_PREFIXES = {
+    "postgresql": "postgresql",
+    "mysql": "mysql+mysqlconnector",
+    "mssql": "mssql+pyodbc"
+}
+
 
 class DatabaseConnectionConfig(BaseModel):
-    """Configuration for direct database connection."""
-    driver: str = Field(..., description="Database driver: postgresql, mysql, sqlite, mssql")
-    host: str = Field(default="localhost", description="Database host")
-    port: Optional[int] = Field(default=None, description="Database port")
-    database: str = Field(..., description="Database name")
-    username: Optional[str] = Field(default=None, description="Database username (supports ${ENV_VAR})")
-    password: Optional[str] = Field(default=None, description="Database password (supports ${ENV_VAR})")
+    """
+    Configuration for direct database connection.
+    
+    Attributes:
+        driver: Database driver: postgresql, mysql, sqlite, mssql
+        host: Database host
+        port: Database port
+        database: Database name
+        username: Database username (supports ${ENV_VAR})
+        password: Database password (supports ${ENV_VAR})
+    """
+    driver: str
+    host: str = "localhost"
+    port: Optional[int] = None
+    database: str
+    username: Optional[str] = None
+    password: Optional[str] = None
     
     def get_connection_string(self) -> str:
         """Build connection string from components."""
+        # SQLite only needs the database path
+        if self.driver == "sqlite":
+            return f"sqlite:///{self.database}"
+        
         # Resolve environment variables
         username = self._resolve_env_var(self.username) if self.username else None
         password = self._resolve_env_var(self.password) if self.password else None
         
-        # Determine port defaults
-        port = self.port
-        if port is None:
-            port_defaults = {
-                "postgresql": 5432,
-                "mysql": 3306,
-                "mssql": 1433,
-                "sqlite": None
-            }
-            port = port_defaults.get(self.driver)
-        
-        # Build connection string based on driver
-        if self.driver == "sqlite":
-            return f"sqlite:///{self.database}"
-        
-        auth = ""
         if username:
-            auth = username
-            if password:
-                auth += f":{password}"
-            auth += "@"
+            auth = f"{username}:{password}@" if password else f"{username}@"
+        else:
+            auth = ""
         
+        # Determine port defaults
+        port = self.port if self.port is not None else DEFAULT_DB_PORTS.get(self.driver)
         port_str = f":{port}" if port else ""
         
-        driver_map = {
-            "postgresql": "postgresql",
-            "mysql": "mysql+mysqlconnector",
-            "mssql": "mssql+pyodbc"
-        }
-        
-        driver_prefix = driver_map.get(self.driver, self.driver)
+        driver_prefix = DB_DRIVER_PREFIXES.get(self.driver, self.driver)
         return f"{driver_prefix}://{auth}{self.host}{port_str}/{self.database}"
     
     def _resolve_env_var(self, value: str) -> str:
         """Resolve ${ENV_VAR} patterns to actual values."""
-        if not value:
+        if not value or '${' not in value:
             return value
-        pattern = r'\$\{([^}]+)\}'
         def replacer(match):
             env_var = match.group(1)
             return os.getenv(env_var, "")
-        return re.sub(pattern, replacer, value)
+        return ENV_VAR_PATTERN.sub(replacer, value)
 
 
 class SourceConfig(BaseModel):
-    """Configuration for a single data source (CSV, SQL, or Database)."""
+    """
+    Configuration for a single data source (CSV, SQL, or Database).
+    
+    Attributes:
+        type: Source type: csv, sql, or database
+        path: Path to the CSV file (for type=csv)
+        connection_string: Database connection string (for type=sql)
+        query: SQL query to execute (for type=sql)
+        connection: Database connection config (for type=database)
+        table: Table name to query (for type=database)
+        date_col: Name of the date column
+        dimensions: Dimension columns for grouping
+        metrics: Metric columns to aggregate
+        join_key: Keys to use for joining with other sources
+    """
     # Source type
-    type: Literal["csv", "sql", "database"] = Field(default="csv", description="Source type: csv, sql, or database")
+    type: Literal["csv", "sql", "database"] = "csv"
     
     # CSV source fields
-    path: Optional[str] = Field(default=None, description="Path to the CSV file (for type=csv)")
+    path: Optional[str] = None
     
     # SQL source fields
-    connection_string: Optional[str] = Field(default=None, description="Database connection string (for type=sql)")
-    query: Optional[str] = Field(default=None, description="SQL query to execute (for type=sql)")
+    connection_string: Optional[str] = None
+    query: Optional[str] = None
     
     # Database source fields
-    connection: Optional[DatabaseConnectionConfig] = Field(default=None, description="Database connection config (for type=database)")
-    table: Optional[str] = Field(default=None, description="Table name to query (for type=database)")
+    connection: Optional[DatabaseConnectionConfig] = None
+    table: Optional[str] = None
     
     # Common fields
-    date_col: str = Field(..., description="Name of the date column")
-    dimensions: List[str] = Field(default_factory=list, description="Dimension columns for grouping")
-    metrics: List[str] = Field(default_factory=list, description="Metric columns to aggregate")
-    join_key: Optional[List[str]] = Field(default=None, description="Keys to use for joining with other sources")
-    
-    @validator('path', always=True)
-    def validate_csv_source(cls, v, values):
-        if values.get('type') == 'csv' and not v:
-            raise ValueError("'path' is required for CSV sources")
-        return v
-    
-    @validator('connection_string', always=True)
-    def validate_sql_source(cls, v, values):
-        if values.get('type') == 'sql' and not v:
-            raise ValueError("'connection_string' is required for SQL sources")
-        return v
-    
-    @validator('query', always=True)
-    def validate_sql_query(cls, v, values):
-        if values.get('type') == 'sql' and not v:
-            raise ValueError("'query' is required for SQL sources")
-        return v
-    
-    @validator('connection', always=True)
-    def validate_db_connection(cls, v, values):
-        if values.get('type') == 'database' and not v:
-            raise ValueError("'connection' is required for database sources")
-        return v
-    
-    @validator('table', always=True)
-    def validate_db_table(cls, v, values):
-        if values.get('type') == 'database' and not v:
-            raise ValueError("'table' is required for database sources")
-        return v
+    date_col: str
+    dimensions: List[str] = Field(default_factory=list)
+    metrics: List[str] = Field(default_factory=list)
+    join_key: Optional[List[str]] = None
+    
+    @model_validator(mode='after')
+    def validate_source_fields(self) -> 'SourceConfig':
+        """Check that the fields required by the source type are set."""
+        if self.type == 'csv':
+            if not self.path:
+                raise ValueError("'path' is required for CSV sources")
+        elif self.type == 'sql':
+            if not self.connection_string:
+                raise ValueError("'connection_string' is required for SQL sources")
+            if not self.query:
+                raise ValueError("'query' is required for SQL sources")
+        elif self.type == 'database':
+            if not self.connection:
+                raise ValueError("'connection' is required for database sources")
+            if not self.table:
+                raise ValueError("'table' is required for database sources")
+        return self
 
 
 class DatasetConfig(BaseModel):
-    """Configuration for the dataset section."""
-    primary_source: str = Field(..., description="Name of the primary data source")
-    sources: Dict[str, SourceConfig] = Field(..., description="Map of source name to source config")
+    """
+    Configuration for the dataset section.
+    
+    Attributes:
+        primary_source: Name of the primary data source
+        sources: Map of source name to source config
+    """
+    primary_source: str
+    sources: Dict[str, SourceConfig]
 
 
 class ComparisonConfig(BaseModel):
-    """Configuration for date comparison periods."""
-    current_start: str = Field(..., description="Start date of current period (YYYY-MM-DD)")
-    current_end: str = Field(..., description="End date of current period (YYYY-MM-DD)")
-    previous_start: str = Field(..., description="Start date of previous period (YYYY-MM-DD)")
-    previous_end: str = Field(..., description="End date of previous period (YYYY-MM-DD)")
+    """
+    Configuration for date comparison periods.
+    
+    Attributes:
+        current_start: Start date of current period (YYYY-MM-DD)
+        current_end: End date of current period (YYYY-MM-DD)
+        previous_start: Start date of previous period (YYYY-MM-DD)
+        previous_end: End date of previous period (YYYY-MM-DD)
+    """
+    current_start: str
+    current_end: str
+    previous_start: str
+    previous_end: str
+    
+    @cached_property
+    def period_bounds(self) -> Tuple[date, date, date, date]:
+        """(current_start, current_end, previous_start, previous_end) parsed as dates."""
+        return tuple(
+            datetime.strptime(value, "%Y-%m-%d").date()
+            for value in (self.current_start, self.current_end, self.previous_start, self.previous_end)
+        )
+    
+    @model_validator(mode='after')
+    def validate_dates(self) -> 'ComparisonConfig':
+        """Check that all period boundaries are YYYY-MM-DD dates."""
+        try:
+            self.period_bounds
+        except ValueError as e:
+            raise ValueError(f"Comparison dates must be YYYY-MM-DD: {e}")
+        return self
 
 
 class ReportConfig(BaseModel):
-    """Configuration for report generation."""
-    primary_date_col: str = Field(..., description="Primary date column for filtering")
-    comparison: ComparisonConfig = Field(..., description="Date comparison configuration")
-    primary_dims: List[str] = Field(default_factory=list, description="Primary dimensions for analysis")
-    kpi_priority: List[str] = Field(default_factory=list, description="KPIs in priority order")
+    """
+    Configuration for report generation.
+    
+    Attributes:
+        primary_date_col: Primary date column for filtering
+        comparison: Date comparison configuration
+        primary_dims: Primary dimensions for analysis
+        kpi_priority: KPIs in priority order
+    """
+    primary_date_col: str
+    comparison: ComparisonConfig
+    primary_dims: List[str] = Field(default_factory=list)
+    kpi_priority: List[str] = Field(default_factory=list)
 
 
 class InsightConfig(BaseModel):
@@ -157,14 +221,76 @@ class InsightConfig(BaseModel):
         report: Report generation configuration
     """
     dataset: DatasetConfig
-    derived_metrics: Dict[str, str] = Field(default_factory=dict, description="Derived metric formulas")
+    derived_metrics: Dict[str, str] = Field(default_factory=dict)
     report: ReportConfig
+    
+    @classmethod
+    def from_trusted_dict(cls, data: Dict[str, Any]) -> 'InsightConfig':
+        """
+        Rebuild a config from a dict produced by model_dump() without validation.
+        
+        Only use this for data that was already validated by the current
+        schema; load_config checks the cache entry's version and digest
+        before taking this path.
+        
+        Args:
+            data: Output of InsightConfig.model_dump()
+            
+        Returns:
+            InsightConfig: Config built via model_construct
+        """
+        sources = {}
+        for name, source in data['dataset']['sources'].items():
+            connection = source.get('connection')
+            if connection is not None:
+                source = {**source, 'connection': DatabaseConnectionConfig.model_construct(**connection)}
+            sources[name] = SourceConfig.model_construct(**source)
+        
+        dataset = DatasetConfig.model_construct(
+            primary_source=data['dataset']['primary_source'],
+            sources=sources,
+        )
+        report_data = data['report']
+        report = ReportConfig.model_construct(
+            comparison=ComparisonConfig.model_construct(**report_data['comparison']),
+            **{k: v for k, v in report_data.items() if k != 'comparison'},
+        )
+        return cls.model_construct(
+            dataset=dataset,
+            derived_metrics=data.get('derived_metrics', {}),
+            report=report,
+        )
+
+
+# Directory holding the last validated config for each YAML file, kept
+# out of the config's own directory so repos and user folders stay clean
+CONFIG_CACHE_DIR = Path(tempfile.gettempdir()) / "insight_engine" / "config_cache"
+
+
+@lru_cache(maxsize=1)
+def _config_schema_version() -> str:
+    """
+    Fingerprint the config schema and validators.
+    
+    Cached configs are only reused by the code that validated them, so a
+    change to this module or to pydantic invalidates every cache entry.
+    
+    Returns:
+        Hex digest of this module's source and the pydantic version
+    """
+    digest = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=16)
+    digest.update(pydantic.VERSION.encode())
+    return digest.hexdigest()
 
 
 def load_config(config_path: str) -> InsightConfig:
     """
     Load and validate configuration from a YAML file.
     
+    The validated config is persisted as JSON under CONFIG_CACHE_DIR and
+    reused while the YAML's mtime and size and the config schema version
+    are unchanged.
+    
     Args:
         config_path: Path to the YAML configuration file
         
@@ -179,13 +305,123 @@ def load_config(config_path: str) -> InsightConfig:
     if not path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
     
-    with open(path, 'r', encoding='utf-8') as f:
-        raw_config = yaml.safe_load(f)
+    resolved = str(path.resolve())
+    stat = path.stat()
+    cache_key = [_config_schema_version(), resolved, stat.st_mtime_ns, stat.st_size]
+    cache_name = hashlib.blake2b(resolved.encode(), digest_size=16).hexdigest()
+    cache_path = CONFIG_CACHE_DIR / f"{cache_name}.json"
+    use_cache = _prepare_config_cache_dir(CONFIG_CACHE_DIR)
+    
+    cached = _read_config_cache(cache_path, cache_key) if use_cache else None
+    if cached is not None:
+        return cached
+    
+    with open(path, 'rb') as f:
+        raw_config = yaml.load(f, Loader=_YamlLoader)
     
     if raw_config is None:
         raise ValueError("Empty configuration file")
     
-    return InsightConfig(**raw_config)
+    config = InsightConfig(**raw_config)
+    if use_cache:
+        _write_config_cache(cache_path, cache_key, config)
+    return config
+
+
+def _prepare_config_cache_dir(cache_dir: Path) -> bool:
+    """
+    Create the config cache directory, private to the current user.
+    
+    The cache lives in the shared temp directory, so a directory another
+    user created or can write to is never read from or written to.
+    
+    Args:
+        cache_dir: Cache directory to create
+        
+    Returns:
+        True if the directory is safe to use as the config cache
+    """
+    try:
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        st = os.lstat(cache_dir)
+    except OSError:
+        return False
+    
+    if not S_ISDIR(st.st_mode) or st.st_mode & 0o077:
+        return False
+    getuid = getattr(os, "getuid", None)
+    return getuid is None or st.st_uid == getuid()
+
+
+def _read_config_cache(cache_path: Path, cache_key: List[Any]) -> Optional[InsightConfig]:
+    """
+    Load a previously validated config from the config cache.
+    
+    The entry is rebuilt without validation only when its digest, keyed
+    by the schema version, matches its data. An edited or corrupted entry
+    is discarded so the YAML is parsed again.
+    
+    Args:
+        cache_path: Path to the cache file
+        cache_key: [schema version, path, mtime_ns, size] the cache must match
+        
+    Returns:
+        InsightConfig if the cache file exists and is current, otherwise None
+    """
+    try:
+        cached = orjson.loads(cache_path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    
+    if not isinstance(cached, dict) or cached.get("key") != cache_key or "data" not in cached:
+        return None
+    
+    data = cached["data"]
+    if cached.get("digest") != _config_cache_digest(orjson.dumps(data)):
+        return None
+    
+    try:
+        return InsightConfig.from_trusted_dict(data)
+    except (KeyError, TypeError, AttributeError):
+        return None
+
+
+def _config_cache_digest(data: bytes) -> str:
+    """Digest of serialized cache data, keyed by the config schema version."""
+    return hashlib.blake2b(data, digest_size=16, key=_config_schema_version().encode()).hexdigest()
+
+
+def _write_config_cache(cache_path: Path, cache_key: List[Any], config: InsightConfig) -> None:
+    """
+    Atomically write a validated config to the config cache.
+    
+    Failures are ignored; the cache is an optimization only.
+    
+    Args:
+        cache_path: Path to the cache file
+        cache_key: [schema version, path, mtime_ns, size] of the source YAML file
+        config: Validated configuration to persist
+    """
+    data = config.model_dump()
+    payload = orjson.dumps({
+        "key": cache_key,
+        "digest": _config_cache_digest(orjson.dumps(data)),
+        "data": data
+    })
+    try:
+        fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix=".tmp")
+    except OSError:
+        return
+    
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_name, cache_path)
+    except OSError:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
 
 
 def load_config_from_string(config_content: str) -> InsightConfig:
@@ -201,7 +437,7 @@ def load_config_from_string(config_content: str) -> InsightConfig:
     Raises:
         ValueError: If the config is invalid
     """
-    raw_config = yaml.safe_load(config_content)
+    raw_config = yaml.load(config_content, Loader=_YamlLoader)
     
     if raw_config is None:
         raise ValueError("Empty configuration content")
@@ -211,27 +447,41 @@ def load_config_from_string(config_content: str) -> InsightConfig:
 
 # Application settings (environment-based)
 class AppSettings(BaseModel):
-    """Application-wide settings."""
-    gemini_api_key: str = Field(default="", description="Google Gemini API key")
-    openai_api_key: str = Field(default="", description="OpenAI API key")
-    llm_provider: str = Field(default="auto", description="LLM provider: gemini, openai, or auto")
-    llm_model: str = Field(default="gemini-2.0-flash", description="LLM model to use")
-    reports_dir: str = Field(default="static/reports", description="Directory to save reports")
-    tmp_dir: str = Field(default="tmp", description="Temporary file directory")
-    log_level: str = Field(default="INFO", description="Logging level")
+    """
+    Application-wide settings.
+    
+    Attributes:
+        gemini_api_key: Google Gemini API key
+        openai_api_key: OpenAI API key
+        llm_provider: LLM provider: gemini, openai, or auto
+        llm_model: LLM model to use
+        reports_dir: Directory to save reports
+        tmp_dir: Temporary file directory
+        log_level: Logging level
+    """
+    gemini_api_key: str = ""
+    openai_api_key: str = ""
+    llm_provider: str = "auto"
+    llm_model: str = "gemini-2.0-flash"
+    reports_dir: str = "static/reports"
+    tmp_dir: str = "tmp"
+    log_level: str = "INFO"
     
     class Config:
         env_prefix = "INSIGHT_ENGINE_"
 
 
+@lru_cache(maxsize=1)
 def get_app_settings() -> AppSettings:
     """
     Get application settings from environment variables.
     
+    The settings are read once and cached; call
+    get_app_settings.cache_clear() after changing the environment.
+    
     Returns:
         AppSettings: Application settings object
     """
-    import os
     return AppSettings(
         gemini_api_key=os.getenv("GEMINI_API_KEY", ""),
         openai_api_key=os.getenv("OPENAI_API_KEY", ""),
@@ -10,14 +10,23 @@ import sys
 from typing import Optional
 
 
+# Root of the logger hierarchy; module loggers are children of this one
+ROOT_LOGGER_NAME = "insight_engine"
+
+_initialized = False
+
+
 def setup_logger(
-    name: str = "insight_engine",
+    name: str = ROOT_LOGGER_NAME,
     level: str = "INFO",
     log_format: Optional[str] = None
 ) -> logging.Logger:
     """
     Set up and configure a logger instance.
     
+    Calling this again for an already configured logger only updates
+    its level; no second handler is added.
+    
     Args:
         name: Logger name (typically module name)
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -28,14 +37,16 @@ def setup_logger(
     """
     logger = logging.getLogger(name)
     
-    # Avoid adding handlers multiple times
-    if logger.handlers:
-        return logger
-    
     # Set logging level
     log_level = getattr(logging, level.upper(), logging.INFO)
     logger.setLevel(log_level)
     
+    # Avoid adding handlers multiple times
+    if logger.handlers:
+        for handler in logger.handlers:
+            handler.setLevel(log_level)
+        return logger
+    
     # Default format
     if log_format is None:
         log_format = "%(asctime)s | %(name)s | %(levelname)s | %(message)s"
@@ -51,9 +62,21 @@ def setup_logger(
     return logger
 
 
-def get_logger(name: str = "insight_engine") -> logging.Logger:
+def _ensure_init() -> None:
+    """Install the console handler on the root engine logger once."""
+    global _initialized
+    if _initialized:
+        return
+    _initialized = True
+    setup_logger(ROOT_LOGGER_NAME)
+
+
+def get_logger(name: str = ROOT_LOGGER_NAME) -> logging.Logger:
     """
-    Get an existing logger or create a new one.
+    Get a logger, configuring the root engine logger on first use.
+    
+    Loggers named under "insight_engine." have no handlers of their own
+    and emit through the root engine logger.
     
     Args:
         name: Logger name
@@ -61,13 +84,8 @@ def get_logger(name: str = "insight_engine") -> logging.Logger:
     Returns:
         logging.Logger: Logger instance
     """
-    logger = logging.getLogger(name)
-    
-    # If no handlers configured, set up with defaults
-    if not logger.handlers:
-        return setup_logger(name)
-    
-    return logger
+    _ensure_init()
+    return logging.getLogger(name)
 
 
 # Pre-configured module loggers
@@ -10,25 +10,59 @@ Multiple sources are joined using DuckDB with Polars fallback.
 """
 
 import polars as pl
-import duckdb
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Collection, Dict, List, Optional, Tuple
 import sys
 import os
+import threading
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from core.config import InsightConfig, SourceConfig
 from core.logger import get_ingest_logger
+from engine.metrics import get_all_metrics, get_required_columns
+
+if TYPE_CHECKING:
+    import duckdb
 
 logger = get_ingest_logger()
 
+# Max number of sources loaded concurrently by load_all_sources
+MAX_SOURCE_WORKERS = 8
+
+# Shared in-memory DuckDB connection, created on first join. Each join runs
+# on its own cursor, so joins from different threads do not block each other.
+_duckdb_con: Optional["duckdb.DuckDBPyConnection"] = None
+_duckdb_con_lock = threading.Lock()
+
+
+def get_source_columns(source_config: SourceConfig) -> List[str]:
+    """
+    Get the columns a source declares in its configuration.
+    
+    Args:
+        source_config: Configuration for the source
+        
+    Returns:
+        List[str]: Dimensions, metrics, date column and join keys, without duplicates
+    """
+    columns = list(dict.fromkeys(source_config.dimensions + source_config.metrics))
+    if source_config.date_col and source_config.date_col not in columns:
+        columns.append(source_config.date_col)
+    if source_config.join_key:
+        for key in source_config.join_key:
+            if key not in columns:
+                columns.append(key)
+    return columns
+
 
 def load_csv_source(
     source_name: str,
     source_config: SourceConfig,
-    base_path: str = ""
+    base_path: str = "",
+    required_columns: Optional[Collection[str]] = None
 ) -> pl.DataFrame:
     """
     Load a CSV source into a Polars DataFrame.
@@ -37,6 +71,8 @@ def load_csv_source(
         source_name: Name identifier for the source
         source_config: Configuration for the source
         base_path: Base path to prepend to relative paths
+        required_columns: Other columns the pipeline reads (report
+            dimensions, KPIs, formula operands); kept when present
         
     Returns:
         pl.DataFrame: Loaded data
@@ -48,37 +84,75 @@ def load_csv_source(
     if base_path and not Path(file_path).is_absolute():
         file_path = str(Path(base_path) / file_path)
     
-    logger.info(f"Loading CSV source '{source_name}' from: {file_path}")
+    logger.info("Loading CSV source '%s' from: %s", source_name, file_path)
     
-    if not Path(file_path).exists():
+    # Read the file once; the same buffer is used for sniffing and parsing
+    try:
+        with open(file_path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
         raise FileNotFoundError(f"CSV file not found: {file_path}")
     
     try:
-        # Read first line to detect delimiter
-        with open(file_path, 'r', encoding='utf-8') as f:
-            first_line = f.readline()
-        
-        # Auto-detect delimiter
+        # Auto-detect delimiter by counting candidates within the header
+        # line, without slicing a copy of it out of the buffer
+        header_end = data.find(b'\n')
+        if header_end == -1:
+            header_end = len(data)
         delimiter = ','
-        semicolon_count = first_line.count(';')
-        comma_count = first_line.count(',')
-        tab_count = first_line.count('\t')
+        semicolon_count = data.count(b';', 0, header_end)
+        comma_count = data.count(b',', 0, header_end)
+        tab_count = data.count(b'\t', 0, header_end)
         
         if semicolon_count > comma_count and semicolon_count > tab_count:
             delimiter = ';'
         elif tab_count > comma_count and tab_count > semicolon_count:
             delimiter = '\t'
         
-        logger.info(f"Detected delimiter: '{delimiter}' (semicolons: {semicolon_count}, commas: {comma_count}, tabs: {tab_count})")
-        
-        df = pl.read_csv(file_path, separator=delimiter)
-        logger.info(f"Loaded {len(df)} rows from CSV '{source_name}' with columns: {df.columns}")
+        logger.info("Detected delimiter: '%s' (semicolons: %s, commas: %s, tabs: %s)", delimiter, semicolon_count, comma_count, tab_count)
+        
+        # Only parse the configured columns, plus any other column the
+        # pipeline reads, when all configured ones are present; otherwise
+        # load everything so downstream fallbacks still see the data
+        keep_cols = get_source_columns(source_config) if (source_config.dimensions or source_config.metrics) else []
+        lazy_df = pl.scan_csv(data, separator=delimiter)
+        header = lazy_df.collect_schema().names()
+        if keep_cols and set(keep_cols).issubset(header):
+            if required_columns:
+                keep_set = set(keep_cols)
+                keep_cols += [c for c in header if c in required_columns and c not in keep_set]
+            df = lazy_df.select(keep_cols).collect(engine="streaming")
+        else:
+            df = pl.read_csv(data, separator=delimiter)
+        logger.info("Loaded %s rows from CSV '%s' with columns: %s", len(df), source_name, df.columns)
         return df
     except Exception as e:
-        logger.error(f"Failed to load CSV source '{source_name}': {e}")
+        logger.error("Failed to load CSV source '%s': %s", source_name, e)
         raise
 
 
+def read_sql_connectorx(connection_string: str, query: str) -> pl.DataFrame:
+    """
+    Run a query through connectorx straight into a Polars DataFrame.
+    
+    Args:
+        connection_string: Database connection string
+        query: SQL query to execute
+        
+    Returns:
+        pl.DataFrame: Query results
+        
+    Raises:
+        ImportError: If connectorx is not installed
+    """
+    import connectorx as cx
+    try:
+        return cx.read_sql(connection_string, query, return_type="polars")
+    except ValueError:
+        # Releases without native Polars output still return Arrow
+        return pl.from_arrow(cx.read_sql(connection_string, query, return_type="arrow"))
+
+
 def load_sql_source(
     source_name: str,
     source_config: SourceConfig
@@ -98,19 +172,18 @@ def load_sql_source(
     connection_string = source_config.connection_string
     query = source_config.query
     
-    logger.info(f"Loading SQL source '{source_name}'")
-    logger.debug(f"Query: {query[:100]}..." if len(query) > 100 else f"Query: {query}")
+    logger.info("Loading SQL source '%s'", source_name)
+    logger.debug("Query: %s%s", query[:100], "..." if len(query) > 100 else "")
     
     try:
         # Try connectorx first (fastest)
-        import connectorx as cx
-        df = pl.from_pandas(cx.read_sql(connection_string, query))
-        logger.info(f"Loaded {len(df)} rows from SQL '{source_name}' via connectorx")
+        df = read_sql_connectorx(connection_string, query)
+        logger.info("Loaded %s rows from SQL '%s' via connectorx", len(df), source_name)
         return df
     except ImportError:
         logger.warning("connectorx not available, trying SQLAlchemy")
     except Exception as e:
-        logger.warning(f"connectorx failed: {e}, trying SQLAlchemy")
+        logger.warning("connectorx failed: %s, trying SQLAlchemy", e)
     
     # Fallback to SQLAlchemy
     try:
@@ -122,10 +195,10 @@ def load_sql_source(
             pdf = pd.read_sql(text(query), conn)
         
         df = pl.from_pandas(pdf)
-        logger.info(f"Loaded {len(df)} rows from SQL '{source_name}' via SQLAlchemy")
+        logger.info("Loaded %s rows from SQL '%s' via SQLAlchemy", len(df), source_name)
         return df
     except Exception as e:
-        logger.error(f"Failed to load SQL source '{source_name}': {e}")
+        logger.error("Failed to load SQL source '%s': %s", source_name, e)
         raise
 
 
@@ -148,41 +221,31 @@ def load_database_source(
     connection = source_config.connection
     table_name = source_config.table
     
-    logger.info(f"Loading database source '{source_name}' from table '{table_name}'")
+    logger.info("Loading database source '%s' from table '%s'", source_name, table_name)
     
     try:
         # Build connection string from config
         connection_string = connection.get_connection_string()
         
         # Build SELECT query - select all columns or specific ones
-        columns = []
-        if source_config.dimensions:
-            columns.extend(source_config.dimensions)
-        if source_config.metrics:
-            columns.extend(source_config.metrics)
-        if source_config.date_col and source_config.date_col not in columns:
-            columns.append(source_config.date_col)
-        if source_config.join_key:
-            for key in source_config.join_key:
-                if key not in columns:
-                    columns.append(key)
+        columns = get_source_columns(source_config)
         
         if columns:
             columns_str = ", ".join([f'"{c}"' for c in columns])
             query = f'SELECT {columns_str} FROM "{table_name}"'
         else:
+            logger.warning("No columns configured for database source '%s', selecting all columns from '%s'", source_name, table_name)
             query = f'SELECT * FROM "{table_name}"'
         
-        logger.debug(f"Generated query: {query}")
+        logger.debug("Generated query: %s", query)
         
         # Try connectorx first
         try:
-            import connectorx as cx
-            df = pl.from_pandas(cx.read_sql(connection_string, query))
-            logger.info(f"Loaded {len(df)} rows from database '{source_name}' via connectorx")
+            df = read_sql_connectorx(connection_string, query)
+            logger.info("Loaded %s rows from database '%s' via connectorx", len(df), source_name)
             return df
         except Exception as e:
-            logger.warning(f"connectorx failed: {e}, trying SQLAlchemy")
+            logger.warning("connectorx failed: %s, trying SQLAlchemy", e)
         
         # Fallback to SQLAlchemy
         from sqlalchemy import create_engine, text
@@ -193,18 +256,19 @@ def load_database_source(
             pdf = pd.read_sql(text(query), conn)
         
         df = pl.from_pandas(pdf)
-        logger.info(f"Loaded {len(df)} rows from database '{source_name}' via SQLAlchemy")
+        logger.info("Loaded %s rows from database '%s' via SQLAlchemy", len(df), source_name)
         return df
         
     except Exception as e:
-        logger.error(f"Failed to load database source '{source_name}': {e}")
+        logger.error("Failed to load database source '%s': %s", source_name, e)
         raise
 
 
 def load_source(
     source_name: str,
     source_config: SourceConfig,
-    base_path: str = ""
+    base_path: str = "",
+    required_columns: Optional[Collection[str]] = None
 ) -> pl.DataFrame:
     """
     Load a single data source based on its type.
@@ -213,6 +277,7 @@ def load_source(
         source_name: Name identifier for the source
         source_config: Configuration for the source
         base_path: Base path for relative file paths (CSV only)
+        required_columns: Other columns the pipeline reads (CSV only)
         
     Returns:
         pl.DataFrame: Loaded data
@@ -220,7 +285,7 @@ def load_source(
     source_type = getattr(source_config, 'type', 'csv')
     
     if source_type == "csv":
-        return load_csv_source(source_name, source_config, base_path)
+        return load_csv_source(source_name, source_config, base_path, required_columns)
     elif source_type == "sql":
         return load_sql_source(source_name, source_config)
     elif source_type == "database":
@@ -243,15 +308,42 @@ def load_all_sources(
     Returns:
         Dict[str, pl.DataFrame]: Map of source name to DataFrame
     """
-    sources: Dict[str, pl.DataFrame] = {}
-    
-    for source_name, source_config in config.dataset.sources.items():
-        sources[source_name] = load_source(source_name, source_config, base_path)
-    
-    logger.info(f"Loaded {len(sources)} data source(s)")
+    source_configs = config.dataset.sources
+    # Columns metrics processing reads beyond what each source declares
+    required_columns = get_required_columns(config, get_all_metrics(config))
+    
+    if len(source_configs) <= 1:
+        sources = {
+            source_name: load_source(source_name, source_config, base_path, required_columns)
+            for source_name, source_config in source_configs.items()
+        }
+    else:
+        # Sources are independent I/O-bound loads, so fetch them concurrently
+        with ThreadPoolExecutor(max_workers=min(MAX_SOURCE_WORKERS, len(source_configs))) as executor:
+            futures = {
+                source_name: executor.submit(load_source, source_name, source_config, base_path, required_columns)
+                for source_name, source_config in source_configs.items()
+            }
+            sources = {source_name: future.result() for source_name, future in futures.items()}
+    
+    logger.info("Loaded %s data source(s)", len(sources))
     return sources
 
 
+def _get_duckdb_connection() -> "duckdb.DuckDBPyConnection":
+    """
+    Get the shared in-memory DuckDB connection, creating it on first use.
+    
+    duckdb is imported here so CSV-only, single-source runs never load it.
+    """
+    global _duckdb_con
+    with _duckdb_con_lock:
+        if _duckdb_con is None:
+            import duckdb
+            _duckdb_con = duckdb.connect(":memory:")
+    return _duckdb_con
+
+
 def join_sources_duckdb(
     sources: Dict[str, pl.DataFrame],
     config: InsightConfig
@@ -259,8 +351,9 @@ def join_sources_duckdb(
     """
     Join multiple data sources using DuckDB SQL.
     
-    This function registers all sources as DuckDB tables and performs
-    a SQL join based on common dimensions.
+    This function registers all sources as tables on a cursor of the
+    shared DuckDB connection and performs a SQL join based on common
+    dimensions. The tables are unregistered once the join finishes.
     
     Args:
         sources: Map of source name to DataFrame
@@ -274,22 +367,13 @@ def join_sources_duckdb(
     """
     if len(sources) == 1:
         # Single source, no join needed
-        source_name = list(sources.keys())[0]
-        logger.info(f"Single source '{source_name}', no join needed")
+        source_name = next(iter(sources))
+        logger.info("Single source '%s', no join needed", source_name)
         return sources[source_name]
     
     logger.info("Joining sources using DuckDB")
     
     try:
-        con = duckdb.connect(":memory:")
-        
-        # Register all DataFrames as DuckDB tables
-        for name, df in sources.items():
-            # Convert Polars to Arrow for DuckDB
-            arrow_table = df.to_arrow()
-            con.register(name, arrow_table)
-            logger.debug(f"Registered table '{name}' with {len(df)} rows")
-        
         # Get primary source info
         primary_name = config.dataset.primary_source
         primary_config = config.dataset.sources[primary_name]
@@ -300,7 +384,6 @@ def join_sources_duckdb(
             join_keys.append(primary_config.date_col)
         
         # Build JOIN SQL
-        table_names = list(sources.keys())
         primary_table = primary_name
         
         # Start with SELECT from primary table
@@ -312,40 +395,59 @@ def join_sources_duckdb(
             select_cols.append(f'"{primary_table}"."{col}" AS "{col}"')
         
         # Add non-overlapping columns from other tables
-        for table_name in table_names:
+        skip_cols = set(primary_cols).union(join_keys)
+        for table_name in sources:
             if table_name == primary_table:
                 continue
             for col in sources[table_name].columns:
-                if col not in primary_cols and col not in join_keys:
+                if col not in skip_cols:
                     select_cols.append(f'"{table_name}"."{col}" AS "{col}"')
         
-        sql = f'SELECT {", ".join(select_cols)} FROM "{primary_table}"'
+        sql_parts = ['SELECT ', ", ".join(select_cols), f' FROM "{primary_table}"']
         
         # Add LEFT JOINs for other tables
-        for table_name in table_names:
+        for table_name in sources:
             if table_name == primary_table:
                 continue
             
             # Build ON clause using join keys
-            on_conditions = []
-            for key in join_keys:
-                if key in sources[table_name].columns:
-                    on_conditions.append(f'"{primary_table}"."{key}" = "{table_name}"."{key}"')
+            table_cols = set(sources[table_name].columns)
+            on_conditions = [
+                f'"{primary_table}"."{key}" = "{table_name}"."{key}"'
+                for key in join_keys
+                if key in table_cols
+            ]
             
             if on_conditions:
-                sql += f' LEFT JOIN "{table_name}" ON {" AND ".join(on_conditions)}'
+                sql_parts.append(f' LEFT JOIN "{table_name}" ON ')
+                sql_parts.append(" AND ".join(on_conditions))
         
-        logger.debug(f"Join SQL: {sql}")
+        sql = "".join(sql_parts)
         
-        # Execute and convert back to Polars
-        result = con.execute(sql).pl()
-        logger.info(f"DuckDB join successful, result has {len(result)} rows")
+        logger.debug("Join SQL: %s", sql)
         
-        con.close()
+        # Registrations are local to the cursor, so concurrent joins can
+        # use the same source names
+        cur = _get_duckdb_connection().cursor()
+        registered = []
+        try:
+            for name, df in sources.items():
+                cur.register(name, df)
+                registered.append(name)
+                logger.debug("Registered table '%s' with %s rows", name, len(df))
+            
+            # Execute and convert back to Polars
+            result = cur.execute(sql).pl()
+        finally:
+            for name in registered:
+                cur.unregister(name)
+            cur.close()
+        
+        logger.info("DuckDB join successful, result has %s rows", len(result))
         return result
         
     except Exception as e:
-        logger.warning(f"DuckDB join failed: {e}, falling back to Polars")
+        logger.warning("DuckDB join failed: %s, falling back to Polars", e)
         raise
 
 
@@ -364,7 +466,7 @@ def join_sources_polars(
         pl.DataFrame: Joined DataFrame
     """
     if len(sources) == 1:
-        source_name = list(sources.keys())[0]
+        source_name = next(iter(sources))
         return sources[source_name]
     
     logger.info("Joining sources using Polars")
@@ -393,9 +495,9 @@ def join_sources_polars(
             df_subset = df.select(right_cols)
             
             result = result.join(df_subset, on=common_keys, how="left")
-            logger.debug(f"Joined '{source_name}' on keys: {common_keys}")
+            logger.debug("Joined '%s' on keys: %s", source_name, common_keys)
     
-    logger.info(f"Polars join complete, result has {len(result)} rows")
+    logger.info("Polars join complete, result has %s rows", len(result))
     return result
 
 
@@ -417,10 +519,13 @@ def join_sources(
     Returns:
         pl.DataFrame: Joined DataFrame
     """
+    if len(sources) == 1:
+        return next(iter(sources.values()))
+    
     try:
         return join_sources_duckdb(sources, config)
     except Exception as e:
-        logger.info(f"Falling back to Polars join due to: {e}")
+        logger.info("Falling back to Polars join due to: %s", e)
         return join_sources_polars(sources, config)
 
 
@@ -452,15 +557,15 @@ def ingest_data(
     # Validate date column exists (critical)
     primary_config = config.dataset.sources[config.dataset.primary_source]
     if primary_config.date_col not in df.columns:
-        logger.warning(f"Date column '{primary_config.date_col}' not found. Available: {df.columns}")
+        logger.warning("Date column '%s' not found. Available: %s", primary_config.date_col, df.columns)
         # Try to find a date-like column
         date_candidates = [c for c in df.columns if 'date' in c.lower() or 'dt_' in c.lower()]
         if date_candidates:
-            logger.info(f"Using fallback date column: {date_candidates[0]}")
+            logger.info("Using fallback date column: %s", date_candidates[0])
         else:
             raise ValueError(f"Date column '{primary_config.date_col}' not found in data")
     
     # Log available columns for debugging
-    logger.info(f"Available columns: {df.columns}")
-    logger.info(f"Data ingestion complete. Final shape: {df.shape}")
+    logger.info("Available columns: %s", df.columns)
+    logger.info("Data ingestion complete. Final shape: %s", df.shape)
     return df
@@ -7,7 +7,7 @@ between current and previous periods, then ranks insights by impact.
 
 import polars as pl
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 import sys
 import os
 
@@ -20,7 +20,7 @@ from core.logger import get_insights_logger
 logger = get_insights_logger()
 
 
-@dataclass
+@dataclass(slots=True)
 class InsightRecord:
     """
     A single insight record representing a significant change.
@@ -45,8 +45,17 @@ class InsightRecord:
     direction: str
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        """Convert to dictionary for JSON serialization (dimensions is shared, not copied)."""
+        return {
+            "dimensions": self.dimensions,
+            "metric": self.metric,
+            "current_value": self.current_value,
+            "previous_value": self.previous_value,
+            "delta": self.delta,
+            "delta_pct": self.delta_pct,
+            "impact_score": self.impact_score,
+            "direction": self.direction,
+        }
 
 
 def compute_delta(current: float, previous: float) -> float:
@@ -118,156 +127,238 @@ def compute_impact_score(
     return round(raw_score, 4)
 
 
-def join_periods(
-    current_df: pl.DataFrame,
-    previous_df: pl.DataFrame,
-    dimensions: List[str]
-) -> pl.DataFrame:
+def build_insights_lazy(
+    period_lf: pl.LazyFrame,
+    dimensions: List[str],
+    kpi_priority: List[str]
+) -> Optional[pl.LazyFrame]:
     """
-    Join current and previous period DataFrames for comparison.
+    Compute deltas and impact scores for every dimension/KPI pair in Polars.
+    
+    Mirrors compute_delta, compute_delta_pct and compute_impact_score as
+    column expressions and stacks one block of rows per KPI. Values are
+    left unrounded; rounding happens when records are materialized.
     
     Args:
-        current_df: Aggregated current period data
-        previous_df: Aggregated previous period data
-        dimensions: Dimension columns for joining
+        period_lf: Side-by-side current/previous LazyFrame from process_metrics
+        dimensions: Dimension column names
+        kpi_priority: KPIs in priority order
         
     Returns:
-        Joined DataFrame with _current and _previous suffixes
+        Long-format LazyFrame with the dimension columns plus metric,
+        current_value, previous_value, delta, delta_pct, impact_score
+        and direction, or None if no KPI is present in the data
+    """
+    total_metrics = len(kpi_priority)
+    available = set(period_lf.collect_schema().names())
+    
+    per_metric = []
+    for priority_idx, metric in enumerate(kpi_priority):
+        current_col = f"{metric}_current"
+        previous_col = f"{metric}_previous"
+        
+        if current_col not in available or previous_col not in available:
+            continue
+        
+        current = pl.col(current_col).fill_null(0).cast(pl.Float64)
+        previous = pl.col(previous_col).fill_null(0).cast(pl.Float64)
+        delta = current - previous
+        
+        delta_pct = (
+            pl.when(previous == 0)
+            .then(
+                pl.when(current == 0).then(0.0)
+                .when(current > 0).then(100.0)
+                .otherwise(-100.0)
+            )
+            .otherwise(((current - previous) / previous.abs()) * 100)
+        )
+        
+        # Same weighting as compute_impact_score
+        pct_factor = delta_pct.abs().clip(upper_bound=200.0) / 200
+        priority_weight = (total_metrics - priority_idx) / total_metrics
+        impact = delta.abs() * (1 + pct_factor) * (1 + priority_weight)
+        
+        direction = (
+            pl.when(delta > 0).then(pl.lit("up"))
+            .when(delta < 0).then(pl.lit("down"))
+            .otherwise(pl.lit("flat"))
+        )
+        
+        per_metric.append(period_lf.select(
+            *[pl.col(d) for d in dimensions],
+            pl.lit(metric).alias("metric"),
+            current.alias("current_value"),
+            previous.alias("previous_value"),
+            delta.alias("delta"),
+            delta_pct.alias("delta_pct"),
+            impact.alias("impact_score"),
+            direction.alias("direction"),
+        ))
+    
+    if not per_metric:
+        return None
+    
+    return pl.concat(per_metric)
+
+
+def build_insights_frame(
+    period_df: pl.DataFrame,
+    dimensions: List[str],
+    kpi_priority: List[str]
+) -> pl.DataFrame:
     """
-    if not dimensions:
-        # No dimensions - single row comparison
-        logger.debug("No dimensions, creating single-row comparison")
+    Compute the insights frame eagerly; see build_insights_lazy.
+    
+    Args:
+        period_df: Side-by-side current/previous DataFrame
+        dimensions: Dimension column names
+        kpi_priority: KPIs in priority order
         
-        # Get metric columns
-        current_metrics = [c for c in current_df.columns]
-        previous_metrics = [c for c in previous_df.columns]
+    Returns:
+        Long-format insights DataFrame (empty if no KPI is present)
+    """
+    insights_lf = build_insights_lazy(period_df.lazy(), dimensions, kpi_priority)
+    if insights_lf is None:
+        return pl.DataFrame()
+    return insights_lf.collect()
+
+
+def insight_dicts_from_frame(
+    insights_df: pl.DataFrame,
+    dimensions: List[str]
+) -> List[Dict[str, Any]]:
+    """
+    Build insight dictionaries from an insights frame.
+    
+    Produces the same shape as InsightRecord.to_dict without creating
+    the records. Rounding is done here with Python's round() so values
+    match the scalar compute_* helpers exactly.
+    
+    Args:
+        insights_df: Output of build_insights_frame (possibly filtered)
+        dimensions: Dimension column names
         
-        # Rename columns with suffixes
-        current_renamed = current_df.rename({c: f"{c}_current" for c in current_metrics})
-        previous_renamed = previous_df.rename({c: f"{c}_previous" for c in previous_metrics})
+    Returns:
+        List of insight dictionaries in frame order
+    """
+    return [
+        {
+            "dimensions": {d: row[d] for d in dimensions},
+            "metric": row["metric"],
+            "current_value": round(row["current_value"], 4),
+            "previous_value": round(row["previous_value"], 4),
+            "delta": round(row["delta"], 4),
+            "delta_pct": round(row["delta_pct"], 2),
+            "impact_score": round(row["impact_score"], 4),
+            "direction": row["direction"],
+        }
+        for row in insights_df.iter_rows(named=True)
+    ]
+
+
+def insights_from_frame(
+    insights_df: pl.DataFrame,
+    dimensions: List[str]
+) -> List[InsightRecord]:
+    """
+    Materialize InsightRecord objects from an insights frame.
+    
+    Args:
+        insights_df: Output of build_insights_frame (possibly filtered)
+        dimensions: Dimension column names
         
-        # Cross join (single row each)
-        return current_renamed.join(previous_renamed, how="cross")
-    
-    # Rename non-dimension columns with suffixes
-    current_metrics = [c for c in current_df.columns if c not in dimensions]
-    previous_metrics = [c for c in previous_df.columns if c not in dimensions]
-    
-    current_renamed = current_df.rename({c: f"{c}_current" for c in current_metrics})
-    previous_renamed = previous_df.rename({c: f"{c}_previous" for c in previous_metrics})
-    
-    # Outer join to capture all dimension combinations
-    joined = current_renamed.join(
-        previous_renamed,
-        on=dimensions,
-        how="outer"
-    )
-    
-    # Fill nulls with 0 for missing period data
-    for col in joined.columns:
-        if col.endswith("_current") or col.endswith("_previous"):
-            joined = joined.with_columns(pl.col(col).fill_null(0))
-    
-    logger.debug(f"Joined periods: {len(joined)} dimension combinations")
-    return joined
+    Returns:
+        List of InsightRecord objects in frame order
+    """
+    return [InsightRecord(**row) for row in insight_dicts_from_frame(insights_df, dimensions)]
 
 
 def extract_insights(
-    joined_df: pl.DataFrame,
+    period_df: pl.DataFrame,
     dimensions: List[str],
     kpi_priority: List[str]
 ) -> List[InsightRecord]:
     """
-    Extract insight records from joined period data.
+    Extract insight records from side-by-side period data.
     
     Args:
-        joined_df: Joined current/previous DataFrame
+        period_df: Side-by-side current/previous DataFrame
         dimensions: Dimension column names
         kpi_priority: KPIs in priority order
         
     Returns:
         List of InsightRecord objects
     """
-    insights: List[InsightRecord] = []
-    total_metrics = len(kpi_priority)
+    insights_df = build_insights_frame(period_df, dimensions, kpi_priority)
+    insights = insights_from_frame(insights_df, dimensions)
     
-    # Convert to list of dicts for iteration
-    rows = joined_df.to_dicts()
+    logger.info(f"Extracted {len(insights)} raw insights")
+    return insights
+
+
+def rank_insights_lazy(
+    insights_lf: pl.LazyFrame,
+    top_n: Optional[int] = None,
+    min_impact: float = 0.0
+) -> pl.LazyFrame:
+    """
+    Add the impact filter, top-N selection and ordering to an insights plan.
     
-    for row in rows:
-        # Extract dimension values
-        dim_values = {d: row.get(d) for d in dimensions}
+    Args:
+        insights_lf: Insights LazyFrame from build_insights_lazy
+        top_n: Optional limit on number of insights to return
+        min_impact: Minimum impact score threshold
         
-        # Process each KPI
-        for priority_idx, metric in enumerate(kpi_priority):
-            current_col = f"{metric}_current"
-            previous_col = f"{metric}_previous"
-            
-            if current_col not in row or previous_col not in row:
-                continue
-            
-            current_val = float(row[current_col] or 0)
-            previous_val = float(row[previous_col] or 0)
-            
-            delta = compute_delta(current_val, previous_val)
-            delta_pct = compute_delta_pct(current_val, previous_val)
-            impact = compute_impact_score(delta, delta_pct, priority_idx, total_metrics)
-            
-            direction = "up" if delta > 0 else "down" if delta < 0 else "flat"
-            
-            insight = InsightRecord(
-                dimensions=dim_values,
-                metric=metric,
-                current_value=round(current_val, 4),
-                previous_value=round(previous_val, 4),
-                delta=round(delta, 4),
-                delta_pct=round(delta_pct, 2),
-                impact_score=impact,
-                direction=direction
-            )
-            
-            insights.append(insight)
+    Returns:
+        LazyFrame of ranked insights, highest impact first
+    """
+    # Filter by minimum impact
+    ranked = insights_lf.filter(pl.col("impact_score") >= min_impact)
     
-    logger.info(f"Extracted {len(insights)} raw insights")
-    return insights
+    # Partial top-k selection, then order just the selected rows
+    if top_n:
+        ranked = ranked.top_k(top_n, by="impact_score")
+    return ranked.sort("impact_score", descending=True, maintain_order=True)
 
 
 def rank_insights(
-    insights: List[InsightRecord],
+    insights_df: pl.DataFrame,
+    dimensions: List[str],
     top_n: Optional[int] = None,
     min_impact: float = 0.0
 ) -> List[InsightRecord]:
     """
     Rank insights by impact score and optionally filter.
     
+    Selection happens in Polars; InsightRecord objects are only built
+    for the rows that survive the filter and top-N cut.
+    
     Args:
-        insights: List of insight records
+        insights_df: Insights frame from build_insights_frame
+        dimensions: Dimension column names
         top_n: Optional limit on number of insights to return
         min_impact: Minimum impact score threshold
         
     Returns:
         Sorted and filtered list of insights
     """
-    # Filter by minimum impact
-    filtered = [i for i in insights if i.impact_score >= min_impact]
-    
-    # Sort by impact score descending
-    ranked = sorted(filtered, key=lambda x: x.impact_score, reverse=True)
-    
-    # Limit if specified
-    if top_n:
-        ranked = ranked[:top_n]
+    if insights_df.is_empty():
+        ranked = []
+    else:
+        ranked_df = rank_insights_lazy(insights_df.lazy(), top_n, min_impact).collect()
+        ranked = insights_from_frame(ranked_df, dimensions)
     
     logger.info(f"Ranked insights: {len(ranked)} after filtering (min_impact={min_impact})")
     return ranked
 
 
-def generate_insight_summary(insights: List[InsightRecord]) -> Dict[str, Any]:
+def generate_insight_summary(insights: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Generate a summary of the insights.
     
     Args:
-        insights: List of ranked insights
+        insights: Ranked insight dictionaries
         
     Returns:
         Summary dictionary with overall statistics
@@ -280,24 +371,23 @@ def generate_insight_summary(insights: List[InsightRecord]) -> Dict[str, Any]:
             "biggest_drop": None
         }
     
-    gains = [i for i in insights if i.direction == "up"]
-    drops = [i for i in insights if i.direction == "down"]
+    gains = [i for i in insights if i["direction"] == "up"]
+    drops = [i for i in insights if i["direction"] == "down"]
     
     summary = {
         "total_insights": len(insights),
         "total_gains": len(gains),
         "total_drops": len(drops),
-        "top_mover": insights[0].to_dict() if insights else None,
-        "biggest_gain": max(gains, key=lambda x: x.delta_pct).to_dict() if gains else None,
-        "biggest_drop": min(drops, key=lambda x: x.delta_pct).to_dict() if drops else None,
+        "top_mover": insights[0] if insights else None,
+        "biggest_gain": max(gains, key=lambda x: x["delta_pct"]) if gains else None,
+        "biggest_drop": min(drops, key=lambda x: x["delta_pct"]) if drops else None,
     }
     
     return summary
 
 
 def generate_insights(
-    current_df: pl.DataFrame,
-    previous_df: pl.DataFrame,
+    period_df: pl.DataFrame,
     config: InsightConfig,
     top_n: int = 20
 ) -> Dict[str, Any]:
@@ -305,14 +395,13 @@ def generate_insights(
     Main entry point for insight generation.
     
     This function:
-    1. Joins current and previous period data
-    2. Extracts insight records for each dimension/metric combination
-    3. Ranks insights by impact score
-    4. Generates summary statistics
+    1. Extracts insight records for each dimension/metric combination
+    2. Ranks insights by impact score
+    3. Generates summary statistics
     
     Args:
-        current_df: Aggregated current period DataFrame
-        previous_df: Aggregated previous period DataFrame
+        period_df: Aggregated DataFrame with <metric>_current and
+            <metric>_previous columns, as returned by process_metrics
         config: Insight configuration
         top_n: Number of top insights to return
         
@@ -325,29 +414,36 @@ def generate_insights(
     
     dimensions = config.report.primary_dims
     kpi_priority = config.report.kpi_priority
+    comparison = config.report.comparison
     
-    # Join periods
-    joined = join_periods(current_df, previous_df, dimensions)
+    # Extract and rank as one lazy plan so Polars can push the top-k
+    # selection down before any records are built; the streaming engine
+    # keeps only the running top-k instead of the full long frame
+    insights_lf = build_insights_lazy(period_df.lazy(), dimensions, kpi_priority)
     
-    # Extract insights
-    insights = extract_insights(joined, dimensions, kpi_priority)
+    if insights_lf is None:
+        ranked = []
+    else:
+        ranked_df = rank_insights_lazy(insights_lf, top_n=top_n).collect(engine="streaming")
+        # Serialize straight from the frame; InsightRecord objects are
+        # not needed on this path
+        ranked = insight_dicts_from_frame(ranked_df, dimensions)
     
-    # Rank insights
-    ranked = rank_insights(insights, top_n=top_n)
+    logger.info(f"Ranked insights: {len(ranked)}")
     
     # Generate summary
     summary = generate_insight_summary(ranked)
     
     result = {
-        "insights": [i.to_dict() for i in ranked],
+        "insights": ranked,
         "summary": summary,
         "config": {
             "dimensions": dimensions,
             "kpis": kpi_priority,
-            "current_period": f"{config.report.comparison.current_start} to {config.report.comparison.current_end}",
-            "previous_period": f"{config.report.comparison.previous_start} to {config.report.comparison.previous_end}"
+            "current_period": f"{comparison.current_start} to {comparison.current_end}",
+            "previous_period": f"{comparison.previous_start} to {comparison.previous_end}"
         }
     }
     
-    logger.info(f"Insight generation complete. Top insight: {ranked[0].metric if ranked else 'N/A'}")
+    logger.info(f"Insight generation complete. Top insight: {ranked[0]['metric'] if ranked else 'N/A'}")
     return result
@@ -6,8 +6,8 @@ and aggregation by dimensions.
 """
 
 import polars as pl
-from typing import Dict, List, Tuple
-from datetime import datetime
+from typing import Collection, Dict, List, Set, Tuple, Union
+from datetime import date
 import re
 import sys
 import os
@@ -20,6 +20,26 @@ from core.logger import get_metrics_logger
 
 logger = get_metrics_logger()
 
+# Simple binary formula: operand operator operand
+FORMULA_PATTERN = re.compile(r'^\s*(\w+)\s*([+\-*/])\s*(\w+)\s*$')
+
+# Eager or lazy Polars frame; the pipeline steps below accept either
+Frame = Union[pl.DataFrame, pl.LazyFrame]
+
+# Temporary column used to tag rows with their comparison period
+PERIOD_COL = "__period"
+
+# Common date formats, in the order they are tried
+DATE_FORMATS = ["%Y-%m-%d", "%Y/%m/%d", "%m/%d/%Y", "%d/%m/%Y"]
+
+# Value shape -> candidate formats; day-first vs month-first can only be
+# told apart by parsing the whole column
+DATE_SHAPE_FORMATS = [
+    (re.compile(r'^\d{4}-\d{1,2}-\d{1,2}$'), ["%Y-%m-%d"]),
+    (re.compile(r'^\d{4}/\d{1,2}/\d{1,2}$'), ["%Y/%m/%d"]),
+    (re.compile(r'^\d{1,2}/\d{1,2}/\d{4}$'), ["%m/%d/%Y", "%d/%m/%Y"]),
+]
+
 
 def parse_formula(formula: str) -> Tuple[str, str, str]:
     """
@@ -37,8 +57,7 @@ def parse_formula(formula: str) -> Tuple[str, str, str]:
         ValueError: If formula cannot be parsed
     """
     # Match pattern: operand operator operand
-    pattern = r'^\s*(\w+)\s*([+\-*/])\s*(\w+)\s*$'
-    match = re.match(pattern, formula)
+    match = FORMULA_PATTERN.match(formula)
     
     if not match:
         raise ValueError(f"Cannot parse formula: {formula}")
@@ -46,21 +65,24 @@ def parse_formula(formula: str) -> Tuple[str, str, str]:
     return match.group(1), match.group(2), match.group(3)
 
 
-def compute_derived_metric(
-    df: pl.DataFrame,
+def build_derived_metric_expr(
     metric_name: str,
-    formula: str
-) -> pl.DataFrame:
+    formula: str,
+    columns: Collection[str]
+) -> pl.Expr:
     """
-    Compute a derived metric from a formula and add it to the DataFrame.
+    Build the Polars expression for a derived metric without applying it.
     
     Args:
-        df: Input DataFrame
         metric_name: Name for the new metric column
         formula: Formula string (e.g., "clicks / impressions")
+        columns: Column names available to the formula
         
     Returns:
-        pl.DataFrame: DataFrame with new metric column added
+        pl.Expr: Expression producing the metric column
+        
+    Raises:
+        ValueError: If the formula is invalid or references a missing column
     """
     logger.debug(f"Computing derived metric '{metric_name}' from formula: {formula}")
     
@@ -68,9 +90,9 @@ def compute_derived_metric(
         operand1, operator, operand2 = parse_formula(formula)
         
         # Verify columns exist
-        if operand1 not in df.columns:
+        if operand1 not in columns:
             raise ValueError(f"Column '{operand1}' not found for formula '{formula}'")
-        if operand2 not in df.columns:
+        if operand2 not in columns:
             raise ValueError(f"Column '{operand2}' not found for formula '{formula}'")
         
         # Build expression based on operator
@@ -78,44 +100,77 @@ def compute_derived_metric(
         col2 = pl.col(operand2).cast(pl.Float64)
         
         if operator == '+':
-            expr = (col1 + col2).alias(metric_name)
+            return (col1 + col2).alias(metric_name)
         elif operator == '-':
-            expr = (col1 - col2).alias(metric_name)
+            return (col1 - col2).alias(metric_name)
         elif operator == '*':
-            expr = (col1 * col2).alias(metric_name)
+            return (col1 * col2).alias(metric_name)
         elif operator == '/':
             # Handle division by zero
-            expr = pl.when(col2 != 0).then(col1 / col2).otherwise(0.0).alias(metric_name)
+            return pl.when(col2 != 0).then(col1 / col2).otherwise(0.0).alias(metric_name)
         else:
             raise ValueError(f"Unsupported operator: {operator}")
         
-        return df.with_columns(expr)
-        
     except Exception as e:
         logger.error(f"Failed to compute metric '{metric_name}': {e}")
         raise
 
 
-def compute_all_derived_metrics(
+def compute_derived_metric(
     df: pl.DataFrame,
-    derived_metrics: Dict[str, str]
+    metric_name: str,
+    formula: str
 ) -> pl.DataFrame:
     """
-    Compute all derived metrics defined in configuration.
+    Compute a derived metric from a formula and add it to the DataFrame.
     
     Args:
         df: Input DataFrame
+        metric_name: Name for the new metric column
+        formula: Formula string (e.g., "clicks / impressions")
+        
+    Returns:
+        pl.DataFrame: DataFrame with new metric column added
+    """
+    return df.with_columns(build_derived_metric_expr(metric_name, formula, df.columns))
+
+
+def compute_all_derived_metrics(
+    df: Frame,
+    derived_metrics: Dict[str, str]
+) -> Frame:
+    """
+    Compute all derived metrics defined in configuration.
+    
+    Independent metrics are added in a single with_columns call. A metric
+    whose formula uses a metric from the pending batch starts a new batch,
+    so formulas can still build on earlier derived metrics.
+    
+    Args:
+        df: Input DataFrame or LazyFrame
         derived_metrics: Map of metric name to formula
         
     Returns:
-        pl.DataFrame: DataFrame with all derived metrics added
+        Frame of the same kind with all derived metrics added
     """
     logger.info(f"Computing {len(derived_metrics)} derived metric(s)")
     
+    columns = set(df.collect_schema().names())
+    batch: Dict[str, pl.Expr] = {}
+    
     for metric_name, formula in derived_metrics.items():
-        df = compute_derived_metric(df, metric_name, formula)
+        expr = build_derived_metric_expr(metric_name, formula, columns)
+        if metric_name in batch or any(name in batch for name in expr.meta.root_names()):
+            df = df.with_columns(list(batch.values()))
+            batch = {}
+        
+        batch[metric_name] = expr
+        columns.add(metric_name)
         logger.info(f"Added derived metric: {metric_name}")
     
+    if batch:
+        df = df.with_columns(list(batch.values()))
+    
     return df
 
 
@@ -145,15 +200,23 @@ def parse_date_column(df: pl.DataFrame, date_col: str) -> pl.DataFrame:
     # Try to parse as string
     logger.debug(f"Parsing date column '{date_col}' from string")
     
-    # Try common date formats
-    formats_to_try = ["%Y-%m-%d", "%Y/%m/%d", "%m/%d/%Y", "%d/%m/%Y"]
+    # Narrow the common formats using the first non-null value, so a full
+    # parse is only attempted with formats that can match
+    formats_to_try = DATE_FORMATS
+    sample = df[date_col].drop_nulls().head(1)
+    if col_dtype == pl.String and len(sample):
+        sample_value = sample.item().strip()
+        for shape, formats in DATE_SHAPE_FORMATS:
+            if shape.match(sample_value):
+                formats_to_try = formats
+                break
     
     for fmt in formats_to_try:
         try:
             return df.with_columns(
                 pl.col(date_col).str.to_date(fmt).alias(date_col)
             )
-        except:
+        except Exception:
             continue
     
     # Last resort: let Polars infer
@@ -166,42 +229,65 @@ def parse_date_column(df: pl.DataFrame, date_col: str) -> pl.DataFrame:
         raise ValueError(f"Cannot parse date column '{date_col}'")
 
 
+def get_period_bounds(config: InsightConfig) -> Tuple[date, date, date, date]:
+    """
+    Get the comparison period boundaries from the config.
+    
+    The dates are parsed once per config and cached on it.
+    
+    Args:
+        config: Insight configuration
+        
+    Returns:
+        Tuple of (current_start, current_end, previous_start, previous_end)
+    """
+    return config.report.comparison.period_bounds
+
+
 def split_by_period(
-    df: pl.DataFrame,
+    df: Frame,
     config: InsightConfig
-) -> Tuple[pl.DataFrame, pl.DataFrame]:
+) -> Tuple[Frame, Frame]:
     """
     Split DataFrame into CURRENT and PREVIOUS periods based on config.
     
+    A LazyFrame is split into two filtered plans over the same input.
+    
     Args:
-        df: Input DataFrame with parsed date column
+        df: Input DataFrame or LazyFrame with parsed date column
         config: Insight configuration
         
     Returns:
         Tuple of (current_df, previous_df)
     """
     date_col = config.report.primary_date_col
-    comparison = config.report.comparison
-    
-    # Parse date strings
-    current_start = datetime.strptime(comparison.current_start, "%Y-%m-%d").date()
-    current_end = datetime.strptime(comparison.current_end, "%Y-%m-%d").date()
-    previous_start = datetime.strptime(comparison.previous_start, "%Y-%m-%d").date()
-    previous_end = datetime.strptime(comparison.previous_end, "%Y-%m-%d").date()
+    current_start, current_end, previous_start, previous_end = get_period_bounds(config)
     
     logger.info(f"Splitting data: Current [{current_start} to {current_end}], Previous [{previous_start} to {previous_end}]")
     
-    # Filter for current period
-    current_df = df.filter(
-        (pl.col(date_col) >= current_start) & 
-        (pl.col(date_col) <= current_end)
-    )
-    
-    # Filter for previous period
-    previous_df = df.filter(
-        (pl.col(date_col) >= previous_start) & 
-        (pl.col(date_col) <= previous_end)
-    )
+    in_current = pl.col(date_col).is_between(current_start, current_end)
+    in_previous = pl.col(date_col).is_between(previous_start, previous_end)
+    
+    if isinstance(df, pl.LazyFrame):
+        return df.filter(in_current), df.filter(in_previous)
+    
+    if current_start <= previous_end and previous_start <= current_end:
+        # Overlapping periods: a row can belong to both, so filter separately
+        current_df = df.filter(in_current)
+        previous_df = df.filter(in_previous)
+    else:
+        # Tag each row with its period in one pass over the date column
+        periods = (
+            df.with_columns(
+                pl.when(in_current).then(pl.lit("current"))
+                .when(in_previous).then(pl.lit("previous"))
+                .alias(PERIOD_COL)
+            )
+            .drop_nulls(PERIOD_COL)
+            .partition_by(PERIOD_COL, as_dict=True, include_key=False)
+        )
+        current_df = periods.get(("current",), df.clear())
+        previous_df = periods.get(("previous",), df.clear())
     
     logger.info(f"Current period: {len(current_df)} rows, Previous period: {len(previous_df)} rows")
     
@@ -209,47 +295,109 @@ def split_by_period(
 
 
 def aggregate_by_dimensions(
-    df: pl.DataFrame,
+    df: Frame,
     dimensions: List[str],
     metrics: List[str]
-) -> pl.DataFrame:
+) -> Frame:
     """
     Aggregate data by dimensions, summing numeric metrics.
     
     Args:
-        df: Input DataFrame
+        df: Input DataFrame or LazyFrame
         dimensions: Columns to group by
         metrics: Metric columns to aggregate (sum)
         
     Returns:
-        pl.DataFrame: Aggregated DataFrame
+        Aggregated frame of the same kind
     """
+    columns = set(df.collect_schema().names())
+    
     if not dimensions:
         # No dimensions, aggregate entire dataset
         logger.debug("No dimensions specified, aggregating entire dataset")
-        agg_exprs = [pl.col(m).sum().alias(m) for m in metrics if m in df.columns]
+        agg_exprs = [pl.col(m).sum().alias(m) for m in metrics if m in columns]
         return df.select(agg_exprs)
     
     # Verify dimensions exist
-    missing_dims = [d for d in dimensions if d not in df.columns]
+    missing_dims = [d for d in dimensions if d not in columns]
     if missing_dims:
         raise ValueError(f"Missing dimension columns: {missing_dims}")
     
     # Build aggregation expressions
     agg_exprs = []
     for metric in metrics:
-        if metric in df.columns:
+        if metric in columns:
             agg_exprs.append(pl.col(metric).sum().alias(metric))
     
     if not agg_exprs:
         raise ValueError("No valid metrics found to aggregate")
     
     result = df.group_by(dimensions).agg(agg_exprs)
-    logger.debug(f"Aggregated to {len(result)} rows by dimensions: {dimensions}")
+    if isinstance(result, pl.DataFrame):
+        logger.debug(f"Aggregated to {len(result)} rows by dimensions: {dimensions}")
     
     return result
 
 
+def aggregate_periods(
+    df: Frame,
+    config: InsightConfig,
+    metrics: List[str]
+) -> Frame:
+    """
+    Aggregate both comparison periods by dimensions in a single group-by.
+    
+    Each metric is summed twice per group, once over the rows in each
+    period, which yields the side-by-side layout directly. Rows outside
+    both periods are dropped first; a group with no rows in one period
+    gets 0 for it. Overlapping periods count shared rows in both.
+    
+    Args:
+        df: Input DataFrame or LazyFrame with parsed date column
+        config: Insight configuration
+        metrics: Metric columns to aggregate (sum)
+        
+    Returns:
+        Frame with the dimension columns, then <metric>_current and
+        <metric>_previous columns
+        
+    Raises:
+        ValueError: If a dimension is missing or no metric can be aggregated
+    """
+    date_col = config.report.primary_date_col
+    dimensions = config.report.primary_dims
+    current_start, current_end, previous_start, previous_end = get_period_bounds(config)
+    
+    logger.info(f"Aggregating periods: Current [{current_start} to {current_end}], Previous [{previous_start} to {previous_end}]")
+    
+    in_current = pl.col(date_col).is_between(current_start, current_end)
+    in_previous = pl.col(date_col).is_between(previous_start, previous_end)
+    
+    columns = set(df.collect_schema().names())
+    present_metrics = [m for m in metrics if m in columns]
+    agg_exprs = (
+        [pl.col(m).filter(in_current).sum().alias(f"{m}_current") for m in present_metrics] +
+        [pl.col(m).filter(in_previous).sum().alias(f"{m}_previous") for m in present_metrics]
+    )
+    
+    in_either = df.filter(in_current | in_previous)
+    
+    if not dimensions:
+        # No dimensions, aggregate entire dataset
+        logger.debug("No dimensions specified, aggregating entire dataset")
+        return in_either.select(agg_exprs)
+    
+    # Verify dimensions exist
+    missing_dims = [d for d in dimensions if d not in columns]
+    if missing_dims:
+        raise ValueError(f"Missing dimension columns: {missing_dims}")
+    
+    if not agg_exprs:
+        raise ValueError("No valid metrics found to aggregate")
+    
+    return in_either.group_by(dimensions).agg(agg_exprs)
+
+
 def get_all_metrics(config: InsightConfig) -> List[str]:
     """
     Get all metric names including base and derived metrics.
@@ -275,49 +423,76 @@ def get_all_metrics(config: InsightConfig) -> List[str]:
     return metrics
 
 
+def get_required_columns(config: InsightConfig, metrics: List[str]) -> Set[str]:
+    """
+    Get the input columns the metrics pipeline reads.
+    
+    Args:
+        config: Insight configuration
+        metrics: Metrics to be aggregated (see get_all_metrics)
+        
+    Returns:
+        Set of the date column, dimensions, metrics and formula operands
+    """
+    required = {config.report.primary_date_col, *config.report.primary_dims, *metrics}
+    
+    for formula in config.derived_metrics.values():
+        match = FORMULA_PATTERN.match(formula)
+        if match:
+            required.update((match.group(1), match.group(3)))
+    
+    return required
+
+
 def process_metrics(
     df: pl.DataFrame,
     config: InsightConfig
-) -> Tuple[pl.DataFrame, pl.DataFrame]:
+) -> pl.DataFrame:
     """
     Main entry point for metrics processing.
     
     This function:
-    1. Parses date column
+    1. Drops unused columns and parses the date column
     2. Computes derived metrics
-    3. Splits by period
-    4. Aggregates by dimensions
+    3. Aggregates both periods by dimensions
+    
+    Date parsing runs eagerly because picking a format may need trial
+    parses; the remaining steps are built as one lazy plan, so Polars
+    only reads the columns the aggregation needs.
     
     Args:
         df: Input DataFrame from ingestion
         config: Insight configuration
         
     Returns:
-        Tuple of (aggregated_current, aggregated_previous) DataFrames
+        DataFrame with the dimension columns plus <metric>_current and
+        <metric>_previous for every aggregated metric
     """
     logger.info("Starting metrics processing")
     
+    all_metrics = get_all_metrics(config)
+    dimensions = config.report.primary_dims
+    
+    # Drop columns nothing downstream reads before any work is done
+    required = get_required_columns(config, all_metrics)
+    df = df.select([c for c in df.columns if c in required])
+    
     # Parse date column
     date_col = config.report.primary_date_col
-    df = parse_date_column(df, date_col)
+    lf = parse_date_column(df, date_col).lazy()
     
     # Compute derived metrics
     if config.derived_metrics:
-        df = compute_all_derived_metrics(df, config.derived_metrics)
-    
-    # Split by period
-    current_df, previous_df = split_by_period(df, config)
-    
-    # Get all metrics to aggregate
-    all_metrics = get_all_metrics(config)
-    dimensions = config.report.primary_dims
+        lf = compute_all_derived_metrics(lf, config.derived_metrics)
     
     logger.info(f"Aggregating metrics: {all_metrics} by dimensions: {dimensions}")
     
-    # Aggregate each period
-    current_agg = aggregate_by_dimensions(current_df, dimensions, all_metrics)
-    previous_agg = aggregate_by_dimensions(previous_df, dimensions, all_metrics)
+    # Aggregate both periods in one pass into the side-by-side layout
+    # that insight generation consumes directly. The streaming engine
+    # processes the derived metrics and group-by in batches, and Polars
+    # falls back to in-memory execution for anything it cannot stream
+    period_df = aggregate_periods(lf, config, all_metrics).collect(engine="streaming")
     
-    logger.info(f"Metrics processing complete. Current: {current_agg.shape}, Previous: {previous_agg.shape}")
+    logger.info(f"Metrics processing complete. Periods: {period_df.shape}")
     
-    return current_agg, previous_agg
+    return period_df
@@ -5,12 +5,25 @@ This module sends insights to an LLM (Google Gemini or OpenAI) with a
 structured JSON prompt and receives narrative content for the report.
 """
 
-import json
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+import asyncio
+import hashlib
+import importlib.util
+import math
+import random
+import tempfile
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from contextlib import aclosing
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass
 import sys
 import os
 
+import orjson
+
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -18,24 +31,64 @@ from core.logger import get_narrative_logger
 
 logger = get_narrative_logger()
 
-# Gemini import with fallback
-try:
-    import google.generativeai as genai
-    GEMINI_AVAILABLE = True
-except ImportError:
-    GEMINI_AVAILABLE = False
+
+def _sdk_available(module_name: str) -> bool:
+    """Check whether an SDK is installed without importing it."""
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+# SDKs are imported on first use - both pull in heavy dependencies
+# (grpc/protobuf, httpx) - so only their availability is checked here
+GEMINI_AVAILABLE = _sdk_available("google.generativeai")
+if not GEMINI_AVAILABLE:
     logger.warning("Google Generative AI SDK not installed.")
 
-# OpenAI import with fallback
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
+OPENAI_AVAILABLE = _sdk_available("openai")
+if not OPENAI_AVAILABLE:
     logger.warning("OpenAI SDK not installed.")
 
+# Model used for a provider when the requested model belongs to another one
+DEFAULT_LLM_MODELS = {
+    "gemini": "gemini-2.0-flash",
+    "openai": "gpt-4.1-mini",
+}
+
+# Substring that marks a model name as belonging to each provider
+LLM_MODEL_MARKERS = {
+    "gemini": "gemini",
+    "openai": "gpt",
+}
+
+# Default request rate for batched narrative generation (requests/minute)
+DEFAULT_NARRATIVE_QPM = 500
+
+# Retry policy for transient provider errors (rate limits, 5xx, network):
+# up to LLM_MAX_ATTEMPTS tries with randomized exponential backoff
+LLM_MAX_ATTEMPTS = 5
+LLM_RETRY_MIN_WAIT = 1.0
+LLM_RETRY_MAX_WAIT = 20.0
 
-@dataclass
+# LRU cache of parsed LLM narratives keyed by a hash of provider, model
+# and prompt; optionally mirrored to disk so restarts keep it warm
+NARRATIVE_CACHE_SIZE = 512
+_narrative_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_narrative_cache_dir: Optional[Path] = None
+
+# SDK clients reused across LLM calls, keyed by provider/key/model. Async
+# clients hold connection pools bound to the event loop that created
+# them, so each running loop gets its own set
+_llm_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[tuple, Any]]" = weakref.WeakKeyDictionary()
+_llm_clients_lock = threading.Lock()
+
+# (api_key, loop ref) of the last genai.configure call; configure is
+# process-global and its default async client is bound to one loop
+_gemini_configured: Optional[tuple] = None
+
+
+@dataclass(slots=True)
 class NarrativeSection:
     """
     Structured narrative section from LLM response.
@@ -52,8 +105,17 @@ class NarrativeSection:
     recommendation: str
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return asdict(self)
+        """Convert to dictionary (bullets is shared, not copied)."""
+        return {
+            "title": self.title,
+            "headline": self.headline,
+            "bullets": self.bullets,
+            "recommendation": self.recommendation,
+        }
+    
+    def to_json(self) -> bytes:
+        """Serialize straight to JSON bytes."""
+        return orjson.dumps(self)
 
 
 # LLM prompt template - MUST follow this exact JSON schema
@@ -83,6 +145,32 @@ Guidelines:
 - recommendation: One actionable recommendation based on the insights"""
 
 
+# Insight fields the prompt guidelines refer to, and the numeric ones
+# among them that are rounded to 2 decimals to save prompt tokens
+PROMPT_INSIGHT_FIELDS = ("metric", "dimensions", "current_value", "previous_value", "delta_pct", "direction")
+PROMPT_ROUNDED_FIELDS = ("current_value", "previous_value", "delta_pct")
+
+
+def _compact_insights(insights: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Reduce insights to the fields the prompt needs, with short numbers.
+    
+    Args:
+        insights: Insight dictionaries from generate_insights
+        
+    Returns:
+        New list of trimmed insight dictionaries
+    """
+    compact = []
+    for insight in insights:
+        item = {field: insight.get(field) for field in PROMPT_INSIGHT_FIELDS}
+        for field in PROMPT_ROUNDED_FIELDS:
+            if isinstance(item[field], float):
+                item[field] = round(item[field], 2)
+        compact.append(item)
+    return compact
+
+
 def build_llm_prompt(insights_data: Dict[str, Any]) -> str:
     """
     Build the LLM prompt from insights data.
@@ -97,8 +185,8 @@ def build_llm_prompt(insights_data: Dict[str, Any]) -> str:
     top_insights = insights_data.get("insights", [])[:10]
     config = insights_data.get("config", {})
     
-    # Format insight JSON
-    insight_json = json.dumps(top_insights, indent=2)
+    # Format insight JSON on one line with only the fields the model needs
+    insight_json = orjson.dumps(_compact_insights(top_insights)).decode()
     
     prompt = LLM_PROMPT_TEMPLATE.format(
         insight_json=insight_json,
@@ -111,21 +199,274 @@ def build_llm_prompt(insights_data: Dict[str, Any]) -> str:
     return prompt
 
 
-def call_openai(
+class _RateLimiter:
+    """
+    Token bucket allowing max_rate acquisitions per period seconds.
+    
+    Callers reserve a token up front and sleep until it is due, so
+    waiters are served in order. Bookkeeping is guarded by a thread lock
+    so one limiter works across event loops and threads.
+    """
+    
+    def __init__(self, max_rate: int, period: float = 60.0):
+        self.max_rate = max_rate
+        self.period = period
+        self._tokens = float(max_rate)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        with self._lock:
+            now = time.monotonic()
+            refill = (now - self._updated) * self.max_rate / self.period
+            self._tokens = min(float(self.max_rate), self._tokens + refill) - 1
+            self._updated = now
+            wait = -self._tokens * self.period / self.max_rate if self._tokens < 0 else 0.0
+        
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+# Process-wide request shaping per provider (requests/minute)
+_openai_limiter = _RateLimiter(int(os.getenv("OPENAI_MAX_QPM", "500")))
+_gemini_limiter = _RateLimiter(int(os.getenv("GEMINI_MAX_QPM", "500")))
+
+
+def _retryable_errors(provider: str) -> Tuple[type, ...]:
+    """
+    Get the SDK exception types worth retrying for a provider.
+    
+    Args:
+        provider: "openai" or "gemini"
+        
+    Returns:
+        Tuple of exception classes for rate limits, server and network errors
+    """
+    if provider == "openai":
+        import openai
+        return (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)
+    
+    from google.api_core import exceptions as google_exceptions
+    return (
+        google_exceptions.TooManyRequests,
+        google_exceptions.ResourceExhausted,
+        google_exceptions.ServiceUnavailable,
+        google_exceptions.InternalServerError,
+        google_exceptions.DeadlineExceeded,
+    )
+
+
+async def _call_with_retries(provider: str, call: Callable[[], Awaitable[str]]) -> str:
+    """
+    Run an LLM call, retrying transient provider errors with backoff.
+    
+    Args:
+        provider: "openai" or "gemini"
+        call: Zero-argument coroutine function performing one attempt
+        
+    Returns:
+        Result of the first successful attempt
+        
+    Raises:
+        Exception: The last error if all attempts fail, or any
+            non-retryable error immediately
+    """
+    retryable = _retryable_errors(provider)
+    
+    for attempt in range(1, LLM_MAX_ATTEMPTS + 1):
+        try:
+            return await call()
+        except retryable as e:
+            if attempt == LLM_MAX_ATTEMPTS:
+                raise
+            delay = random.uniform(
+                LLM_RETRY_MIN_WAIT,
+                min(LLM_RETRY_MAX_WAIT, LLM_RETRY_MIN_WAIT * 2 ** attempt)
+            )
+            logger.warning(f"{provider} call failed ({e}), retrying in {delay:.1f}s (attempt {attempt}/{LLM_MAX_ATTEMPTS})")
+            await asyncio.sleep(delay)
+
+
+def set_narrative_cache_dir(cache_dir: Optional[Path]) -> None:
+    """
+    Set the directory LLM narratives are persisted to.
+    
+    Args:
+        cache_dir: Directory for cached narratives, or None for memory only
+    """
+    global _narrative_cache_dir
+    if cache_dir is not None:
+        cache_dir = Path(cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    _narrative_cache_dir = cache_dir
+
+
+def _narrative_cache_key(prompt: str, provider: str, model: str) -> str:
+    """Hash everything that determines the LLM response into a cache key."""
+    return hashlib.sha256(f"{provider}\0{model}\0{prompt}".encode("utf-8")).hexdigest()
+
+
+def _get_cached_narrative(key: str) -> Optional[NarrativeSection]:
+    """
+    Look up a narrative in memory, then on disk.
+    
+    Args:
+        key: Cache key from _narrative_cache_key
+        
+    Returns:
+        A fresh NarrativeSection, or None on a miss
+    """
+    data = _narrative_cache.get(key)
+    if data is not None:
+        _narrative_cache.move_to_end(key)
+    elif _narrative_cache_dir is not None:
+        try:
+            with open(_narrative_cache_dir / f"{key}.json", "rb") as f:
+                data = orjson.loads(f.read())
+            data = NarrativeSection(**data).to_dict()
+        except (OSError, ValueError, TypeError):
+            return None
+        _remember_narrative(key, data)
+    else:
+        return None
+    
+    return NarrativeSection(**{**data, "bullets": list(data["bullets"])})
+
+
+def _remember_narrative(key: str, data: Dict[str, Any]) -> None:
+    """Insert into the in-memory LRU, evicting the oldest entry if full."""
+    _narrative_cache[key] = data
+    _narrative_cache.move_to_end(key)
+    if len(_narrative_cache) > NARRATIVE_CACHE_SIZE:
+        _narrative_cache.popitem(last=False)
+
+
+def _store_cached_narrative(key: str, narrative: NarrativeSection) -> None:
+    """
+    Cache a narrative in memory and, if configured, atomically on disk.
+    
+    Disk failures are ignored; the cache is an optimization only.
+    
+    Args:
+        key: Cache key from _narrative_cache_key
+        narrative: Parsed LLM narrative
+    """
+    # Copy bullets so later edits to the returned narrative can't reach the cache
+    data = {**narrative.to_dict(), "bullets": list(narrative.bullets)}
+    _remember_narrative(key, data)
+    
+    if _narrative_cache_dir is None:
+        return
+    
+    try:
+        fd, tmp_name = tempfile.mkstemp(dir=_narrative_cache_dir, prefix=key, suffix=".tmp")
+    except OSError:
+        return
+    
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(orjson.dumps(data))
+        os.replace(tmp_name, _narrative_cache_dir / f"{key}.json")
+    except OSError:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+
+
+def _get_openai_client(api_key: str) -> Any:
+    """
+    Get the AsyncOpenAI client for this key on the running event loop.
+    
+    Reusing the client keeps its HTTP connections alive between calls.
+    
+    Args:
+        api_key: OpenAI API key
+        
+    Returns:
+        Cached or newly created AsyncOpenAI client
+    """
+    loop = asyncio.get_running_loop()
+    with _llm_clients_lock:
+        clients = _llm_clients.setdefault(loop, {})
+        client = clients.get(("openai", api_key))
+        if client is None:
+            from openai import AsyncOpenAI
+            # Retries are handled by _call_with_retries
+            client = AsyncOpenAI(api_key=api_key, max_retries=0)
+            clients[("openai", api_key)] = client
+    return client
+
+
+def _get_gemini_model(api_key: str, model: str) -> Any:
+    """
+    Get the GenerativeModel for this key and model on the running event loop.
+    
+    genai.configure is only called again when the key or the event loop
+    changes, so the SDK's gRPC channel is reused between calls.
+    
+    Args:
+        api_key: Gemini API key
+        model: Model name
+        
+    Returns:
+        Cached or newly created GenerativeModel
+    """
+    global _gemini_configured
+    import google.generativeai as genai
+    
+    loop = asyncio.get_running_loop()
+    with _llm_clients_lock:
+        if (
+            _gemini_configured is None
+            or _gemini_configured[0] != api_key
+            or _gemini_configured[1]() is not loop
+        ):
+            genai.configure(api_key=api_key)
+            _gemini_configured = (api_key, weakref.ref(loop))
+        
+        clients = _llm_clients.setdefault(loop, {})
+        gemini_model = clients.get(("gemini", api_key, model))
+        if gemini_model is None:
+            gemini_model = genai.GenerativeModel(model)
+            clients[("gemini", api_key, model)] = gemini_model
+    return gemini_model
+
+
+async def close_narrative_clients() -> None:
+    """
+    Close and forget the LLM clients created on the running event loop.
+    
+    Call on application shutdown or test teardown.
+    """
+    global _gemini_configured
+    loop = asyncio.get_running_loop()
+    with _llm_clients_lock:
+        clients = _llm_clients.pop(loop, {})
+        if _gemini_configured is not None and _gemini_configured[1]() is loop:
+            _gemini_configured = None
+    
+    for key, client in clients.items():
+        if key[0] == "openai":
+            await client.close()
+
+
+async def call_openai_stream(
     prompt: str,
     api_key: str,
     model: str = "gpt-4.1-mini"
-) -> str:
+) -> AsyncIterator[str]:
     """
-    Call OpenAI API with the given prompt.
+    Stream an OpenAI completion for the given prompt.
     
     Args:
         prompt: The prompt to send
         api_key: OpenAI API key
         model: Model name to use
         
-    Returns:
-        Raw response content from the model
+    Yields:
+        Text chunks as the model produces them
         
     Raises:
         Exception: If API call fails
@@ -138,9 +479,10 @@ def call_openai(
     
     logger.info(f"Calling OpenAI API with model: {model}")
     
-    client = OpenAI(api_key=api_key)
+    client = _get_openai_client(api_key)
     
-    response = client.chat.completions.create(
+    await _openai_limiter.acquire()
+    stream = await client.chat.completions.create(
         model=model,
         messages=[
             {
@@ -153,30 +495,31 @@ def call_openai(
             }
         ],
         temperature=0.3,  # Lower temperature for more consistent JSON output
-        max_tokens=1000
+        max_tokens=1000,
+        stream=True
     )
     
-    content = response.choices[0].message.content
-    logger.debug(f"OpenAI response: {content[:200]}...")
-    
-    return content
+    async with stream:
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
 
 
-def call_gemini(
+async def call_gemini_stream(
     prompt: str,
     api_key: str,
     model: str = "gemini-2.0-flash"
-) -> str:
+) -> AsyncIterator[str]:
     """
-    Call Google Gemini API with the given prompt.
+    Stream a Google Gemini response for the given prompt.
     
     Args:
         prompt: The prompt to send
         api_key: Gemini API key
         model: Model name to use
         
-    Returns:
-        Raw response content from the model
+    Yields:
+        Text chunks as the model produces them
         
     Raises:
         Exception: If API call fails
@@ -189,22 +532,129 @@ def call_gemini(
     
     logger.info(f"Calling Gemini API with model: {model}")
     
-    # Configure the API
-    genai.configure(api_key=api_key)
+    import google.generativeai as genai
     
-    # Create the model
-    gemini_model = genai.GenerativeModel(model)
+    gemini_model = _get_gemini_model(api_key, model)
     
     # Generate response
-    response = gemini_model.generate_content(
+    await _gemini_limiter.acquire()
+    response = await gemini_model.generate_content_async(
         prompt,
         generation_config=genai.types.GenerationConfig(
             temperature=0.3,
             max_output_tokens=1000,
-        )
+        ),
+        stream=True
     )
     
-    content = response.text
+    async for chunk in response:
+        if chunk.parts:
+            yield chunk.text
+
+
+async def _read_json_stream(chunks: AsyncIterator[str]) -> str:
+    """
+    Accumulate streamed text, stopping once the outer JSON object closes.
+    
+    Braces inside JSON strings are ignored. Anything after the closing
+    brace (such as a trailing markdown fence) is dropped. If the object
+    never closes, the full text is returned for the parser to reject.
+    
+    Args:
+        chunks: Text chunks from a call_*_stream generator
+        
+    Returns:
+        Response text up to and including the closing brace
+    """
+    parts = []
+    depth = 0
+    in_string = False
+    escaped = False
+    
+    async for text in chunks:
+        for i, ch in enumerate(text):
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch == "{":
+                depth += 1
+            elif ch == "}" and depth > 0:
+                depth -= 1
+                if depth == 0:
+                    parts.append(text[:i + 1])
+                    return "".join(parts)
+        parts.append(text)
+    
+    return "".join(parts)
+
+
+async def call_openai(
+    prompt: str,
+    api_key: str,
+    model: str = "gpt-4.1-mini"
+) -> str:
+    """
+    Call OpenAI API with the given prompt.
+    
+    The response is streamed and returned as soon as the JSON object is
+    complete. Rate limits, server and network errors are retried.
+    
+    Args:
+        prompt: The prompt to send
+        api_key: OpenAI API key
+        model: Model name to use
+        
+    Returns:
+        Raw response content from the model
+        
+    Raises:
+        Exception: If API call fails
+    """
+    async def attempt() -> str:
+        async with aclosing(call_openai_stream(prompt, api_key, model)) as chunks:
+            return await _read_json_stream(chunks)
+    
+    content = await _call_with_retries("openai", attempt)
+    
+    logger.debug(f"OpenAI response: {content[:200]}...")
+    
+    return content
+
+
+async def call_gemini(
+    prompt: str,
+    api_key: str,
+    model: str = "gemini-2.0-flash"
+) -> str:
+    """
+    Call Google Gemini API with the given prompt.
+    
+    The response is streamed and returned as soon as the JSON object is
+    complete. Rate limits, server and network errors are retried.
+    
+    Args:
+        prompt: The prompt to send
+        api_key: Gemini API key
+        model: Model name to use
+        
+    Returns:
+        Raw response content from the model
+        
+    Raises:
+        Exception: If API call fails
+    """
+    async def attempt() -> str:
+        async with aclosing(call_gemini_stream(prompt, api_key, model)) as chunks:
+            return await _read_json_stream(chunks)
+    
+    content = await _call_with_retries("gemini", attempt)
+    
     logger.debug(f"Gemini response: {content[:200]}...")
     
     return content
@@ -226,13 +676,15 @@ def parse_llm_response(response: str) -> NarrativeSection:
     # Clean response (remove markdown code blocks if present)
     cleaned = response.strip()
     if cleaned.startswith("```"):
-        # Remove code block markers
-        lines = cleaned.split("\n")
-        cleaned = "\n".join(lines[1:-1] if lines[-1].strip() == "```" else lines[1:])
+        # Remove the opening fence line and the closing fence, if present
+        cleaned = cleaned.partition("\n")[2]
+        body, newline, last_line = cleaned.rpartition("\n")
+        if newline and last_line.strip() == "```":
+            cleaned = body
     
     try:
-        data = json.loads(cleaned)
-    except json.JSONDecodeError as e:
+        data = orjson.loads(cleaned)
+    except orjson.JSONDecodeError as e:
         logger.error(f"Failed to parse LLM response as JSON: {e}")
         raise ValueError(f"Invalid JSON response from LLM: {e}")
     
@@ -254,6 +706,29 @@ def parse_llm_response(response: str) -> NarrativeSection:
     )
 
 
+def _format_bullet(insight: Dict[str, Any]) -> str:
+    """
+    Format one insight as a fallback narrative bullet.
+    
+    Missing fields fall back to neutral defaults so a partial insight
+    still produces a bullet.
+    
+    Args:
+        insight: Insight dictionary from generate_insights
+        
+    Returns:
+        Bullet text
+    """
+    dims = insight.get("dimensions") or {}
+    dim_str = ", ".join(f"{k}={v}" for k, v in dims.items()) if dims else "Overall"
+    
+    return (
+        f"{str(insight.get('metric', 'metric')).upper()} for {dim_str}: "
+        f"{insight.get('current_value', 0):,.2f} → {insight.get('previous_value', 0):,.2f} "
+        f"({insight.get('delta_pct', 0):+.1f}%)"
+    )
+
+
 def generate_fallback_narrative(insights_data: Dict[str, Any]) -> NarrativeSection:
     """
     Generate a fallback narrative without LLM when API is unavailable.
@@ -276,27 +751,16 @@ def generate_fallback_narrative(insights_data: Dict[str, Any]) -> NarrativeSecti
     # Build headline from top mover
     top_mover = summary.get("top_mover")
     if top_mover:
-        direction = "increased" if top_mover["direction"] == "up" else "decreased"
+        direction = "increased" if top_mover.get("direction") == "up" else "decreased"
         headline = (
-            f"Key Finding: {top_mover['metric'].upper()} {direction} by "
-            f"{abs(top_mover['delta_pct']):.1f}% in the current period."
+            f"Key Finding: {str(top_mover.get('metric', 'metric')).upper()} {direction} by "
+            f"{abs(top_mover.get('delta_pct', 0)):.1f}% in the current period."
         )
     else:
         headline = "Performance metrics remained stable across the analysis period."
     
     # Build bullets from top insights
-    bullets = []
-    for i, insight in enumerate(insights[:3]):
-        dims = insight.get("dimensions", {})
-        dim_str = ", ".join(f"{k}={v}" for k, v in dims.items()) if dims else "Overall"
-        direction = "up" if insight["direction"] == "up" else "down"
-        
-        bullet = (
-            f"{insight['metric'].upper()} for {dim_str}: "
-            f"{insight['current_value']:,.2f} → {insight['previous_value']:,.2f} "
-            f"({insight['delta_pct']:+.1f}%)"
-        )
-        bullets.append(bullet)
+    bullets = [_format_bullet(insight) for insight in insights[:3]]
     
     # Pad bullets if needed
     while len(bullets) < 3:
@@ -304,14 +768,14 @@ def generate_fallback_narrative(insights_data: Dict[str, Any]) -> NarrativeSecti
     
     # Build recommendation
     if top_mover:
-        if top_mover["direction"] == "up":
+        if top_mover.get("direction") == "up":
             recommendation = (
-                f"Continue monitoring {top_mover['metric']} performance and identify "
+                f"Continue monitoring {top_mover.get('metric', 'metric')} performance and identify "
                 "factors contributing to the positive trend."
             )
         else:
             recommendation = (
-                f"Investigate the decline in {top_mover['metric']} and implement "
+                f"Investigate the decline in {top_mover.get('metric', 'metric')} and implement "
                 "corrective measures to reverse the trend."
             )
     else:
@@ -325,7 +789,7 @@ def generate_fallback_narrative(insights_data: Dict[str, Any]) -> NarrativeSecti
     )
 
 
-def generate_narrative(
+async def generate_narrative_async(
     insights_data: Dict[str, Any],
     api_key: Optional[str] = None,
     model: str = "gemini-2.0-flash",
@@ -335,8 +799,10 @@ def generate_narrative(
     Main entry point for narrative generation.
     
     This function sends insights to the LLM and returns a structured
-    narrative section. Falls back to auto-generated content if LLM
-    is unavailable.
+    narrative section. If the preferred provider fails, any other
+    configured provider is tried with the same prompt; auto-generated
+    content is used only when none succeeds. The LLM call is awaited,
+    so the event loop stays free while waiting on the provider.
     
     Args:
         insights_data: Dictionary containing insights and config
@@ -353,39 +819,181 @@ def generate_narrative(
     gemini_key = api_key if api_key and api_key.startswith("AIza") else os.getenv("GEMINI_API_KEY", "")
     openai_key = api_key if api_key and api_key.startswith("sk-") else os.getenv("OPENAI_API_KEY", "")
     
-    # Auto-detect provider based on available keys and SDKs
-    if provider == "auto":
-        if gemini_key and GEMINI_AVAILABLE:
-            provider = "gemini"
-        elif openai_key and OPENAI_AVAILABLE:
-            provider = "openai"
-        else:
-            provider = None
+    try:
+        providers_to_try = _order_llm_providers(provider, model, gemini_key, openai_key)
+    except ValueError as e:
+        logger.error(f"{e}")
+        logger.info("Falling back to auto-generated narrative")
+        return generate_fallback_narrative(insights_data)
     
-    if not provider:
+    if not providers_to_try:
         logger.warning("No LLM provider available, using fallback narrative generation")
         return generate_fallback_narrative(insights_data)
     
-    try:
-        # Build prompt
-        prompt = build_llm_prompt(insights_data)
-        logger.debug(f"LLM Prompt length: {len(prompt)} chars")
+    # The prompt doesn't depend on the provider, so build it once and
+    # reuse it if the first provider fails
+    prompt = build_llm_prompt(insights_data)
+    logger.debug(f"LLM Prompt length: {len(prompt)} chars")
+    
+    for llm_provider, llm_key, llm_model in providers_to_try:
+        # Identical prompts get identical narratives without an LLM call
+        cache_key = _narrative_cache_key(prompt, llm_provider, llm_model)
+        cached = _get_cached_narrative(cache_key)
+        if cached is not None:
+            logger.info(f"Using cached narrative from {llm_provider}")
+            return cached
+        
+        try:
+            if llm_provider == "gemini":
+                response = await call_gemini(prompt, llm_key, llm_model)
+            else:
+                response = await call_openai(prompt, llm_key, llm_model)
+            narrative = parse_llm_response(response)
+        except ValueError as e:
+            # The LLM answered, but not with a usable narrative
+            logger.warning(f"{llm_provider} returned an unusable narrative: {e}")
+            continue
+        except Exception as e:
+            # Provider errors reach here only after retries are exhausted
+            logger.warning(f"{llm_provider} narrative generation failed: {e}")
+            continue
+        
+        logger.info(f"Successfully generated narrative from {llm_provider}")
+        _store_cached_narrative(cache_key, narrative)
+        return narrative
+    
+    logger.error("All LLM providers failed to generate a narrative")
+    logger.info("Falling back to auto-generated narrative")
+    return generate_fallback_narrative(insights_data)
+
+
+def _order_llm_providers(
+    provider: str,
+    model: str,
+    gemini_key: str,
+    openai_key: str
+) -> List[Tuple[str, str, str]]:
+    """
+    List the LLM providers to try, in order of preference.
+    
+    The requested provider comes first (Gemini for "auto"), followed by
+    any other provider whose SDK and API key are available. The
+    requested model is used only by the provider it belongs to; other
+    providers get their default model.
+    
+    Args:
+        provider: LLM provider - "gemini", "openai", or "auto"
+        model: Requested model name
+        gemini_key: Gemini API key, empty if not configured
+        openai_key: OpenAI API key, empty if not configured
+        
+    Returns:
+        List of (provider, api_key, model) tuples
         
-        # Call appropriate LLM
-        if provider == "gemini":
-            response = call_gemini(prompt, gemini_key, model if "gemini" in model else "gemini-2.0-flash")
-        elif provider == "openai":
-            response = call_openai(prompt, openai_key, model if "gpt" in model else "gpt-4.1-mini")
+    Raises:
+        ValueError: If provider is not recognised
+    """
+    if provider != "auto" and provider not in DEFAULT_LLM_MODELS:
+        raise ValueError(f"Unknown provider: {provider}")
+    
+    candidates = []
+    if gemini_key and GEMINI_AVAILABLE:
+        candidates.append(("gemini", gemini_key))
+    if openai_key and OPENAI_AVAILABLE:
+        candidates.append(("openai", openai_key))
+    
+    if provider != "auto":
+        candidates.sort(key=lambda candidate: candidate[0] != provider)
+    
+    providers = []
+    for llm_provider, llm_key in candidates:
+        if LLM_MODEL_MARKERS[llm_provider] in model:
+            llm_model = model
         else:
-            raise ValueError(f"Unknown provider: {provider}")
+            llm_model = DEFAULT_LLM_MODELS[llm_provider]
+            if llm_provider == provider:
+                logger.warning(f"Model {model} is not available on {llm_provider}, using {llm_model}")
+        providers.append((llm_provider, llm_key, llm_model))
+    
+    return providers
+
+
+def generate_narrative(
+    insights_data: Dict[str, Any],
+    api_key: Optional[str] = None,
+    model: str = "gemini-2.0-flash",
+    provider: str = "auto"
+) -> NarrativeSection:
+    """
+    Synchronous wrapper around generate_narrative_async.
+    
+    Runs its own event loop, so it must not be called from code that is
+    already running inside one; await generate_narrative_async there.
+    
+    Args:
+        insights_data: Dictionary containing insights and config
+        api_key: API key (optional, uses env var if not provided)
+        model: Model name to use
+        provider: LLM provider - "gemini", "openai", or "auto" (auto-detect)
         
-        # Parse response
-        narrative = parse_llm_response(response)
-        logger.info(f"Successfully generated narrative from {provider}")
+    Returns:
+        NarrativeSection with title, headline, bullets, and recommendation
+    """
+    return asyncio.run(generate_narrative_async(insights_data, api_key, model, provider))
+
+
+async def generate_narratives_async(
+    insights_list: List[Dict[str, Any]],
+    api_key: Optional[str] = None,
+    model: str = "gemini-2.0-flash",
+    provider: str = "auto",
+    qpm: int = DEFAULT_NARRATIVE_QPM
+) -> List[NarrativeSection]:
+    """
+    Generate narratives for several reports concurrently.
+    
+    Request starts are spaced 60/qpm seconds apart and at most
+    ceil(qpm/60) requests are in flight at once. A failure only affects
+    its own report, which gets the fallback narrative.
+    
+    Args:
+        insights_list: One insights_data dictionary per report
+        api_key: API key (optional, uses env var if not provided)
+        model: Model name to use
+        provider: LLM provider - "gemini", "openai", or "auto" (auto-detect)
+        qpm: Maximum requests per minute
         
-        return narrative
+    Returns:
+        NarrativeSection for each report, in input order
+    """
+    logger.info(f"Generating {len(insights_list)} narrative(s) at up to {qpm} requests/minute")
+    
+    semaphore = asyncio.Semaphore(max(1, math.ceil(qpm / 60)))
+    interval = 60 / qpm
+    loop = asyncio.get_running_loop()
+    next_start = loop.time()
+    
+    async def run_one(insights_data: Dict[str, Any]) -> NarrativeSection:
+        nonlocal next_start
+        # Claim the next start slot before sleeping so slots stay ordered
+        start = max(loop.time(), next_start)
+        next_start = start + interval
+        await asyncio.sleep(start - loop.time())
         
-    except Exception as e:
-        logger.error(f"LLM narrative generation failed: {e}")
-        logger.info("Falling back to auto-generated narrative")
-        return generate_fallback_narrative(insights_data)
+        async with semaphore:
+            return await generate_narrative_async(insights_data, api_key, model, provider)
+    
+    results = await asyncio.gather(
+        *(run_one(insights_data) for insights_data in insights_list),
+        return_exceptions=True
+    )
+    
+    narratives = []
+    for insights_data, result in zip(insights_list, results):
+        if isinstance(result, Exception):
+            logger.error(f"Batched narrative generation failed: {result}")
+            narratives.append(generate_fallback_narrative(insights_data))
+        else:
+            narratives.append(result)
+    
+    return narratives
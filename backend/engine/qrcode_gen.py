@@ -6,19 +6,26 @@ allowing users to access live data by scanning the QR code on
 the final slide of the PowerPoint report.
 """
 
+import asyncio
 import io
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional
+from typing import List, Literal, Optional
 import qrcode
 from qrcode.image.styledpil import StyledPilImage
 from qrcode.image.styles.moduledrawers import RoundedModuleDrawer
 from qrcode.image.styles.colormasks import SolidFillColorMask
+from qrcode.image.svg import SvgPathImage
 from PIL import Image
 
 from core.logger import get_logger
 
-logger = get_logger("qrcode_gen")
+logger = get_logger("insight_engine.qrcode_gen")
+
+# Max number of QR codes rendered concurrently by generate_qr_codes_batch
+MAX_QR_WORKERS = os.cpu_count() or 1
 
 
 def generate_dashboard_url(
@@ -47,11 +54,15 @@ def generate_qr_code(
     border: int = 2,
     fill_color: str = "#1a1a2e",
     back_color: str = "#ffffff",
-    logo_path: Optional[str] = None
+    logo_path: Optional[str] = None,
+    output_format: Literal["png", "svg"] = "png"
 ) -> bytes:
     """
     Generate a QR code image for the given URL.
     
+    SVG output is a single vector path, so it skips all pixel work and
+    scales cleanly; size is ignored and logos are not embedded.
+    
     Args:
         url: The URL to encode in the QR code
         output_path: Optional path to save the QR code image
@@ -60,16 +71,34 @@ def generate_qr_code(
         fill_color: Color of the QR code modules (dark parts)
         back_color: Background color of the QR code
         logo_path: Optional path to a logo to embed in the center
+        output_format: Image format, "png" or "svg"
         
     Returns:
-        QR code image as bytes (PNG format)
+        QR code image as bytes (PNG or SVG format)
+        
+    Raises:
+        ValueError: If output_format is not supported
     """
+    if output_format not in ("png", "svg"):
+        raise ValueError(f"Unsupported QR output format: {output_format}")
+    
     logger.info(f"Generating QR code for URL: {url[:50]}...")
     
-    # Create QR code instance
+    if output_format == "svg" and logo_path:
+        logger.warning("Logos are not embedded in SVG QR codes; ignoring logo_path")
+        logo_path = None
+    
+    # A centre logo hides modules, so only pay for high error correction
+    # when one is embedded; medium keeps the matrix smaller otherwise
+    has_logo = bool(logo_path and os.path.exists(logo_path))
+    error_correction = (
+        qrcode.constants.ERROR_CORRECT_H if has_logo else qrcode.constants.ERROR_CORRECT_M
+    )
+    
+    # Create QR code instance; the version is picked to fit the data
     qr = qrcode.QRCode(
-        version=1,  # Auto-size
-        error_correction=qrcode.constants.ERROR_CORRECT_H,  # High error correction for logo
+        version=None,
+        error_correction=error_correction,
         box_size=10,
         border=border,
     )
@@ -78,6 +107,17 @@ def generate_qr_code(
     qr.add_data(url)
     qr.make(fit=True)
     
+    if output_format == "svg":
+        image_factory = _svg_image_factory(fill_color, back_color)
+        qr_data = qr.make_image(image_factory=image_factory).to_string(encoding="UTF-8")
+        return _finish_qr_code(qr_data, output_path)
+    
+    # Render close to the requested size rather than large and scaled down.
+    # The rounded drawer splits each box into two half-box corners, so the
+    # box size must be even or a 1px gap shows between modules
+    total_modules = qr.modules_count + 2 * border
+    qr.box_size = max(2, size // total_modules // 2 * 2)
+    
     # Create styled image
     try:
         img = qr.make_image(
@@ -97,27 +137,30 @@ def generate_qr_code(
     if not isinstance(img, Image.Image):
         img = img.get_image()
     
-    # Resize to desired size
-    img = img.resize((size, size), Image.Resampling.LANCZOS)
+    # Snap to the exact size; nearest-neighbour keeps module edges sharp
+    if img.size != (size, size):
+        img = img.resize((size, size), Image.Resampling.NEAREST)
     
     # Add logo if provided
-    if logo_path and os.path.exists(logo_path):
+    if has_logo:
         img = _add_logo_to_qr(img, logo_path)
     
-    # Save to bytes
+    # Encode once and share the bytes between the file and the return value
     img_bytes = io.BytesIO()
     img.save(img_bytes, format='PNG')
-    img_bytes.seek(0)
-    
-    # Optionally save to file
+    return _finish_qr_code(img_bytes.getvalue(), output_path)
+
+
+def _finish_qr_code(qr_data: bytes, output_path: Optional[str]) -> bytes:
+    """Optionally save encoded QR bytes to a file and return them."""
     if output_path:
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'wb') as f:
-            f.write(img_bytes.getvalue())
+        output_file = Path(output_path)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        output_file.write_bytes(qr_data)
         logger.info(f"QR code saved to: {output_path}")
     
     logger.info("QR code generated successfully")
-    return img_bytes.getvalue()
+    return qr_data
 
 
 def generate_qr_for_dashboard(
@@ -125,7 +168,8 @@ def generate_qr_for_dashboard(
     session_id: str,
     token: str,
     output_path: Optional[str] = None,
-    size: int = 300
+    size: int = 300,
+    output_format: Literal["png", "svg"] = "png"
 ) -> tuple[bytes, str]:
     """
     Generate a QR code for dashboard access.
@@ -139,6 +183,7 @@ def generate_qr_for_dashboard(
         token: Access token for authentication
         output_path: Optional path to save the QR code
         size: Size of the QR code in pixels
+        output_format: Image format, "png" or "svg"
         
     Returns:
         Tuple of (QR code bytes, full dashboard URL)
@@ -150,12 +195,84 @@ def generate_qr_for_dashboard(
     qr_bytes = generate_qr_code(
         url=dashboard_url,
         output_path=output_path,
-        size=size
+        size=size,
+        output_format=output_format
     )
     
     return qr_bytes, dashboard_url
 
 
+def generate_qr_codes_batch(urls: List[str], **kwargs) -> List[bytes]:
+    """
+    Generate QR codes for several URLs on a shared worker pool.
+    
+    Each code is encoded independently: the version and Reed-Solomon
+    blocks depend on the whole payload, so there is no encoder state
+    to share between URLs with a common prefix.
+    
+    Args:
+        urls: URLs to encode, one QR code each
+        **kwargs: Arguments for generate_qr_code (except url and output_path)
+        
+    Returns:
+        QR code images as bytes (PNG format), in the same order as urls
+    """
+    if not urls:
+        return []
+    
+    render = partial(generate_qr_code, **kwargs)
+    if len(urls) == 1 or MAX_QR_WORKERS == 1:
+        return [render(url) for url in urls]
+    
+    # Module drawing is pure Python, but Pillow drops the GIL for the
+    # resize and PNG encode, so those overlap across threads
+    with ThreadPoolExecutor(max_workers=min(MAX_QR_WORKERS, len(urls))) as executor:
+        return list(executor.map(render, urls))
+
+
+async def generate_qr_code_async(**kwargs) -> bytes:
+    """
+    Generate a QR code in a worker thread; see generate_qr_code.
+    
+    Rendering and PNG encoding are CPU-bound Pillow work, so they run
+    off the event loop.
+    
+    Args:
+        **kwargs: Arguments for generate_qr_code
+        
+    Returns:
+        QR code image as bytes (PNG format)
+    """
+    return await asyncio.to_thread(generate_qr_code, **kwargs)
+
+
+async def generate_qr_for_dashboard_async(**kwargs) -> tuple[bytes, str]:
+    """
+    Generate a dashboard QR code in a worker thread; see generate_qr_for_dashboard.
+    
+    Args:
+        **kwargs: Arguments for generate_qr_for_dashboard
+        
+    Returns:
+        Tuple of (QR code bytes, full dashboard URL)
+    """
+    return await asyncio.to_thread(generate_qr_for_dashboard, **kwargs)
+
+
+@lru_cache(maxsize=32)
+def _svg_image_factory(fill_color: str, back_color: str) -> type:
+    """Build an SvgPathImage subclass that draws in the given colors."""
+    return type(
+        "ColoredSvgPathImage",
+        (SvgPathImage,),
+        {
+            "background": back_color,
+            "QR_PATH_STYLE": {**SvgPathImage.QR_PATH_STYLE, "fill": fill_color},
+        },
+    )
+
+
+@lru_cache(maxsize=128)
 def _hex_to_rgb(hex_color: str) -> tuple:
     """Convert hex color to RGB tuple."""
     hex_color = hex_color.lstrip('#')
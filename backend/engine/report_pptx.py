@@ -5,21 +5,22 @@ This module creates downloadable PPTX reports using python-pptx,
 including cover slides, charts, tables, QR codes, and recommendations.
 """
 
+import pptx
 from pptx import Presentation
 from pptx.util import Inches, Pt, Emu
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION
 from pptx.dml.color import RGBColor
-from pptx.chart.data import CategoryChartData
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Union
 from pathlib import Path
-from datetime import datetime
-import uuid
 import sys
 import os
+import heapq
 import io
+import re
 import secrets
+import time
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -51,15 +52,58 @@ CHART_COLORS = [
     RGBColor(220, 53, 69),
 ]
 
+# Index of the blank layout in python-pptx's default template
+BLANK_LAYOUT_INDEX = 6
+
+# (divisor, suffix) pairs for abbreviating stat values, largest first
+_MAGNITUDE_SUFFIXES = ((1_000_000, "M"), (1_000, "K"))
+
+# Session id segment of a dashboard URL (see qrcode_gen.generate_dashboard_url)
+_DASHBOARD_SESSION_RE = re.compile(r'/dashboard/([^?]+)')
+
+# Write buffer size used when saving reports to disk
+SAVE_BUFFER_SIZE = 1 << 20
+
+# python-pptx's built-in default template, read once so each report opens
+# it from memory instead of re-reading the package from disk
+_TEMPLATE_BYTES = (Path(pptx.__file__).parent / "templates" / "default.pptx").read_bytes()
+
 
 def create_presentation() -> Presentation:
     """Create a new PowerPoint presentation with default settings."""
-    prs = Presentation()
+    prs = Presentation(io.BytesIO(_TEMPLATE_BYTES))
     prs.slide_width = Inches(13.333)  # 16:9 widescreen
     prs.slide_height = Inches(7.5)
     return prs
 
 
+def _format_stat_value(value: float) -> str:
+    """Abbreviate a stat value for display, e.g. 1234567 -> "1.2M"."""
+    for divisor, suffix in _MAGNITUDE_SUFFIXES:
+        if value >= divisor:
+            return f"{value / divisor:.1f}{suffix}"
+    return f"{value:.0f}"
+
+
+def _apply_solid_fill(target, rgb: RGBColor) -> None:
+    """Give a shape, cell or chart format a solid fill in the given color."""
+    fill = target.fill
+    fill.solid()
+    fill.fore_color.rgb = rgb
+
+
+def _style_shape(shape, fill_rgb: RGBColor, line_rgb: Optional[RGBColor] = None, line_width=None) -> None:
+    """Fill a shape and give it the given outline, or no outline if line_rgb is None."""
+    _apply_solid_fill(shape, fill_rgb)
+    line = shape.line
+    if line_rgb is None:
+        line.fill.background()
+    else:
+        line.color.rgb = line_rgb
+        if line_width is not None:
+            line.width = line_width
+
+
 def add_header_bar(slide, prs, title: str, color=None):
     """Add a header bar with title to a slide."""
     if color is None:
@@ -70,9 +114,7 @@ def add_header_bar(slide, prs, title: str, color=None):
         Inches(0), Inches(0),
         prs.slide_width, Inches(1.0)
     )
-    header.fill.solid()
-    header.fill.fore_color.rgb = color
-    header.line.fill.background()
+    _style_shape(header, color)
     
     title_box = slide.shapes.add_textbox(
         Inches(0.5), Inches(0.25),
@@ -86,6 +128,13 @@ def add_header_bar(slide, prs, title: str, color=None):
     title_para.font.color.rgb = COLORS["text_light"]
 
 
+def _add_content_slide(prs: Presentation, title: str, color=None):
+    """Add a blank slide with a title header bar and return it."""
+    slide = prs.slides.add_slide(prs.slide_layouts[BLANK_LAYOUT_INDEX])
+    add_header_bar(slide, prs, title, color)
+    return slide
+
+
 def add_cover_slide(
     prs: Presentation,
     title: str = "Automated Insight Engine",
@@ -95,8 +144,7 @@ def add_cover_slide(
     """Add a cover slide to the presentation."""
     logger.debug("Adding cover slide")
     
-    blank_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(blank_layout)
+    slide = prs.slides.add_slide(prs.slide_layouts[BLANK_LAYOUT_INDEX])
     
     # Background
     background = slide.shapes.add_shape(
@@ -104,9 +152,7 @@ def add_cover_slide(
         Inches(0), Inches(0),
         prs.slide_width, prs.slide_height
     )
-    background.fill.solid()
-    background.fill.fore_color.rgb = COLORS["primary"]
-    background.line.fill.background()
+    _style_shape(background, COLORS["primary"])
     
     # Accent bar at top
     accent_bar = slide.shapes.add_shape(
@@ -114,9 +160,7 @@ def add_cover_slide(
         Inches(0), Inches(0),
         prs.slide_width, Inches(0.15)
     )
-    accent_bar.fill.solid()
-    accent_bar.fill.fore_color.rgb = COLORS["accent"]
-    accent_bar.line.fill.background()
+    _style_shape(accent_bar, COLORS["accent"])
     
     # Title
     title_box = slide.shapes.add_textbox(
@@ -146,7 +190,7 @@ def add_cover_slide(
     
     # Date
     if date_str is None:
-        date_str = datetime.now().strftime("%B %d, %Y")
+        date_str = time.strftime("%B %d, %Y")
     
     date_box = slide.shapes.add_textbox(
         Inches(0.5), Inches(6.3),
@@ -181,10 +225,7 @@ def add_executive_summary_slide(
     """Add an executive summary slide with KPI cards."""
     logger.debug("Adding executive summary slide")
     
-    blank_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(blank_layout)
-    
-    add_header_bar(slide, prs, "Executive Summary")
+    slide = _add_content_slide(prs, "Executive Summary")
     
     # Headline box
     headline_box = slide.shapes.add_shape(
@@ -192,10 +233,7 @@ def add_executive_summary_slide(
         Inches(0.5), Inches(1.3),
         Inches(12.333), Inches(1.5)
     )
-    headline_box.fill.solid()
-    headline_box.fill.fore_color.rgb = COLORS["background"]
-    headline_box.line.color.rgb = COLORS["secondary"]
-    headline_box.line.width = Pt(2)
+    _style_shape(headline_box, COLORS["background"], line_rgb=COLORS["secondary"], line_width=Pt(2))
     
     headline_text = slide.shapes.add_textbox(
         Inches(0.8), Inches(1.6),
@@ -225,10 +263,7 @@ def add_executive_summary_slide(
                 Inches(x), Inches(3.2),
                 Inches(card_width), Inches(2.2)
             )
-            card.fill.solid()
-            card.fill.fore_color.rgb = COLORS["text_light"]
-            card.line.color.rgb = COLORS["primary"]
-            card.line.width = Pt(2)
+            _style_shape(card, COLORS["text_light"], line_rgb=COLORS["primary"], line_width=Pt(2))
             
             value_box = slide.shapes.add_textbox(
                 Inches(x + 0.1), Inches(3.5),
@@ -278,9 +313,7 @@ def add_metrics_chart_slide(
     """Add a slide with a bar chart comparing metrics."""
     logger.debug("Adding metrics chart slide")
     
-    blank_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(blank_layout)
-    add_header_bar(slide, prs, title)
+    slide = _add_content_slide(prs, title)
     
     current_metrics = metrics_data.get("current_totals", {})
     previous_metrics = metrics_data.get("previous_totals", {})
@@ -295,15 +328,20 @@ def add_metrics_chart_slide(
         msg_para.alignment = PP_ALIGN.CENTER
         return
     
+    # Chart data pulls in xlsxwriter for the embedded workbook, so it is
+    # only imported once a chart is actually drawn
+    from pptx.chart.data import CategoryChartData
+    
+    # Resolve missing/None values once; they feed both the ranking and the series
     all_metrics = set(current_metrics.keys()) | set(previous_metrics.keys())
-    metric_totals = [(m, (current_metrics.get(m, 0) or 0) + (previous_metrics.get(m, 0) or 0)) for m in all_metrics]
-    metric_totals.sort(key=lambda x: x[1], reverse=True)
-    top_metrics = [m[0] for m in metric_totals[:6]]
+    current_values = {m: current_metrics.get(m, 0) or 0 for m in all_metrics}
+    previous_values = {m: previous_metrics.get(m, 0) or 0 for m in all_metrics}
+    top_metrics = heapq.nlargest(6, all_metrics, key=lambda m: current_values[m] + previous_values[m])
     
     chart_data = CategoryChartData()
     chart_data.categories = top_metrics
-    chart_data.add_series('Current', [current_metrics.get(m, 0) or 0 for m in top_metrics])
-    chart_data.add_series('Previous', [previous_metrics.get(m, 0) or 0 for m in top_metrics])
+    chart_data.add_series('Current', [current_values[m] for m in top_metrics])
+    chart_data.add_series('Previous', [previous_values[m] for m in top_metrics])
     
     chart = slide.shapes.add_chart(
         XL_CHART_TYPE.COLUMN_CLUSTERED, Inches(0.5), Inches(1.4), Inches(12.333), Inches(5.8), chart_data
@@ -314,11 +352,9 @@ def add_metrics_chart_slide(
     
     plot = chart.plots[0]
     if len(plot.series) > 0:
-        plot.series[0].format.fill.solid()
-        plot.series[0].format.fill.fore_color.rgb = COLORS["primary"]
+        _apply_solid_fill(plot.series[0].format, COLORS["primary"])
     if len(plot.series) > 1:
-        plot.series[1].format.fill.solid()
-        plot.series[1].format.fill.fore_color.rgb = COLORS["secondary"]
+        _apply_solid_fill(plot.series[1].format, COLORS["secondary"])
 
 
 def add_dimension_breakdown_chart(
@@ -329,9 +365,7 @@ def add_dimension_breakdown_chart(
     """Add a pie chart showing breakdown by dimension."""
     logger.debug("Adding dimension breakdown chart slide")
     
-    blank_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(blank_layout)
-    add_header_bar(slide, prs, title)
+    slide = _add_content_slide(prs, title)
     
     insights = insights_data.get("insights", [])
     
@@ -349,9 +383,9 @@ def add_dimension_breakdown_chart(
     for insight in insights[:10]:
         dims = insight.get("dimensions", {})
         if dims:
-            first_dim = list(dims.values())[0]
+            first_dim = str(next(iter(dims.values())))
             current_val = insight.get("current_value", 0) or 0
-            dim_data[str(first_dim)] = dim_data.get(str(first_dim), 0) + abs(current_val)
+            dim_data[first_dim] = dim_data.get(first_dim, 0) + abs(current_val)
     
     if not dim_data:
         for insight in insights[:6]:
@@ -359,10 +393,12 @@ def add_dimension_breakdown_chart(
             impact = abs(insight.get("impact_score", 0))
             dim_data[label] = impact
     
-    sorted_dims = sorted(dim_data.items(), key=lambda x: x[1], reverse=True)[:6]
+    sorted_dims = heapq.nlargest(6, dim_data.items(), key=lambda x: x[1])
     if not sorted_dims:
         return
     
+    from pptx.chart.data import CategoryChartData
+    
     chart_data = CategoryChartData()
     chart_data.categories = [d[0] for d in sorted_dims]
     chart_data.add_series('Values', [d[1] for d in sorted_dims])
@@ -376,8 +412,7 @@ def add_dimension_breakdown_chart(
     
     plot = chart.plots[0]
     for i, point in enumerate(plot.series[0].points):
-        point.format.fill.solid()
-        point.format.fill.fore_color.rgb = CHART_COLORS[i % len(CHART_COLORS)]
+        _apply_solid_fill(point.format, CHART_COLORS[i % len(CHART_COLORS)])
 
 
 def add_insights_table_slide(
@@ -391,9 +426,7 @@ def add_insights_table_slide(
     
     logger.debug("Adding insights table slide")
     
-    blank_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(blank_layout)
-    add_header_bar(slide, prs, title)
+    slide = _add_content_slide(prs, title)
     
     num_rows = min(len(insights), 6) + 1
     table = slide.shapes.add_table(num_rows, 4, Inches(0.4), Inches(1.4), Inches(12.5), Inches(5.5)).table
@@ -407,12 +440,12 @@ def add_insights_table_slide(
     for i, h in enumerate(headers):
         cell = table.cell(0, i)
         cell.text = h
-        cell.fill.solid()
-        cell.fill.fore_color.rgb = COLORS["primary"]
+        _apply_solid_fill(cell, COLORS["primary"])
         para = cell.text_frame.paragraphs[0]
-        para.font.size = Pt(14)
-        para.font.bold = True
-        para.font.color.rgb = COLORS["text_light"]
+        font = para.font
+        font.size = Pt(14)
+        font.bold = True
+        font.color.rgb = COLORS["text_light"]
         para.alignment = PP_ALIGN.CENTER
     
     for row_idx, insight in enumerate(insights[:6]):
@@ -425,6 +458,7 @@ def add_insights_table_slide(
         
         arrow = "↑" if direction == "up" else "↓" if direction == "down" else "→"
         change_str = f"{arrow} {delta_pct:+.1f}%"
+        change_color = COLORS["success"] if direction == "up" else COLORS["danger"] if direction == "down" else COLORS["text_dark"]
         impact_str = f"{'█' * min(int(impact * 5), 10)} {impact:.2f}"
         
         row_data = [dim_str, metric.upper(), change_str, impact_str]
@@ -432,45 +466,41 @@ def add_insights_table_slide(
             cell = table.cell(row_idx + 1, col_idx)
             cell.text = value
             if row_idx % 2 == 0:
-                cell.fill.solid()
-                cell.fill.fore_color.rgb = COLORS["background"]
-            para = cell.text_frame.paragraphs[0]
-            para.font.size = Pt(11)
+                _apply_solid_fill(cell, COLORS["background"])
+            # Each .font access re-resolves the run properties, so fetch it once
+            font = cell.text_frame.paragraphs[0].font
+            font.size = Pt(11)
             if col_idx == 2:
-                para.font.color.rgb = COLORS["success"] if direction == "up" else COLORS["danger"] if direction == "down" else COLORS["text_dark"]
-                para.font.bold = True
+                font.color.rgb = change_color
+                font.bold = True
 
 
 def add_bullet_slide(prs: Presentation, bullets: List[str], title: str = "Detailed Insights") -> None:
     """Add a slide with bullet points."""
-    blank_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(blank_layout)
-    add_header_bar(slide, prs, title)
+    slide = _add_content_slide(prs, title)
     
     bullet_box = slide.shapes.add_textbox(Inches(0.8), Inches(1.5), Inches(11.733), Inches(5.5))
     bullet_frame = bullet_box.text_frame
     bullet_frame.word_wrap = True
     
+    font_size = Pt(18)
+    spacing = Pt(14)
     for i, text in enumerate(bullets):
         para = bullet_frame.paragraphs[0] if i == 0 else bullet_frame.add_paragraph()
         para.text = f"• {text}"
-        para.font.size = Pt(18)
-        para.font.color.rgb = COLORS["text_dark"]
-        para.space_before = Pt(14)
-        para.space_after = Pt(14)
+        font = para.font
+        font.size = font_size
+        font.color.rgb = COLORS["text_dark"]
+        para.space_before = spacing
+        para.space_after = spacing
 
 
 def add_recommendation_slide(prs: Presentation, recommendation: str, title: str = "Recommendation") -> None:
     """Add a recommendation slide."""
-    blank_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(blank_layout)
-    add_header_bar(slide, prs, title, COLORS["accent"])
+    slide = _add_content_slide(prs, title, COLORS["accent"])
     
     box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, Inches(1), Inches(2), Inches(11.333), Inches(3))
-    box.fill.solid()
-    box.fill.fore_color.rgb = COLORS["background"]
-    box.line.color.rgb = COLORS["accent"]
-    box.line.width = Pt(4)
+    _style_shape(box, COLORS["background"], line_rgb=COLORS["accent"], line_width=Pt(4))
     
     icon = slide.shapes.add_textbox(Inches(5.5), Inches(2.3), Inches(2), Inches(0.8))
     icon.text_frame.paragraphs[0].text = "💡"
@@ -489,7 +519,7 @@ def add_qr_code_slide(
     prs: Presentation, 
     session_id: str, 
     base_url: str = "http://localhost:8000",
-    qr_image_path: Optional[str] = None,
+    qr_image_path: Optional[Union[str, Path]] = None,
     dashboard_url: Optional[str] = None
 ) -> str:
     """Add a slide with QR code for dashboard access."""
@@ -497,17 +527,22 @@ def add_qr_code_slide(
     
     from engine.qrcode_gen import generate_qr_for_dashboard
     
-    blank_layout = prs.slide_layouts[6]
-    slide = prs.slides.add_slide(blank_layout)
-    add_header_bar(slide, prs, "🎯 Access Live Dashboard", COLORS["primary"])
+    slide = _add_content_slide(prs, "🎯 Access Live Dashboard", COLORS["primary"])
     
-    # Use pre-generated QR code if available
-    if qr_image_path and Path(qr_image_path).exists():
-        qr_path = qr_image_path
-        # Use provided dashboard_url or construct a basic one
-        if not dashboard_url:
-            dashboard_url = f"{base_url}/dashboard/{session_id}"
-    else:
+    # Use pre-generated QR code if available; reading it directly covers
+    # the existence check, since add_picture would read it anyway
+    qr_image = None
+    if qr_image_path:
+        try:
+            qr_image = io.BytesIO(Path(qr_image_path).read_bytes())
+        except FileNotFoundError:
+            logger.warning(f"QR image not found at {qr_image_path}, generating a new one")
+        else:
+            # Use provided dashboard_url or construct a basic one
+            if not dashboard_url:
+                dashboard_url = f"{base_url}/dashboard/{session_id}"
+    
+    if qr_image is None:
         # Generate new QR code with new token
         token = secrets.token_urlsafe(32)
         qr_bytes, dashboard_url = generate_qr_for_dashboard(
@@ -516,15 +551,11 @@ def add_qr_code_slide(
             token=token, 
             size=400
         )
-        
-        qr_path = Path("tmp") / f"qr_{session_id}.png"
-        qr_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(qr_path, 'wb') as f:
-            f.write(qr_bytes)
-        qr_path = str(qr_path)
+        # Embed the fresh PNG straight from memory; it is not needed on disk
+        qr_image = io.BytesIO(qr_bytes)
     
     # Add QR code image
-    slide.shapes.add_picture(str(qr_path), Inches(4.7), Inches(1.5), Inches(4), Inches(4))
+    slide.shapes.add_picture(qr_image, Inches(4.7), Inches(1.5), Inches(4), Inches(4))
     
     # Instruction text
     instr = slide.shapes.add_textbox(Inches(1), Inches(5.7), Inches(11.333), Inches(0.6))
@@ -573,7 +604,7 @@ def build_report(
     
     # Generate session ID if not provided
     if not session_id:
-        session_id = str(uuid.uuid4())[:12]
+        session_id = secrets.token_hex(6)
     
     # 1. Cover
     add_cover_slide(prs, title=narrative.title, subtitle=subtitle)
@@ -587,8 +618,7 @@ def build_report(
         delta = insight.get("delta_pct", 0)
         direction = insight.get("direction", "flat")
         trend = f"↑ +{delta:.1f}%" if direction == "up" else f"↓ {delta:.1f}%" if direction == "down" else f"→ {delta:.1f}%"
-        value_str = f"{current/1000000:.1f}M" if current >= 1000000 else f"{current/1000:.1f}K" if current >= 1000 else f"{current:.0f}"
-        key_stats.append((metric, value_str, trend))
+        key_stats.append((metric, _format_stat_value(current), trend))
     add_executive_summary_slide(prs, headline=narrative.headline, key_stats=key_stats)
     
     # 3-4. Charts
@@ -616,12 +646,15 @@ def build_report(
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     if filename is None:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        unique_id = str(uuid.uuid4())[:8]
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        unique_id = secrets.token_hex(4)
         filename = f"insight_report_{timestamp}_{unique_id}.pptx"
     
     full_path = output_path / filename
-    prs.save(str(full_path))
+    # A large write buffer lets the zip writer stream parts to disk in
+    # big chunks instead of many small writes
+    with open(full_path, "wb", buffering=SAVE_BUFFER_SIZE) as f:
+        prs.save(f)
     logger.info(f"Report saved to: {full_path}")
     return str(full_path)
 
@@ -650,15 +683,14 @@ def generate_report(
     session_id = None
     if dashboard_url:
         # URL format: http://localhost:8000/dashboard/SESSION_ID?token=...
-        import re
-        match = re.search(r'/dashboard/([^?]+)', dashboard_url)
+        match = _DASHBOARD_SESSION_RE.search(dashboard_url)
         if match:
             session_id = match.group(1)
     
     # Always include QR code - generate session ID if not present
     include_qr = True
     if not session_id:
-        session_id = str(uuid.uuid4())[:12]
+        session_id = secrets.token_hex(6)
     
     return build_report(
         narrative, 
@@ -5,18 +5,39 @@ This module handles the storage and retrieval of dashboard session data,
 allowing users to access report insights via QR code.
 """
 
-import json
+import base64
+import os
 import secrets
 import hashlib
+import heapq
+import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, Optional, List, Tuple
+from dataclasses import dataclass
 import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+import orjson
 
 from core.logger import get_logger
 
-logger = get_logger("session_manager")
+logger = get_logger("insight_engine.session_manager")
+
+# Storage directory used when none is given
+DEFAULT_SESSION_DIR = "tmp/sessions"
+
+# Bytes read from the head of a session file to find expires_at. It is
+# the fourth field, ahead of the large insights/narrative payload
+SESSION_HEADER_BYTES = 512
+
+# Random bytes behind each session id and access token
+SESSION_ID_BYTES = 16
+SESSION_TOKEN_BYTES = 32
+
+# Max number of sessions kept in memory by SessionManager
+SESSION_CACHE_SIZE = 1024
 
 
 @dataclass
@@ -33,9 +54,16 @@ class DashboardSession:
     audio_url: Optional[str] = None
     qr_code_path: Optional[str] = None
     
+    def __post_init__(self):
+        # Parsed once here rather than on every is_expired() call. A plain
+        # attribute rather than a field, so to_dict and orjson both skip it
+        self._expires_dt = datetime.fromisoformat(self.expires_at)
+    
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return asdict(self)
+        """Convert to dictionary (shallow: nested insights/narrative are shared)."""
+        data = self.__dict__.copy()
+        data.pop("_expires_dt", None)
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "DashboardSession":
@@ -44,49 +72,78 @@ class DashboardSession:
     
     def is_expired(self) -> bool:
         """Check if session has expired."""
-        expires = datetime.fromisoformat(self.expires_at)
-        return datetime.now() > expires
+        return datetime.now() > self._expires_dt
+
+
+def _urlsafe_token(raw: bytes) -> str:
+    """Encode random bytes as an unpadded URL-safe base64 token."""
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _read_expires_at(session_file: Path) -> datetime:
+    """
+    Read a session file's expiry without parsing the whole document.
+    
+    Args:
+        session_file: Path to a session JSON file
+        
+    Returns:
+        The session's expiry time
+    """
+    with open(session_file, 'rb') as f:
+        head = f.read(SESSION_HEADER_BYTES)
+    
+    # expires_at is written before any free-text field, so the first
+    # match is the key itself; fall back to a full parse otherwise
+    end = -1
+    key = head.find(b'"expires_at"')
+    colon = head.find(b':', key) if key >= 0 else -1
+    start = head.find(b'"', colon) if colon >= 0 else -1
+    if start >= 0:
+        end = head.find(b'"', start + 1)
+    if end < 0:
+        data = orjson.loads(session_file.read_bytes())
+        return datetime.fromisoformat(data["expires_at"])
+    return datetime.fromisoformat(head[start + 1:end].decode())
 
 
 class SessionManager:
     """
     Manages dashboard sessions with file-based storage.
     
+    Use get_session_manager to share one manager per storage directory.
     Sessions are stored as JSON files in the sessions directory,
-    with automatic cleanup of expired sessions.
+    with automatic cleanup of expired sessions. Expiry times are kept
+    in an in-memory min-heap, so cleanup only touches sessions that
+    have actually expired. The session cache and session file writes
+    are guarded by one lock, so a manager can be shared across threads.
     """
     
-    _instance = None
-    _lock = threading.Lock()
-    _current_storage_dir = None
-    
-    def __new__(cls, storage_dir: str = "tmp/sessions"):
-        """Singleton pattern for session manager."""
-        # If storage_dir changed, reset the instance
-        if cls._instance is not None and cls._current_storage_dir != storage_dir:
-            cls._instance = None
-            cls._current_storage_dir = None
-        
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
-                    cls._current_storage_dir = storage_dir
-        return cls._instance
-    
-    def __init__(self, storage_dir: str = "tmp/sessions"):
+    def __init__(self, storage_dir: str = DEFAULT_SESSION_DIR):
         """Initialize the session manager."""
-        if self._initialized and str(self.storage_dir) == storage_dir:
-            return
-        
         self.storage_dir = Path(storage_dir)
         self.storage_dir.mkdir(parents=True, exist_ok=True)
-        self._cache: Dict[str, DashboardSession] = {}
-        self._initialized = True
+        # LRU of session_id -> (file mtime_ns when cached, session)
+        self._cache: "OrderedDict[str, Tuple[int, DashboardSession]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # (expiry timestamp, session_id), earliest expiry first
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._expiry_lock = threading.Lock()
+        self._index_existing_sessions()
         
         logger.info(f"Session manager initialized. Storage: {self.storage_dir}")
     
+    def _index_existing_sessions(self) -> None:
+        """Load expiry times of sessions already on disk into the expiry heap."""
+        for session_file in self.storage_dir.glob("*.json"):
+            try:
+                expires_at = _read_expires_at(session_file)
+            except Exception as e:
+                logger.warning(f"Error indexing session file {session_file}: {e}")
+                continue
+            self._expiry_heap.append((expires_at.timestamp(), session_file.stem))
+        heapq.heapify(self._expiry_heap)
+    
     def create_session(
         self,
         title: str,
@@ -108,9 +165,11 @@ class SessionManager:
         Returns:
             Created DashboardSession
         """
-        # Generate unique session ID and secure token
-        session_id = secrets.token_urlsafe(16)
-        token = secrets.token_urlsafe(32)
+        # Generate unique session ID and secure token from a single read
+        # of the OS CSPRNG; same lengths as token_urlsafe(16) / (32)
+        raw = secrets.token_bytes(SESSION_ID_BYTES + SESSION_TOKEN_BYTES)
+        session_id = _urlsafe_token(raw[:SESSION_ID_BYTES])
+        token = _urlsafe_token(raw[SESSION_ID_BYTES:])
         
         # Calculate expiry
         now = datetime.now()
@@ -129,8 +188,10 @@ class SessionManager:
         )
         
         # Save session
-        self._save_session(session)
-        self._cache[session_id] = session
+        with self._cache_lock:
+            self._remember_session(session, self._save_session(session))
+        with self._expiry_lock:
+            heapq.heappush(self._expiry_heap, (expires_at.timestamp(), session_id))
         
         logger.info(f"Created session {session_id}, expires at {expires_at}")
         return session
@@ -146,47 +207,43 @@ class SessionManager:
         Returns:
             DashboardSession if found and valid, None otherwise
         """
-        # Check cache first
-        if session_id in self._cache:
-            session = self._cache[session_id]
-            if session.is_expired():
-                self.delete_session(session_id)
-                return None
-            if token and session.token != token:
-                logger.warning(f"Token mismatch for session {session_id}")
+        session_file = self.storage_dir / f"{session_id}.json"
+        with self._cache_lock:
+            try:
+                mtime_ns = session_file.stat().st_mtime_ns
+            except FileNotFoundError:
+                self._cache.pop(session_id, None)
                 return None
-            return session
+            
+            # Reuse the cached session unless the file changed since it was read
+            cached = self._cache.get(session_id)
+            if cached is not None and cached[0] == mtime_ns:
+                self._cache.move_to_end(session_id)
+                session = cached[1]
+            else:
+                try:
+                    data = orjson.loads(session_file.read_bytes())
+                    session = DashboardSession.from_dict(data)
+                except Exception as e:
+                    logger.error(f"Failed to load session {session_id}: {e}")
+                    return None
+                self._remember_session(session, mtime_ns)
         
-        # Load from file
-        session_file = self.storage_dir / f"{session_id}.json"
-        if not session_file.exists():
+        if session.is_expired():
+            self.delete_session(session_id)
             return None
         
-        try:
-            with open(session_file, 'r') as f:
-                data = json.load(f)
-            session = DashboardSession.from_dict(data)
-            
-            if session.is_expired():
-                self.delete_session(session_id)
-                return None
-            
-            if token and session.token != token:
-                logger.warning(f"Token mismatch for session {session_id}")
-                return None
-            
-            self._cache[session_id] = session
-            return session
-            
-        except Exception as e:
-            logger.error(f"Failed to load session {session_id}: {e}")
+        if token and session.token != token:
+            logger.warning(f"Token mismatch for session {session_id}")
             return None
+        
+        return session
     
     def update_session(self, session: DashboardSession) -> bool:
         """Update an existing session."""
         try:
-            self._save_session(session)
-            self._cache[session.session_id] = session
+            with self._cache_lock:
+                self._remember_session(session, self._save_session(session))
             return True
         except Exception as e:
             logger.error(f"Failed to update session: {e}")
@@ -196,11 +253,9 @@ class SessionManager:
         """Delete a session."""
         try:
             session_file = self.storage_dir / f"{session_id}.json"
-            if session_file.exists():
-                session_file.unlink()
-            
-            if session_id in self._cache:
-                del self._cache[session_id]
+            with self._cache_lock:
+                session_file.unlink(missing_ok=True)
+                self._cache.pop(session_id, None)
             
             logger.info(f"Deleted session {session_id}")
             return True
@@ -212,38 +267,82 @@ class SessionManager:
         """
         Remove all expired sessions.
         
+        Only sessions whose expiry has passed are touched; session files
+        are not opened. Sessions written to the storage directory by
+        another process after startup are not tracked.
+        
         Returns:
             Number of sessions cleaned up
         """
+        now = datetime.now().timestamp()
+        expired = []
+        with self._expiry_lock:
+            while self._expiry_heap and self._expiry_heap[0][0] < now:
+                expired.append(heapq.heappop(self._expiry_heap)[1])
+        
         count = 0
-        for session_file in self.storage_dir.glob("*.json"):
-            try:
-                with open(session_file, 'r') as f:
-                    data = json.load(f)
-                session = DashboardSession.from_dict(data)
-                
-                if session.is_expired():
-                    self.delete_session(session.session_id)
-                    count += 1
-            except Exception as e:
-                logger.warning(f"Error checking session file {session_file}: {e}")
+        for session_id in expired:
+            # Sessions found expired in get_session are already gone
+            session_file = self.storage_dir / f"{session_id}.json"
+            if session_id not in self._cache and not session_file.exists():
+                continue
+            if self.delete_session(session_id):
+                count += 1
         
         logger.info(f"Cleaned up {count} expired sessions")
         return count
     
-    def _save_session(self, session: DashboardSession) -> None:
-        """Save session to file."""
+    def _remember_session(self, session: DashboardSession, mtime_ns: int) -> None:
+        """
+        Cache a session as most recently used, evicting the oldest beyond SESSION_CACHE_SIZE.
+        
+        Callers must hold _cache_lock.
+        """
+        self._cache[session.session_id] = (mtime_ns, session)
+        self._cache.move_to_end(session.session_id)
+        while len(self._cache) > SESSION_CACHE_SIZE:
+            self._cache.popitem(last=False)
+    
+    def _save_session(self, session: DashboardSession) -> int:
+        """
+        Atomically save a session to file.
+        
+        The JSON is written to a temporary file that then replaces the
+        session file, so readers never see a partially written session.
+        Callers must hold _cache_lock.
+        
+        Args:
+            session: Session to save
+            
+        Returns:
+            The saved file's mtime in nanoseconds
+        """
         session_file = self.storage_dir / f"{session.session_id}.json"
-        with open(session_file, 'w') as f:
-            json.dump(session.to_dict(), f, indent=2)
+        fd, tmp_name = tempfile.mkstemp(dir=self.storage_dir, prefix=session.session_id, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                # orjson serializes the dataclass directly, without an asdict copy
+                f.write(orjson.dumps(session, option=orjson.OPT_NON_STR_KEYS))
+                f.flush()
+                # Taken from the written file itself, so it can't pick up a later write
+                mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+            os.replace(tmp_name, session_file)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return mtime_ns
+
+
+@lru_cache(maxsize=None)
+def _get_manager(storage_dir: str) -> SessionManager:
+    """Create the shared session manager for a storage directory."""
+    return SessionManager(storage_dir)
 
 
 # Global instance getter
 def get_session_manager(storage_dir: Optional[str] = None) -> SessionManager:
-    """Get the global session manager instance."""
-    if storage_dir:
-        return SessionManager(storage_dir)
-    return SessionManager()
+    """Get the shared session manager for a storage directory (default tmp/sessions)."""
+    return _get_manager(storage_dir or DEFAULT_SESSION_DIR)
 
 
 # Test function
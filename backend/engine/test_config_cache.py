@@ -0,0 +1,132 @@
+"""
+Tests for the load_config cache.
+
+This script tests:
+1. Reusing the cached config while the YAML file is unchanged
+2. Invalidating the cache when the YAML file changes
+3. Invalidating the cache when the config schema version changes
+4. Discarding cache entries that were edited by hand
+5. Skipping a cache directory other users can write to
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tempfile
+from pathlib import Path
+
+import orjson
+
+from core import config as config_module
+from core.config import InsightConfig, load_config
+
+
+CONFIG_TEMPLATE = """
+dataset:
+  primary_source: clicks
+  sources:
+    clicks:
+      type: csv
+      path: data/clicks.csv
+      date_col: date
+      dimensions: [campaign]
+      metrics: [clicks]
+report:
+  primary_date_col: date
+  kpi_priority: [{kpi}]
+  comparison:
+    current_start: "2025-11-24"
+    current_end: "2025-11-30"
+    previous_start: "2025-11-17"
+    previous_end: "2025-11-23"
+"""
+
+
+def _write_config(path: Path, kpi: str, mtime_offset_ns: int = 0) -> None:
+    """Write a config YAML, optionally moving its mtime forward."""
+    path.write_text(CONFIG_TEMPLATE.format(kpi=kpi))
+    if mtime_offset_ns:
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + mtime_offset_ns))
+
+
+def test_config_cache_invalidation(monkeypatch):
+    """The cache is reused while current and rebuilt when the YAML or schema changes."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_dir = Path(tmp_dir) / "cache"
+        monkeypatch.setattr(config_module, "CONFIG_CACHE_DIR", cache_dir)
+        config_path = Path(tmp_dir) / "config.yaml"
+        _write_config(config_path, "first")
+        
+        assert load_config(str(config_path)).report.kpi_priority == ["first"]
+        cache_files = list(cache_dir.iterdir())
+        assert len(cache_files) == 1
+        # Nothing is written next to the user's config
+        assert sorted(p.name for p in Path(tmp_dir).iterdir()) == ["cache", "config.yaml"]
+        
+        # An edited cache entry never wins over the YAML
+        cached = orjson.loads(cache_files[0].read_bytes())
+        cached["data"]["report"]["kpi_priority"] = ["from_cache"]
+        cache_files[0].write_bytes(orjson.dumps(cached))
+        assert load_config(str(config_path)).report.kpi_priority == ["first"]
+        
+        # Changing the YAML invalidates the entry
+        _write_config(config_path, "second", mtime_offset_ns=1_000_000_000)
+        assert load_config(str(config_path)).report.kpi_priority == ["second"]
+        
+        # So does a new schema version, even with the YAML unchanged
+        cached = orjson.loads(cache_files[0].read_bytes())
+        cached["data"]["report"]["kpi_priority"] = ["stale_schema"]
+        cache_files[0].write_bytes(orjson.dumps(cached))
+        monkeypatch.setattr(config_module, "_config_schema_version", lambda: "new-schema")
+        assert load_config(str(config_path)).report.kpi_priority == ["second"]
+
+
+def test_edited_cache_entry_is_discarded(monkeypatch):
+    """Only untouched entries are used; an edited one falls back to the YAML."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_dir = Path(tmp_dir) / "cache"
+        monkeypatch.setattr(config_module, "CONFIG_CACHE_DIR", cache_dir)
+        config_path = Path(tmp_dir) / "config.yaml"
+        _write_config(config_path, "first")
+        load_config(str(config_path))
+        cache_file = next(cache_dir.iterdir())
+        
+        trusted = []
+        original = InsightConfig.from_trusted_dict.__func__
+        monkeypatch.setattr(
+            InsightConfig, "from_trusted_dict",
+            classmethod(lambda cls, data: trusted.append(data) or original(cls, data))
+        )
+        
+        # An untouched entry takes the trusted path
+        assert load_config(str(config_path)).report.kpi_priority == ["first"]
+        assert len(trusted) == 1
+        
+        # An edited entry is discarded and the YAML parsed again
+        cached = orjson.loads(cache_file.read_bytes())
+        cached["data"]["report"]["comparison"]["current_start"] = "not-a-date"
+        cache_file.write_bytes(orjson.dumps(cached))
+        config = load_config(str(config_path))
+        assert config.report.comparison.current_start == "2025-11-24"
+        assert len(trusted) == 1
+
+
+def test_shared_cache_dir_is_skipped(monkeypatch):
+    """A cache directory other users can write to is neither read nor written."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_dir = Path(tmp_dir) / "cache"
+        monkeypatch.setattr(config_module, "CONFIG_CACHE_DIR", cache_dir)
+        config_path = Path(tmp_dir) / "config.yaml"
+        _write_config(config_path, "first")
+        
+        load_config(str(config_path))
+        assert cache_dir.stat().st_mode & 0o777 == 0o700
+        assert len(list(cache_dir.iterdir())) == 1
+        
+        for cache_file in cache_dir.iterdir():
+            cache_file.unlink()
+        cache_dir.chmod(0o777)
+        assert load_config(str(config_path)).report.kpi_priority == ["first"]
+        assert not list(cache_dir.iterdir())
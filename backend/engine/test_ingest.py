@@ -12,34 +12,23 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import sqlite3
+import tempfile
 import polars as pl
 from pathlib import Path
 
+# Scratch directory for the test database, removed when the run exits
+_TEST_DB_DIR = tempfile.TemporaryDirectory(prefix="insight_engine_test_")
+_test_db_path = None
+
 
 def create_test_database():
-    """Create a SQLite test database with sample data."""
-    # Use absolute path
-    base_dir = Path(__file__).parent.parent.parent
-    db_path = base_dir / "data" / "test_conversions.db"
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    # Remove existing database
-    if db_path.exists():
-        db_path.unlink()
-    
-    conn = sqlite3.connect(str(db_path))
-    cursor = conn.cursor()
+    """Create a SQLite test database with sample data, once per test run."""
+    global _test_db_path
+    if _test_db_path is not None:
+        return _test_db_path
     
-    # Create conversions table
-    cursor.execute('''
-        CREATE TABLE conversions (
-            date TEXT,
-            campaign TEXT,
-            geo TEXT,
-            conversions INTEGER,
-            revenue REAL
-        )
-    ''')
+    # Built fresh in a temporary directory, never under data/
+    db_path = Path(_TEST_DB_DIR.name) / "test_conversions.db"
     
     # Insert sample data matching clicks.csv structure
     sample_data = [
@@ -83,6 +72,22 @@ def create_test_database():
         ('2025-11-30', 'Retargeting', 'UK', 65, 3250.0),
     ]
     
+    conn = sqlite3.connect(str(db_path))
+    # Throwaway fixture: no need for a rollback journal or fsyncs
+    conn.executescript("PRAGMA journal_mode=MEMORY; PRAGMA synchronous=OFF;")
+    cursor = conn.cursor()
+    
+    # Create conversions table
+    cursor.execute('''
+        CREATE TABLE conversions (
+            date TEXT,
+            campaign TEXT,
+            geo TEXT,
+            conversions INTEGER,
+            revenue REAL
+        )
+    ''')
+    
     cursor.executemany('''
         INSERT INTO conversions (date, campaign, geo, conversions, revenue)
         VALUES (?, ?, ?, ?, ?)
@@ -92,7 +97,8 @@ def create_test_database():
     conn.close()
     
     print(f"Created test database: {db_path}")
-    return str(db_path)
+    _test_db_path = str(db_path)
+    return _test_db_path
 
 
 def test_csv_source():
@@ -160,8 +166,7 @@ def test_database_source():
     from engine.ingest import load_database_source
     from core.config import SourceConfig, DatabaseConnectionConfig
     
-    base_dir = Path(__file__).parent.parent.parent
-    db_path = str(base_dir / "data" / "test_conversions.db").replace("\\", "/")
+    db_path = create_test_database().replace("\\", "/")
     
     config = SourceConfig(
         type="database",
@@ -192,7 +197,7 @@ def test_multi_source_config():
     from engine.ingest import load_all_sources
     
     base_dir = Path(__file__).parent.parent.parent
-    db_path = str(base_dir / "data" / "test_conversions.db").replace("\\", "/")
+    db_path = create_test_database().replace("\\", "/")
     
     config_yaml = f"""
 dataset:
@@ -248,7 +253,7 @@ report:
     - cpc
     - impressions
 """
-    
+
     config = load_config_from_string(config_yaml)
     print(f"✅ Parsed config with {len(config.dataset.sources)} sources")
     
@@ -260,6 +265,111 @@ report:
     return True
 
 
+def test_csv_keeps_pipeline_columns():
+    """Test CSV projection keeps columns used by the report but not listed by the source."""
+    print("\n" + "="*50)
+    print("TEST 5: CSV Projection Keeps Pipeline Columns")
+    print("="*50)
+    
+    from core.config import load_config_from_string
+    from engine.ingest import ingest_data
+    from engine.metrics import process_metrics
+    
+    base_dir = Path(__file__).parent.parent.parent
+    
+    # spend is only a formula operand and geo only a report dimension
+    config = load_config_from_string("""
+dataset:
+  primary_source: clicks
+  sources:
+    clicks:
+      type: csv
+      path: "data/clicks.csv"
+      date_col: "date"
+      dimensions: [campaign]
+      metrics: [clicks, impressions]
+derived_metrics:
+  cpc: "spend / clicks"
+report:
+  primary_date_col: "date"
+  primary_dims: [campaign, geo]
+  kpi_priority: [clicks, cpc]
+  comparison:
+    current_start: "2025-11-24"
+    current_end: "2025-11-30"
+    previous_start: "2025-11-17"
+    previous_end: "2025-11-23"
+""")
+
+    df = ingest_data(config, base_path=str(base_dir))
+    assert {"spend", "geo"}.issubset(df.columns)
+    
+    period_df = process_metrics(df, config)
+    assert {"geo", "cpc_current", "cpc_previous"}.issubset(period_df.columns)
+    print(f"✅ Processed metrics: {period_df.shape}")
+    return True
+
+
+def test_duckdb_join_many_sources():
+    """Test DuckDB joins with more sources than fit in one batch, run concurrently."""
+    print("\n" + "="*50)
+    print("TEST 6: DuckDB Join With Many Sources")
+    print("="*50)
+    
+    from concurrent.futures import ThreadPoolExecutor
+    from core.config import load_config_from_string
+    from engine.ingest import join_sources_duckdb
+    
+    source_names = [f"source_{i}" for i in range(10)]
+    source_yaml = "".join(
+        f"""
+    {name}:
+      type: csv
+      path: "data/{name}.csv"
+      date_col: "date"
+      dimensions: [campaign]
+      metrics: [{name}_clicks]"""
+        for name in source_names
+    )
+    config = load_config_from_string(f"""
+dataset:
+  primary_source: source_0
+  sources:{source_yaml}
+report:
+  primary_date_col: "date"
+  primary_dims: [campaign]
+  kpi_priority: [source_0_clicks]
+  comparison:
+    current_start: "2025-11-24"
+    current_end: "2025-11-30"
+    previous_start: "2025-11-17"
+    previous_end: "2025-11-23"
+""")
+
+    def make_sources(offset):
+        return {
+            name: pl.DataFrame({
+                "date": ["2025-11-24", "2025-11-25"],
+                "campaign": ["Brand", "Search"],
+                f"{name}_clicks": [i + offset, i + offset + 1],
+            })
+            for i, name in enumerate(source_names)
+        }
+    
+    # Two joins at once with the same source names must not see each other's tables
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(
+            lambda offset: join_sources_duckdb(make_sources(offset), config), [0, 100]
+        ))
+    
+    for offset, result in zip([0, 100], results):
+        assert result.shape == (2, 12)
+        result = result.sort("campaign")
+        assert result["source_9_clicks"].to_list() == [9 + offset, 10 + offset]
+    print(f"✅ Joined {len(source_names)} sources: {results[0].shape}")
+    return True
+
+
 def run_all_tests():
     """Run all ingestion tests."""
     print("\n" + "#"*60)
@@ -294,6 +404,18 @@ def run_all_tests():
         traceback.print_exc()
         results.append(("Multi-Source Config", False))
     
+    try:
+        results.append(("CSV Pipeline Columns", test_csv_keeps_pipeline_columns()))
+    except Exception as e:
+        print(f"❌ CSV Pipeline Columns failed: {e}")
+        results.append(("CSV Pipeline Columns", False))
+    
+    try:
+        results.append(("DuckDB Many Sources", test_duckdb_join_many_sources()))
+    except Exception as e:
+        print(f"❌ DuckDB Many Sources failed: {e}")
+        results.append(("DuckDB Many Sources", False))
+    
     print("\n" + "="*60)
     print("TEST RESULTS SUMMARY")
     print("="*60)
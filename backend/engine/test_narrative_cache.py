@@ -0,0 +1,93 @@
+"""
+Tests for the LLM narrative cache.
+
+This script tests:
+1. Cache keys covering provider, model and prompt
+2. Returned narratives not sharing state with the cache
+3. Reloading narratives from the disk cache, ignoring corrupt entries
+4. LRU eviction at NARRATIVE_CACHE_SIZE
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+
+from engine import narrative
+from engine.narrative import NarrativeSection
+
+
+@pytest.fixture
+def empty_cache(monkeypatch):
+    """Give each test its own empty, memory-only narrative cache."""
+    monkeypatch.setattr(narrative, "_narrative_cache", OrderedDict())
+    monkeypatch.setattr(narrative, "_narrative_cache_dir", None)
+
+
+def _narrative(title: str = "Weekly Report") -> NarrativeSection:
+    """Build a small narrative."""
+    return NarrativeSection(
+        title=title,
+        headline="Clicks rose",
+        bullets=["Clicks up 12%", "Spend flat"],
+        recommendation="Keep budgets steady."
+    )
+
+
+def test_cache_key_covers_provider_model_and_prompt():
+    """Changing any input to the LLM call changes the key."""
+    key = narrative._narrative_cache_key("prompt", "gemini", "gemini-2.0-flash")
+    assert key == narrative._narrative_cache_key("prompt", "gemini", "gemini-2.0-flash")
+    assert key != narrative._narrative_cache_key("prompt 2", "gemini", "gemini-2.0-flash")
+    assert key != narrative._narrative_cache_key("prompt", "openai", "gemini-2.0-flash")
+    assert key != narrative._narrative_cache_key("prompt", "gemini", "gemini-2.5-pro")
+
+
+def test_cached_narrative_is_a_fresh_copy(empty_cache):
+    """Edits to stored or returned narratives never reach the cache."""
+    stored = _narrative()
+    narrative._store_cached_narrative("key", stored)
+    stored.bullets.append("Added after storing")
+    
+    first = narrative._get_cached_narrative("key")
+    assert first == _narrative()
+    first.bullets.append("Added after loading")
+    
+    assert narrative._get_cached_narrative("key") == _narrative()
+    assert narrative._get_cached_narrative("missing") is None
+
+
+def test_disk_cache_reload(empty_cache, monkeypatch):
+    """Narratives survive a cleared memory cache; corrupt files are misses."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        narrative.set_narrative_cache_dir(Path(tmp_dir))
+        narrative._store_cached_narrative("key", _narrative())
+        assert [p.name for p in Path(tmp_dir).iterdir()] == ["key.json"]
+        
+        monkeypatch.setattr(narrative, "_narrative_cache", OrderedDict())
+        assert narrative._get_cached_narrative("key") == _narrative()
+        assert "key" in narrative._narrative_cache
+        
+        (Path(tmp_dir) / "corrupt.json").write_bytes(b'{"title": ')
+        (Path(tmp_dir) / "incomplete.json").write_bytes(b'{"title": "Only a title"}')
+        assert narrative._get_cached_narrative("corrupt") is None
+        assert narrative._get_cached_narrative("incomplete") is None
+
+
+def test_memory_cache_eviction(empty_cache, monkeypatch):
+    """Only the NARRATIVE_CACHE_SIZE most recently used narratives stay in memory."""
+    monkeypatch.setattr(narrative, "NARRATIVE_CACHE_SIZE", 2)
+    narrative._store_cached_narrative("a", _narrative("A"))
+    narrative._store_cached_narrative("b", _narrative("B"))
+    
+    # Reading "a" makes "b" the least recently used
+    assert narrative._get_cached_narrative("a").title == "A"
+    narrative._store_cached_narrative("c", _narrative("C"))
+    
+    assert list(narrative._narrative_cache) == ["a", "c"]
+    assert narrative._get_cached_narrative("b") is None
@@ -0,0 +1,124 @@
+"""
+Tests for the dashboard session manager.
+
+This script tests:
+1. Reloading a cached session after its file changes on disk
+2. LRU eviction at SESSION_CACHE_SIZE
+3. Concurrent update_session and get_session calls
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tempfile
+import threading
+from pathlib import Path
+
+import orjson
+
+from engine import session_manager
+from engine.session_manager import SessionManager
+
+
+def _create_session(manager: SessionManager, title: str = "Test Report", insight_count: int = 1):
+    """Create a session with insight_count insights in the given manager."""
+    return manager.create_session(
+        title=title,
+        insights=[{"metric": "clicks", "segment": f"s{i}", "change_pct": 12.5} for i in range(insight_count)],
+        metrics_summary={"clicks": 100},
+        narrative={"title": title, "summary": "Summary"}
+    )
+
+
+def test_stale_mtime_reload():
+    """A session rewritten on disk is reloaded instead of served from cache."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        manager = SessionManager(tmp_dir)
+        session = _create_session(manager)
+        assert manager.get_session(session.session_id, session.token) is session
+        
+        # Rewrite the file behind the manager's back with a newer mtime
+        session_file = Path(tmp_dir) / f"{session.session_id}.json"
+        data = orjson.loads(session_file.read_bytes())
+        data["title"] = "Edited Report"
+        session_file.write_bytes(orjson.dumps(data))
+        stat = session_file.stat()
+        os.utime(session_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        reloaded = manager.get_session(session.session_id, session.token)
+        assert reloaded is not session
+        assert reloaded.title == "Edited Report"
+        # The reloaded copy is cached again
+        assert manager.get_session(session.session_id, session.token) is reloaded
+
+
+def test_cache_eviction_at_size_limit():
+    """Only the SESSION_CACHE_SIZE most recently used sessions stay cached."""
+    original_size = session_manager.SESSION_CACHE_SIZE
+    session_manager.SESSION_CACHE_SIZE = 3
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            manager = SessionManager(tmp_dir)
+            sessions = [_create_session(manager, f"Report {i}") for i in range(5)]
+            
+            assert list(manager._cache) == [s.session_id for s in sessions[2:]]
+            
+            # Evicted sessions still load from disk and become most recent
+            evicted = sessions[0]
+            loaded = manager.get_session(evicted.session_id, evicted.token)
+            assert loaded is not None
+            assert loaded.title == "Report 0"
+            assert len(manager._cache) == 3
+            assert next(reversed(manager._cache)) == evicted.session_id
+            assert sessions[2].session_id not in manager._cache
+    finally:
+        session_manager.SESSION_CACHE_SIZE = original_size
+
+
+def test_concurrent_update_session():
+    """Concurrent updates and reads never see a missing or partial session."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        manager = SessionManager(tmp_dir)
+        # Large enough that a non-atomic write is visible to readers
+        session = _create_session(manager, insight_count=5000)
+        errors = []
+        misses = []
+        
+        def update(worker: int) -> None:
+            try:
+                for i in range(20):
+                    session.audio_url = f"/audio/{worker}_{i}.mp3"
+                    assert manager.update_session(session)
+            except Exception as e:
+                errors.append(e)
+        
+        def read() -> None:
+            try:
+                for _ in range(40):
+                    if manager.get_session(session.session_id, session.token) is None:
+                        misses.append(session.session_id)
+            except Exception as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=update, args=(i,)) for i in range(2)]
+        threads += [threading.Thread(target=read) for _ in range(2)]
+        # Switch threads as often as possible to surface races
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(switch_interval)
+        
+        assert not errors
+        assert not misses
+        
+        # The file on disk is complete JSON and no temporary files are left
+        session_file = Path(tmp_dir) / f"{session.session_id}.json"
+        data = orjson.loads(session_file.read_bytes())
+        assert data["session_id"] == session.session_id
+        assert sorted(p.name for p in Path(tmp_dir).iterdir()) == [session_file.name]
@@ -0,0 +1,130 @@
+"""
+Tests for the voice briefing audio cache.
+
+This script tests:
+1. Reusing audio on disk for an identical briefing text
+2. Sharing one Murf generation between concurrent identical briefings
+3. Concurrent downloads of the same file not interleaving
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tempfile
+import threading
+from pathlib import Path
+
+from engine import voice_briefing
+
+
+NARRATIVE = {
+    "title": "Campaign Analysis",
+    "summary": "Performance was stable.",
+    "highlights": ["Clicks increased"],
+    "recommendation": "Keep budgets steady."
+}
+INSIGHTS = [{"metric": "clicks", "dimension": "campaign", "segment": "Brand", "change_pct": 12.5, "direction": "up"}]
+
+
+class _FakeResponse:
+    """Streamed response yielding the given chunks, pausing at a barrier after the first."""
+    
+    def __init__(self, chunks, barrier=None):
+        self.chunks = chunks
+        self.barrier = barrier
+    
+    def iter_content(self, chunk_size):
+        for i, chunk in enumerate(self.chunks):
+            yield chunk
+            if i == 0 and self.barrier is not None:
+                self.barrier.wait(5)
+
+
+def test_identical_briefing_reuses_cached_audio(monkeypatch):
+    """A second identical briefing returns the same audio without calling Murf."""
+    calls = []
+    
+    def fake_murf(text, api_key, output_path):
+        calls.append(output_path)
+        Path(output_path).write_bytes(b"mp3")
+        return True, output_path
+    
+    monkeypatch.setattr(voice_briefing, "generate_audio_murf", fake_murf)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        first = voice_briefing.generate_voice_briefing(NARRATIVE, INSIGHTS, tmp_dir, "a", murf_api_key="key")
+        second = voice_briefing.generate_voice_briefing(NARRATIVE, INSIGHTS, tmp_dir, "b", murf_api_key="key")
+        
+        assert first["audio_url"] == second["audio_url"]
+        assert second["audio_type"] == "murf"
+        assert len(calls) == 1
+        
+        # A different briefing text gets its own file
+        other = voice_briefing.generate_voice_briefing(
+            {**NARRATIVE, "title": "Other"}, INSIGHTS, tmp_dir, "c", murf_api_key="key"
+        )
+        assert other["audio_url"] != first["audio_url"]
+        assert len(calls) == 2
+
+
+def test_concurrent_identical_briefings_share_one_generation(monkeypatch):
+    """Identical briefings queued together make one Murf call and all get the URL."""
+    calls = []
+    release = threading.Event()
+    
+    def fake_murf(text, api_key, output_path):
+        calls.append(output_path)
+        release.wait(5)
+        Path(output_path).write_bytes(b"mp3")
+        return True, output_path
+    
+    monkeypatch.setattr(voice_briefing, "generate_audio_murf", fake_murf)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        ready = []
+        all_ready = threading.Event()
+        
+        def on_audio_ready(audio_url):
+            ready.append(audio_url)
+            if len(ready) == 3:
+                all_ready.set()
+        
+        results = [
+            voice_briefing.generate_voice_briefing(
+                NARRATIVE, INSIGHTS, tmp_dir, f"s{i}", murf_api_key="key", on_audio_ready=on_audio_ready
+            )
+            for i in range(3)
+        ]
+        release.set()
+        
+        assert all_ready.wait(5)
+        assert all(result["audio_pending"] for result in results)
+        assert len(calls) == 1
+        assert len(set(ready)) == 1
+        assert not voice_briefing._pending_audio
+
+
+def test_concurrent_downloads_do_not_interleave():
+    """Two downloads of the same file each write a complete body."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_path = str(Path(tmp_dir) / "briefing.mp3")
+        bodies = [[b"a" * 1024] * 64, [b"b" * 1024] * 64]
+        errors = []
+        # Both downloads are mid-write before either finishes
+        barrier = threading.Barrier(2)
+        
+        def download(chunks):
+            try:
+                voice_briefing._stream_to_file(_FakeResponse(chunks, barrier), output_path)
+            except Exception as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=download, args=(chunks,)) for chunks in bodies]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert not errors
+        data = Path(output_path).read_bytes()
+        assert data in (b"a" * 64 * 1024, b"b" * 64 * 1024)
+        assert [p.name for p in Path(tmp_dir).iterdir()] == ["briefing.mp3"]
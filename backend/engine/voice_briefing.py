@@ -7,20 +7,58 @@ browser-based TTS if API is unavailable.
 """
 
 import os
-import json
 import hashlib
+import tempfile
+import threading
 import requests
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from requests.adapters import HTTPAdapter
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import Callable, Dict, Any, Optional, Tuple
 from datetime import datetime
 
 from core.logger import get_logger
 
-logger = get_logger("voice_briefing")
+logger = get_logger("insight_engine.voice_briefing")
 
 # Murf AI API configuration
 MURF_API_URL = "https://api.murf.ai/v1/speech/generate"
 
+# Chunk size used when streaming generated audio to disk
+AUDIO_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Connection pool sizing for the shared HTTP session (hosts, connections per host)
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 8
+
+# Shared HTTP session so Murf calls and audio downloads reuse
+# keep-alive connections instead of a new TLS handshake each time
+_http_session: Optional[requests.Session] = None
+_http_session_lock = threading.Lock()
+
+# Background workers for Murf requests, so callers get the browser TTS
+# script right away instead of waiting on synthesis and download
+AUDIO_WORKERS = 4
+_AUDIO_POOL = ThreadPoolExecutor(max_workers=AUDIO_WORKERS, thread_name_prefix="murf-audio")
+
+# In-flight Murf generations by output path, so identical briefings
+# requested together share one API call and one download
+_pending_audio: Dict[str, "Future[Tuple[bool, str]]"] = {}
+_pending_audio_lock = threading.Lock()
+
+# Fixed opening and closing lines of the spoken briefing
+BRIEFING_OPENING_TEMPLATE = "Welcome to your {} briefing."
+BRIEFING_CLOSING = "End of briefing. Scan the QR code for full details."
+INSIGHT_CHANGE_TEMPLATE = "{} {} by {:.1f} percent."
+
+
+def _describe_insight_change(insight: Dict[str, Any]) -> str:
+    """Phrase an insight's change as a spoken sentence."""
+    change = insight.get("change", 0)
+    direction = "increased" if change > 0 else "decreased"
+    return INSIGHT_CHANGE_TEMPLATE.format(insight.get("metric", "Unknown"), direction, abs(change))
+
 
 def generate_briefing_text(
     narrative: Dict[str, Any],
@@ -39,40 +77,37 @@ def generate_briefing_text(
         Text suitable for text-to-speech conversion
     """
     parts = []
+    append = parts.append
     
     # Title
     title = narrative.get("title", "Insight Report")
-    parts.append(f"Welcome to your {title} briefing.")
+    append(BRIEFING_OPENING_TEMPLATE.format(title))
     
     # Summary
     summary = narrative.get("summary", "")
     if summary:
-        parts.append(summary)
+        append(summary)
     
     # Key findings
     highlights = narrative.get("highlights", [])
     if highlights:
-        parts.append("Here are the key findings:")
+        append("Here are the key findings:")
         for i, highlight in enumerate(highlights[:3], 1):
-            parts.append(f"Finding {i}: {highlight}")
+            append(f"Finding {i}: {highlight}")
     
     # Top insights
     if insights:
-        parts.append("Notable changes include:")
+        append("Notable changes include:")
         for insight in insights[:3]:
-            metric = insight.get("metric", "Unknown")
-            change = insight.get("change", 0)
-            direction = "increased" if change > 0 else "decreased"
-            abs_change = abs(change)
-            parts.append(f"{metric} {direction} by {abs_change:.1f} percent.")
+            append(_describe_insight_change(insight))
     
     # Recommendation
     recommendation = narrative.get("recommendation", "")
     if recommendation:
-        parts.append(f"Recommendation: {recommendation}")
+        append(f"Recommendation: {recommendation}")
     
     # Closing
-    parts.append("End of briefing. Scan the QR code for full details.")
+    append(BRIEFING_CLOSING)
     
     # Join and truncate
     text = " ".join(parts)
@@ -82,6 +117,49 @@ def generate_briefing_text(
     return text
 
 
+def _get_http_session() -> requests.Session:
+    """Return the shared HTTP session, creating it on first use."""
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=HTTP_POOL_CONNECTIONS,
+                    pool_maxsize=HTTP_POOL_MAXSIZE
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _http_session = session
+    return _http_session
+
+
+def _stream_to_file(response: requests.Response, output_path: str) -> None:
+    """
+    Write a streamed response body to disk chunk by chunk.
+    
+    The body goes to a uniquely named temporary file that replaces
+    output_path only once the download completes, so a dropped connection
+    never leaves a truncated audio file behind and concurrent downloads of
+    the same file can't interleave.
+    
+    Args:
+        response: Response opened with stream=True
+        output_path: Path to save the body to
+    """
+    output_file = Path(output_path)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    fd, partial_name = tempfile.mkstemp(dir=output_file.parent, prefix=output_file.name, suffix=".part")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=AUDIO_DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+        os.replace(partial_name, output_file)
+    except BaseException:
+        Path(partial_name).unlink(missing_ok=True)
+        raise
+
+
 def generate_audio_murf(
     text: str,
     api_key: str,
@@ -130,8 +208,9 @@ def generate_audio_murf(
         "modelVersion": "GEN2"
     }
     
+    http = _get_http_session()
     try:
-        response = requests.post(
+        response = http.post(
             MURF_API_URL,
             headers=headers,
             json=payload,
@@ -144,15 +223,12 @@ def generate_audio_murf(
             
             if audio_url:
                 # Download the audio file
-                audio_response = requests.get(audio_url, timeout=30)
-                if audio_response.status_code == 200:
-                    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-                    with open(output_path, 'wb') as f:
-                        f.write(audio_response.content)
-                    logger.info(f"Audio saved to: {output_path}")
-                    return True, output_path
-                else:
-                    return False, f"Failed to download audio: {audio_response.status_code}"
+                with http.get(audio_url, timeout=30, stream=True) as audio_response:
+                    if audio_response.status_code != 200:
+                        return False, f"Failed to download audio: {audio_response.status_code}"
+                    _stream_to_file(audio_response, output_path)
+                logger.info(f"Audio saved to: {output_path}")
+                return True, output_path
             else:
                 return False, "No audio URL in response"
         else:
@@ -170,7 +246,8 @@ def generate_audio_murf(
 
 def generate_briefing_script(
     narrative: Dict[str, Any],
-    insights: list
+    insights: list,
+    full_text: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Generate a structured briefing script for browser-based TTS.
@@ -181,6 +258,8 @@ def generate_briefing_script(
     Args:
         narrative: Narrative dictionary
         insights: List of insights
+        full_text: Briefing text from generate_briefing_text, if the
+            caller already has it; built here otherwise
         
     Returns:
         Structured script with segments and timings
@@ -191,7 +270,7 @@ def generate_briefing_script(
     title = narrative.get("title", "Insight Report")
     segments.append({
         "type": "opening",
-        "text": f"Welcome to your {title} briefing.",
+        "text": BRIEFING_OPENING_TEMPLATE.format(title),
         "pause_after": 500
     })
     
@@ -227,13 +306,9 @@ def generate_briefing_script(
             "pause_after": 400
         })
         for insight in insights[:3]:
-            metric = insight.get("metric", "Unknown")
-            change = insight.get("change", 0)
-            direction = "increased" if change > 0 else "decreased"
-            abs_change = abs(change)
             segments.append({
                 "type": "insight",
-                "text": f"{metric} {direction} by {abs_change:.1f} percent.",
+                "text": _describe_insight_change(insight),
                 "pause_after": 500
             })
     
@@ -253,31 +328,100 @@ def generate_briefing_script(
         "pause_after": 0
     })
     
+    if full_text is None:
+        full_text = generate_briefing_text(narrative, insights)
+    
     return {
         "segments": segments,
         "total_segments": len(segments),
-        "full_text": generate_briefing_text(narrative, insights)
+        "full_text": full_text
     }
 
 
+def _briefing_text_hash(text: str) -> str:
+    """Return the content hash used to name a briefing's audio file."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _forget_pending_audio(output_path: str, future: "Future[Tuple[bool, str]]") -> None:
+    """Drop a finished generation from the in-flight map."""
+    with _pending_audio_lock:
+        if _pending_audio.get(output_path) is future:
+            del _pending_audio[output_path]
+
+
+def _murf_audio_future(text: str, api_key: str, output_path: str) -> "Future[Tuple[bool, str]]":
+    """
+    Start Murf generation for output_path, or join one already in flight.
+    
+    Args:
+        text: Text to convert to speech
+        api_key: Murf AI API key
+        output_path: Path to save the audio file
+        
+    Returns:
+        Future resolving to generate_audio_murf's (success, message)
+    """
+    with _pending_audio_lock:
+        future = _pending_audio.get(output_path)
+        if future is not None:
+            return future
+        future = _AUDIO_POOL.submit(
+            generate_audio_murf,
+            text=text,
+            api_key=api_key,
+            output_path=output_path
+        )
+        _pending_audio[output_path] = future
+    # Registered outside the lock: it runs immediately if already done
+    future.add_done_callback(partial(_forget_pending_audio, output_path))
+    return future
+
+
+def _deliver_audio(
+    audio_url: str,
+    on_audio_ready: Callable[[str], None],
+    future: "Future[Tuple[bool, str]]"
+) -> None:
+    """Hand the audio URL to on_audio_ready once background generation succeeds."""
+    try:
+        success, message = future.result()
+    except Exception as e:
+        success, message = False, str(e)
+    if not success:
+        logger.warning(f"Background Murf AI generation failed: {message}")
+        return
+    
+    logger.info(f"Murf AI audio ready: {audio_url}")
+    try:
+        on_audio_ready(audio_url)
+    except Exception as e:
+        logger.error(f"Audio ready callback failed: {e}")
+
+
 def generate_voice_briefing(
     narrative: Dict[str, Any],
     insights: list,
     output_dir: str,
     session_id: str,
-    murf_api_key: Optional[str] = None
+    murf_api_key: Optional[str] = None,
+    on_audio_ready: Optional[Callable[[str], None]] = None
 ) -> Dict[str, Any]:
     """
     Generate a voice briefing for the dashboard.
     
     Attempts to use Murf AI first, falls back to browser TTS script.
+    When on_audio_ready is given, Murf runs on a background worker: the
+    TTS script is returned immediately with audio_pending set, and the
+    callback receives the audio URL once the MP3 is saved.
     
     Args:
         narrative: Narrative dictionary
         insights: List of insights
         output_dir: Directory to save audio files
-        session_id: Session identifier for filename
+        session_id: Session identifier the briefing belongs to
         murf_api_key: Optional Murf AI API key
+        on_audio_ready: Optional callback taking the audio URL
         
     Returns:
         Dictionary with audio_url or tts_script for playback
@@ -295,17 +439,36 @@ def generate_voice_briefing(
     
     # Try Murf AI if API key is available
     if murf_api_key:
-        output_path = str(Path(output_dir) / f"briefing_{session_id}.mp3")
-        success, message = generate_audio_murf(
-            text=text,
-            api_key=murf_api_key,
-            output_path=output_path
-        )
+        # Audio is named after the briefing text, so an identical briefing
+        # reuses the MP3 already on disk instead of calling Murf again
+        audio_name = f"briefing_{_briefing_text_hash(text)}.mp3"
+        output_path = str(Path(output_dir) / audio_name)
+        audio_url = f"/audio/{audio_name}"
+        
+        if os.path.isfile(output_path):
+            result["audio_type"] = "murf"
+            result["audio_path"] = output_path
+            result["audio_url"] = audio_url
+            logger.info(f"Reusing cached Murf AI audio: {audio_name}")
+            return result
+        
+        future = _murf_audio_future(text, murf_api_key, output_path)
+        
+        if on_audio_ready is not None:
+            future.add_done_callback(partial(_deliver_audio, audio_url, on_audio_ready))
+            result["audio_type"] = "browser_tts"
+            result["tts_script"] = generate_briefing_script(narrative, insights, full_text=text)
+            result["audio_url"] = None
+            result["audio_pending"] = True
+            logger.info("Murf AI audio queued, returning browser TTS script meanwhile")
+            return result
+        
+        success, message = future.result()
         
         if success:
             result["audio_type"] = "murf"
             result["audio_path"] = output_path
-            result["audio_url"] = f"/static/audio/briefing_{session_id}.mp3"
+            result["audio_url"] = audio_url
             logger.info("Murf AI audio generated successfully")
             return result
         else:
@@ -313,7 +476,7 @@ def generate_voice_briefing(
     
     # Fallback to browser TTS script
     result["audio_type"] = "browser_tts"
-    result["tts_script"] = generate_briefing_script(narrative, insights)
+    result["tts_script"] = generate_briefing_script(narrative, insights, full_text=text)
     result["audio_url"] = None
     logger.info("Generated browser TTS script")
     